@@ -4,13 +4,21 @@ Command line tool to validate Office document XML files against XSD schemas and
 
 Usage:
     python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> --fail-fast
+    python validate.py <dir> --original <original_file> --time-budget 5
 """
 
 import argparse
 import sys
+import time
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
 
 
 def main():
@@ -30,6 +38,17 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first failing validation pass",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="Run the cheapest, highest-signal passes first and stop when the budget runs out",
+    )
     args = parser.parse_args()
 
     # Validate paths
@@ -54,12 +73,46 @@ def main():
 
     # Run validators
     success = True
-    for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
+    incomplete = False
+    deadline = (
+        time.monotonic() + args.time_budget if args.time_budget is not None else None
+    )
+    for index, V in enumerate(validators):
+        not_run = ", ".join(v.__name__ for v in validators[index + 1 :])
+        if deadline is not None and time.monotonic() >= deadline:
+            not_run = ", ".join(v.__name__ for v in validators[index:])
+            print(f"SKIPPED (time budget exhausted) - validators not run: {not_run}")
+            incomplete = True
+            break
+
+        if issubclass(V, BaseSchemaValidator):
+            validator = V(
+                unpacked_dir,
+                original_file,
+                verbose=args.verbose,
+                fail_fast=args.fail_fast,
+                time_budget=(
+                    deadline - time.monotonic() if deadline is not None else None
+                ),
+            )
+        else:
+            validator = V(unpacked_dir, original_file, verbose=args.verbose)
+
         if not validator.validate():
             success = False
+            if args.fail_fast:
+                if not_run:
+                    print(f"SKIPPED (fail-fast) - validators not run: {not_run}")
+                break
+
+        if getattr(validator, "skipped_passes", None) or getattr(
+            validator, "skipped_parts", None
+        ):
+            incomplete = True
 
-    if success:
+    if success and incomplete:
+        print("No failures found, but validation was incomplete (see SKIPPED above)")
+    elif success:
         print("All validations PASSED!")
 
     sys.exit(0 if success else 1)
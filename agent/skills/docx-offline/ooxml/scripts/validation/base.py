@@ -3,6 +3,7 @@ Base validator with common validation logic for document files.
 """
 
 import re
+import time
 from pathlib import Path
 
 import lxml.etree
@@ -66,6 +67,29 @@ class BaseSchemaValidator:
         "drawing": "ISO-IEC29500-4_2016/dml-main.xsd",
     }
 
+    # Estimated cost-to-signal ratio of each validation pass (lower runs first
+    # when a time budget is set). Cheap structural checks that catch the most
+    # common corruption go ahead of the per-part XSD pass.
+    PASS_COST_TO_SIGNAL = {
+        "validate_namespaces": 1,
+        "validate_content_types": 1,
+        "validate_unique_ids": 2,
+        "validate_file_references": 2,
+        "validate_all_relationship_ids": 2,
+        "validate_slide_layout_ids": 2,
+        "validate_notes_slide_references": 2,
+        "validate_no_duplicate_slide_layouts": 2,
+        "validate_deletions": 3,
+        "validate_insertions": 3,
+        "validate_whitespace_preservation": 3,
+        "validate_uuid_ids": 3,
+        "validate_against_xsd": 50,
+    }
+
+    # Ordered validation passes run after the well-formedness check
+    # Subclasses should override this with format-specific passes
+    VALIDATION_PASSES = []
+
     # Unified namespace constants
     MC_NAMESPACE = "http://schemas.openxmlformats.org/markup-compatibility/2006"
     XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
@@ -103,10 +127,34 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        fail_fast=False,
+        time_budget=None,
+    ):
+        """
+        Args:
+            unpacked_dir: Path to unpacked Office document directory
+            original_file: Path to original file (.docx/.pptx/.xlsx)
+            verbose: Enable verbose output
+            fail_fast: Stop at the first failing validation pass
+            time_budget: Optional budget in seconds; passes are ordered by
+                cost-to-signal ratio and the remaining ones are skipped once
+                the budget runs out
+        """
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
+        self.fail_fast = fail_fast
+        self.time_budget = time_budget
+        self.deadline = None
+
+        # Passes and XSD parts not run because of fail_fast or time_budget
+        self.skipped_passes = []
+        self.skipped_parts = []
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
@@ -124,6 +172,54 @@ class BaseSchemaValidator:
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def run_passes(self, passes=None):
+        """Run validation passes, honoring fail_fast and time_budget.
+
+        Without a time budget, passes run in the given order. With one, they
+        are ordered by PASS_COST_TO_SIGNAL and the remaining passes are
+        skipped once the budget is spent. Skipped passes are recorded in
+        skipped_passes and reported.
+
+        Args:
+            passes: List of validation method names (default: VALIDATION_PASSES)
+
+        Returns:
+            bool: True if every pass that ran succeeded
+        """
+        passes = list(self.VALIDATION_PASSES if passes is None else passes)
+        if self.time_budget is not None:
+            passes.sort(key=lambda name: self.PASS_COST_TO_SIGNAL.get(name, 10))
+            if self.deadline is None:
+                self.deadline = time.monotonic() + self.time_budget
+
+        all_valid = True
+        for index, name in enumerate(passes):
+            if self.budget_exhausted():
+                self.skipped_passes.extend(passes[index:])
+                self._report_skipped("time budget exhausted")
+                break
+
+            if not getattr(self, name)():
+                all_valid = False
+                if self.fail_fast:
+                    self.skipped_passes.extend(passes[index + 1 :])
+                    self._report_skipped("fail-fast")
+                    break
+
+        return all_valid
+
+    def budget_exhausted(self):
+        """Return True if a time budget is set and has run out."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def _report_skipped(self, reason):
+        """Print the passes and XSD parts that were not run."""
+        if self.skipped_passes:
+            print(
+                f"SKIPPED ({reason}) - {len(self.skipped_passes)} pass(es) not run: "
+                + ", ".join(self.skipped_passes)
+            )
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
@@ -692,7 +788,14 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        for index, xml_file in enumerate(self.xml_files):
+            if self.budget_exhausted() or (self.fail_fast and new_errors):
+                self.skipped_parts = [
+                    str(f.relative_to(self.unpacked_dir))
+                    for f in self.xml_files[index:]
+                ]
+                break
+
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
             is_valid, new_file_errors = self.validate_file_against_xsd(
                 xml_file, verbose=False
@@ -728,6 +831,16 @@ class BaseSchemaValidator:
                 f"  - With NEW errors: {len(new_errors) > 0 and len([e for e in new_errors if not e.startswith('    ')]) or 0}"
             )
 
+        if self.skipped_parts:
+            reason = (
+                "fail-fast" if self.fail_fast and new_errors else "time budget exhausted"
+            )
+            print(
+                f"SKIPPED ({reason}) - XSD validation not run for "
+                f"{len(self.skipped_parts)} part(s): {', '.join(self.skipped_parts[:5])}"
+                f"{'...' if len(self.skipped_parts) > 5 else ''}"
+            )
+
         if new_errors:
             print("\nFAILED - Found NEW validation errors:")
             for error in new_errors:
@@ -3,12 +3,11 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
-import zipfile
 
 import lxml.etree
 
 from .base import BaseSchemaValidator
+from .stats import DocumentStats
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
@@ -21,51 +20,36 @@ class DOCXSchemaValidator(BaseSchemaValidator):
     # Start with empty mapping - add specific cases as we discover them
     ELEMENT_RELATIONSHIP_TYPES = {}
 
+    # Validation passes in default order: cheap structural checks first,
+    # XSD schema validation last
+    VALIDATION_PASSES = [
+        "validate_namespaces",  # Test 1: Namespace declarations
+        "validate_unique_ids",  # Test 2: Unique IDs
+        "validate_file_references",  # Test 3: Relationship and file references
+        "validate_content_types",  # Test 4: Content type declarations
+        "validate_whitespace_preservation",  # Test 5: Whitespace preservation
+        "validate_deletions",  # Test 6: Deletion validation
+        "validate_insertions",  # Test 7: Insertion validation
+        "validate_all_relationship_ids",  # Test 8: Relationship ID references
+        "validate_against_xsd",  # Test 9: XSD schema validation
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # document.xml trees shared by the read-only passes and statistics
+        self._document_roots = {}
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         # Test 0: XML well-formedness
         if not self.validate_xml():
             return False
 
-        # Test 1: Namespace declarations
-        all_valid = True
-        if not self.validate_namespaces():
-            all_valid = False
-
-        # Test 2: Unique IDs
-        if not self.validate_unique_ids():
-            all_valid = False
-
-        # Test 3: Relationship and file reference validation
-        if not self.validate_file_references():
-            all_valid = False
-
-        # Test 4: Content type declarations
-        if not self.validate_content_types():
-            all_valid = False
-
-        # Test 5: XSD schema validation
-        if not self.validate_against_xsd():
-            all_valid = False
-
-        # Test 6: Whitespace preservation
-        if not self.validate_whitespace_preservation():
-            all_valid = False
-
-        # Test 7: Deletion validation
-        if not self.validate_deletions():
-            all_valid = False
+        all_valid = self.run_passes()
 
-        # Test 8: Insertion validation
-        if not self.validate_insertions():
-            all_valid = False
-
-        # Test 9: Relationship ID reference validation
-        if not self.validate_all_relationship_ids():
-            all_valid = False
-
-        # Count and compare paragraphs
-        self.compare_paragraph_counts()
+        # Summarize changes against the original (skipped when validation was cut short)
+        if not self.skipped_passes and not self.skipped_parts:
+            self.compare_paragraph_counts()
 
         return all_valid
 
@@ -81,7 +65,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_document_xml(xml_file)
 
                 # Find all w:t elements
                 for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
@@ -134,7 +118,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_document_xml(xml_file)
 
                 # Find all w:t elements that are descendants of w:del elements
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
@@ -170,48 +154,38 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - No w:t elements found within w:del elements")
             return True
 
-    def count_paragraphs_in_unpacked(self):
-        """Count the number of paragraphs in the unpacked document."""
-        count = 0
+    def _parse_document_xml(self, xml_file):
+        """Parse a document.xml once and share the tree across read-only passes."""
+        if xml_file not in self._document_roots:
+            self._document_roots[xml_file] = lxml.etree.parse(str(xml_file)).getroot()
+        return self._document_roots[xml_file]
 
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
+    def get_unpacked_stats(self):
+        """Collect DocumentStats for the unpacked document from the shared parse."""
+        document_root = self._parse_document_xml(
+            self.unpacked_dir / "word" / "document.xml"
+        )
+        return DocumentStats.from_unpacked(self.unpacked_dir, document_root)
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
-            except Exception as e:
-                print(f"Error counting paragraphs in unpacked document: {e}")
+    def get_original_stats(self):
+        """Collect DocumentStats for the original docx without extracting it."""
+        return DocumentStats.from_docx(self.original_file)
 
-        return count
+    def count_paragraphs_in_unpacked(self):
+        """Count the number of paragraphs in the unpacked document."""
+        try:
+            return self.get_unpacked_stats().paragraphs
+        except Exception as e:
+            print(f"Error counting paragraphs in unpacked document: {e}")
+            return 0
 
     def count_paragraphs_in_original(self):
         """Count the number of paragraphs in the original docx file."""
-        count = 0
-
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
-
+            return self.get_original_stats().paragraphs
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
-
-        return count
+            return 0
 
     def validate_insertions(self):
         """
@@ -225,7 +199,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_document_xml(xml_file)
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
 
                 # Find w:delText in w:ins that are NOT within w:del
@@ -261,13 +235,17 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             return True
 
     def compare_paragraph_counts(self):
-        """Compare paragraph counts between original and new document."""
-        original_count = self.count_paragraphs_in_original()
-        new_count = self.count_paragraphs_in_unpacked()
+        """Compare paragraph counts and change statistics between original and new document."""
+        try:
+            original_stats = self.get_original_stats()
+            new_stats = self.get_unpacked_stats()
+        except Exception as e:
+            print(f"Error collecting document statistics: {e}")
+            return
 
-        diff = new_count - original_count
-        diff_str = f"+{diff}" if diff > 0 else str(diff)
-        print(f"\nParagraphs: {original_count} → {new_count} ({diff_str})")
+        print()
+        for line in original_stats.summarize_changes(new_stats):
+            print(line)
 
 
 if __name__ == "__main__":
@@ -25,54 +25,28 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         "tablestyleid": "tablestyles",
     }
 
+    # Validation passes in default order: cheap structural checks first,
+    # XSD schema validation last
+    VALIDATION_PASSES = [
+        "validate_namespaces",  # Test 1: Namespace declarations
+        "validate_unique_ids",  # Test 2: Unique IDs
+        "validate_uuid_ids",  # Test 3: UUID ID validation
+        "validate_file_references",  # Test 4: Relationship and file references
+        "validate_slide_layout_ids",  # Test 5: Slide layout ID validation
+        "validate_content_types",  # Test 6: Content type declarations
+        "validate_notes_slide_references",  # Test 7: Notes slide references
+        "validate_all_relationship_ids",  # Test 8: Relationship ID references
+        "validate_no_duplicate_slide_layouts",  # Test 9: Duplicate slide layouts
+        "validate_against_xsd",  # Test 10: XSD schema validation
+    ]
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         # Test 0: XML well-formedness
         if not self.validate_xml():
             return False
 
-        # Test 1: Namespace declarations
-        all_valid = True
-        if not self.validate_namespaces():
-            all_valid = False
-
-        # Test 2: Unique IDs
-        if not self.validate_unique_ids():
-            all_valid = False
-
-        # Test 3: UUID ID validation
-        if not self.validate_uuid_ids():
-            all_valid = False
-
-        # Test 4: Relationship and file reference validation
-        if not self.validate_file_references():
-            all_valid = False
-
-        # Test 5: Slide layout ID validation
-        if not self.validate_slide_layout_ids():
-            all_valid = False
-
-        # Test 6: Content type declarations
-        if not self.validate_content_types():
-            all_valid = False
-
-        # Test 7: XSD schema validation
-        if not self.validate_against_xsd():
-            all_valid = False
-
-        # Test 8: Notes slide reference validation
-        if not self.validate_notes_slide_references():
-            all_valid = False
-
-        # Test 9: Relationship ID reference validation
-        if not self.validate_all_relationship_ids():
-            all_valid = False
-
-        # Test 10: Duplicate slide layout references validation
-        if not self.validate_no_duplicate_slide_layouts():
-            all_valid = False
-
-        return all_valid
+        return self.run_passes()
 
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
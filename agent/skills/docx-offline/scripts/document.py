@@ -8,6 +8,7 @@ Usage:
     # Initialize
     doc = Document('workspace/unpacked')
     doc = Document('workspace/unpacked', author="John Doe", initials="JD")
+    doc = Document('workspace/unpacked', backend="lxml")  # lxml-backed editors
 
     # Find nodes
     node = doc["word/document.xml"].get_node(tag="w:del", attrs={"w:id": "1"})
@@ -22,6 +23,11 @@ Usage:
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
     doc["word/document.xml"].revert_deletion(del_node)  # Reject deletion
 
+    # Bulk tracked changes (single pass, batched change IDs)
+    doc["word/document.xml"].accept_changes(author="Jane Doe")
+    doc["word/document.xml"].reject_changes(within=para_nodes)
+    doc["word/document.xml"].suggest_insertions(doc["word/document.xml"].get_section_nodes(1))
+
     # Save
     doc.save()
 """
@@ -30,6 +36,7 @@ import html
 import random
 import shutil
 import tempfile
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -38,22 +45,19 @@ from ooxml.scripts.pack import pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import KNOWN_NAMESPACES, LxmlXMLEditor, XMLEditor
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
 
-class DocxXMLEditor(XMLEditor):
-    """XMLEditor that automatically applies RSID, author, and date to new elements.
-
-    Automatically adds attributes to elements that support them when inserting new content:
-    - w:rsidR, w:rsidRDefault, w:rsidP (for w:p and w:r elements)
-    - w:author and w:date (for w:ins, w:del, w:comment elements)
-    - w:id (for w:ins and w:del elements)
+class _DocxEditorMixin:
+    """RSID, author and date injection and tracked-change operations for DOCX parts.
 
-    Attributes:
-        dom (defusedxml.minidom.Document): The DOM document for direct manipulation
+    Written once against the node operations that XMLEditor and LxmlXMLEditor
+    both provide (get_nodes, iter_elements, create_element, set_attribute,
+    move_before, move_children, ...), and combined with either backend by
+    DocxXMLEditor and LxmlDocxXMLEditor.
     """
 
     def __init__(
@@ -72,13 +76,24 @@ class DocxXMLEditor(XMLEditor):
         self.author = author
         self.initials = initials
 
+        # Next change ID while a batch is active (see _batched_change_ids)
+        self._batch_change_id = None
+
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
+        """Get the next available change ID by checking all tracked change elements.
+
+        Inside _batched_change_ids(), IDs are handed out from a counter instead
+        of rescanning the document for every new element.
+        """
+        if self._batch_change_id is not None:
+            change_id = self._batch_change_id
+            self._batch_change_id += 1
+            return change_id
+
         max_id = -1
         for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
+            for elem in self.get_nodes(tag):
+                change_id = self.get_attribute(elem, "w:id")
                 if change_id:
                     try:
                         max_id = max(max_id, int(change_id))
@@ -86,35 +101,26 @@ class DocxXMLEditor(XMLEditor):
                         pass
         return max_id + 1
 
-    def _ensure_w16du_namespace(self):
-        """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
-
-    def _ensure_w16cex_namespace(self):
-        """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+    @contextmanager
+    def _batched_change_ids(self):
+        """Allocate change IDs from a single document scan for a bulk operation."""
+        if self._batch_change_id is not None:
+            # Already batching (nested bulk call)
+            yield
+            return
+        self._batch_change_id = self._get_next_change_id()
+        try:
+            yield
+        finally:
+            self._batch_change_id = None
 
-    def _ensure_w14_namespace(self):
-        """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+    def _set_default(self, elem, name, value):
+        """Set an attribute unless it is already present."""
+        if not self.has_attribute(elem, name):
+            self.set_attribute(elem, name, value)
 
     def _inject_attributes_to_nodes(self, nodes):
-        """Inject RSID, author, and date attributes into DOM nodes where applicable.
+        """Inject RSID, author, and date attributes into nodes where applicable.
 
         Adds attributes to elements that support them:
         - w:r: gets w:rsidR (or w:rsidDel if inside w:del)
@@ -125,117 +131,89 @@ class DocxXMLEditor(XMLEditor):
         - w16cex:commentExtensible: gets w16cex:dateUtc
 
         Args:
-            nodes: List of DOM nodes to process
+            nodes: List of nodes to process (non-element nodes are skipped)
         """
-        from datetime import datetime, timezone
-
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
-            parent = elem.parentNode
-            while parent:
-                if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
+            parent = self.get_parent(elem)
+            while parent is not None:
+                if self.get_tag(parent) == "w:del":
                     return True
-                parent = parent.parentNode
+                parent = self.get_parent(parent)
             return False
 
         def add_rsid_to_p(elem):
-            if not elem.hasAttribute("w:rsidR"):
-                elem.setAttribute("w:rsidR", self.rsid)
-            if not elem.hasAttribute("w:rsidRDefault"):
-                elem.setAttribute("w:rsidRDefault", self.rsid)
-            if not elem.hasAttribute("w:rsidP"):
-                elem.setAttribute("w:rsidP", self.rsid)
+            self._set_default(elem, "w:rsidR", self.rsid)
+            self._set_default(elem, "w:rsidRDefault", self.rsid)
+            self._set_default(elem, "w:rsidP", self.rsid)
             # Add w14:paraId and w14:textId if not present
-            if not elem.hasAttribute("w14:paraId"):
-                self._ensure_w14_namespace()
-                elem.setAttribute("w14:paraId", _generate_hex_id())
-            if not elem.hasAttribute("w14:textId"):
-                self._ensure_w14_namespace()
-                elem.setAttribute("w14:textId", _generate_hex_id())
+            if not self.has_attribute(elem, "w14:paraId"):
+                self.ensure_namespace("w14", KNOWN_NAMESPACES["w14"])
+                self.set_attribute(elem, "w14:paraId", _generate_hex_id())
+            if not self.has_attribute(elem, "w14:textId"):
+                self.ensure_namespace("w14", KNOWN_NAMESPACES["w14"])
+                self.set_attribute(elem, "w14:textId", _generate_hex_id())
 
         def add_rsid_to_r(elem):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
             if is_inside_deletion(elem):
-                if not elem.hasAttribute("w:rsidDel"):
-                    elem.setAttribute("w:rsidDel", self.rsid)
+                self._set_default(elem, "w:rsidDel", self.rsid)
             else:
-                if not elem.hasAttribute("w:rsidR"):
-                    elem.setAttribute("w:rsidR", self.rsid)
+                self._set_default(elem, "w:rsidR", self.rsid)
 
         def add_tracked_change_attrs(elem):
             # Auto-assign w:id if not present
-            if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
-            if not elem.hasAttribute("w:author"):
-                elem.setAttribute("w:author", self.author)
-            if not elem.hasAttribute("w:date"):
-                elem.setAttribute("w:date", timestamp)
+            if not self.has_attribute(elem, "w:id"):
+                self.set_attribute(elem, "w:id", str(self._get_next_change_id()))
+            self._set_default(elem, "w:author", self.author)
+            self._set_default(elem, "w:date", timestamp)
             # Add w16du:dateUtc for tracked changes (same as w:date since we generate UTC timestamps)
-            if elem.tagName in ("w:ins", "w:del") and not elem.hasAttribute(
-                "w16du:dateUtc"
-            ):
-                self._ensure_w16du_namespace()
-                elem.setAttribute("w16du:dateUtc", timestamp)
+            if not self.has_attribute(elem, "w16du:dateUtc"):
+                self.ensure_namespace("w16du", KNOWN_NAMESPACES["w16du"])
+                self.set_attribute(elem, "w16du:dateUtc", timestamp)
 
         def add_comment_attrs(elem):
-            if not elem.hasAttribute("w:author"):
-                elem.setAttribute("w:author", self.author)
-            if not elem.hasAttribute("w:date"):
-                elem.setAttribute("w:date", timestamp)
-            if not elem.hasAttribute("w:initials"):
-                elem.setAttribute("w:initials", self.initials)
+            self._set_default(elem, "w:author", self.author)
+            self._set_default(elem, "w:date", timestamp)
+            self._set_default(elem, "w:initials", self.initials)
 
         def add_comment_extensible_date(elem):
             # Add w16cex:dateUtc for comment extensible elements
-            if not elem.hasAttribute("w16cex:dateUtc"):
-                self._ensure_w16cex_namespace()
-                elem.setAttribute("w16cex:dateUtc", timestamp)
+            if not self.has_attribute(elem, "w16cex:dateUtc"):
+                self.ensure_namespace("w16cex", KNOWN_NAMESPACES["w16cex"])
+                self.set_attribute(elem, "w16cex:dateUtc", timestamp)
 
         def add_xml_space_to_t(elem):
             # Add xml:space="preserve" to w:t if text has leading/trailing whitespace
-            if (
-                elem.firstChild
-                and elem.firstChild.nodeType == elem.firstChild.TEXT_NODE
-            ):
-                text = elem.firstChild.data
-                if text and (text[0].isspace() or text[-1].isspace()):
-                    if not elem.hasAttribute("xml:space"):
-                        elem.setAttribute("xml:space", "preserve")
+            text = self.get_text(elem)
+            if text and (text[0].isspace() or text[-1].isspace()):
+                self._set_default(elem, "xml:space", "preserve")
+
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:r": add_rsid_to_r,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
 
         for node in nodes:
-            if node.nodeType != node.ELEMENT_NODE:
+            if not self.is_element(node):
                 continue
 
             # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
+            handler = handlers.get(self.get_tag(node))
+            if handler:
+                handler(node)
+
+            # Process descendants, one tag at a time
+            for tag, handler in handlers.items():
+                for elem in self.get_nodes(tag, within=node):
+                    handler(elem)
 
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
@@ -261,6 +239,39 @@ class DocxXMLEditor(XMLEditor):
         self._inject_attributes_to_nodes(nodes)
         return nodes
 
+    def _mark_runs_deleted(self, runs):
+        """Convert runs to deleted runs: w:t -> w:delText, w:rsidR -> w:rsidDel."""
+        for run in runs:
+            for t_elem in self.get_nodes("w:t", within=run):
+                self.rename_node(t_elem, "w:delText")
+            if self.has_attribute(run, "w:rsidR"):
+                self.set_attribute(run, "w:rsidDel", self.get_attribute(run, "w:rsidR"))
+                self.remove_attribute(run, "w:rsidR")
+            elif not self.has_attribute(run, "w:rsidDel"):
+                self.set_attribute(run, "w:rsidDel", self.rsid)
+
+    def _wrap(self, elem, tag):
+        """Put a new element with the given tag in place of elem and move elem into it."""
+        wrapper = self.create_element(tag)
+        self.move_before(elem, wrapper)
+        self.move_into(wrapper, elem)
+        return wrapper
+
+    def _get_child(self, elem, tag):
+        """Get the first child element with the given tag, or None."""
+        for child in self.get_children(elem):
+            if self.get_tag(child) == tag:
+                return child
+        return None
+
+    def _ensure_child(self, elem, tag, first=False):
+        """Get the first child element with the given tag, creating it if missing."""
+        child = self._get_child(elem, tag)
+        if child is None:
+            child = self.create_element(tag)
+            self.move_into(elem, child, first=first)
+        return child
+
     def revert_insertion(self, elem):
         """Reject an insertion by wrapping its content in a deletion.
 
@@ -285,53 +296,33 @@ class DocxXMLEditor(XMLEditor):
             para = doc["word/document.xml"].get_node(tag="w:p", line_number=42)
             doc["word/document.xml"].revert_insertion(para)
         """
+        self.mark_dirty()
+
         # Collect insertions
-        ins_elements = []
-        if elem.tagName == "w:ins":
-            ins_elements.append(elem)
+        if self.get_tag(elem) == "w:ins":
+            ins_elements = [elem]
         else:
-            ins_elements.extend(elem.getElementsByTagName("w:ins"))
+            ins_elements = self.get_nodes("w:ins", within=elem)
 
         # Validate that there are insertions to reject
         if not ins_elements:
             raise ValueError(
                 f"revert_insertion requires w:ins elements. "
-                f"The provided element <{elem.tagName}> contains no insertions. "
+                f"The provided element <{self.get_tag(elem)}> contains no insertions. "
             )
 
         # Process all insertions - wrap all children in w:del
         for ins_elem in ins_elements:
-            runs = list(ins_elem.getElementsByTagName("w:r"))
+            runs = self.get_nodes("w:r", within=ins_elem)
             if not runs:
                 continue
 
-            # Create deletion wrapper
-            del_wrapper = self.dom.createElement("w:del")
+            self._mark_runs_deleted(runs)
 
-            # Process each run
-            for run in runs:
-                # Convert w:t → w:delText and w:rsidR → w:rsidDel
-                if run.hasAttribute("w:rsidR"):
-                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
-                    run.removeAttribute("w:rsidR")
-                elif not run.hasAttribute("w:rsidDel"):
-                    run.setAttribute("w:rsidDel", self.rsid)
-
-                for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
-                    if t_elem.firstChild:
-                        del_text.appendChild(t_elem.firstChild.cloneNode(False))
-                    for i in range(t_elem.attributes.length):
-                        attr = t_elem.attributes.item(i)
-                        del_text.setAttribute(attr.name, attr.value)
-                    t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Move all children from ins to del wrapper
-            while ins_elem.firstChild:
-                del_wrapper.appendChild(ins_elem.firstChild)
-
-            # Add del wrapper back to ins
-            ins_elem.appendChild(del_wrapper)
+            # Move all children from ins to a deletion wrapper inside it
+            del_wrapper = self.create_element("w:del")
+            self.move_children(ins_elem, del_wrapper)
+            self.move_into(ins_elem, del_wrapper)
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -363,20 +354,20 @@ class DocxXMLEditor(XMLEditor):
             para = doc["word/document.xml"].get_node(tag="w:p", line_number=42)
             nodes = doc["word/document.xml"].revert_deletion(para)
         """
-        # Collect deletions FIRST - before we modify the DOM
-        del_elements = []
-        is_single_del = elem.tagName == "w:del"
+        self.mark_dirty()
 
+        # Collect deletions FIRST - before we modify the tree
+        is_single_del = self.get_tag(elem) == "w:del"
         if is_single_del:
-            del_elements.append(elem)
+            del_elements = [elem]
         else:
-            del_elements.extend(elem.getElementsByTagName("w:del"))
+            del_elements = self.get_nodes("w:del", within=elem)
 
         # Validate that there are deletions to reject
         if not del_elements:
             raise ValueError(
                 f"revert_deletion requires w:del elements. "
-                f"The provided element <{elem.tagName}> contains no deletions. "
+                f"The provided element <{self.get_tag(elem)}> contains no deletions. "
             )
 
         # Track created insertion (only relevant if elem is a single w:del)
@@ -385,45 +376,39 @@ class DocxXMLEditor(XMLEditor):
         # Process all deletions - create insertions that copy the deleted content
         for del_elem in del_elements:
             # Clone the deleted runs and convert them to insertions
-            runs = list(del_elem.getElementsByTagName("w:r"))
+            runs = self.get_nodes("w:r", within=del_elem)
             if not runs:
                 continue
 
-            # Create insertion wrapper
-            ins_elem = self.dom.createElement("w:ins")
-
+            ins_elem = self.create_element("w:ins")
             for run in runs:
-                # Clone the run
-                new_run = run.cloneNode(True)
+                new_run = self.clone_node(run)
 
                 # Convert w:delText → w:t
-                for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
-                    if del_text.firstChild:
-                        t_elem.appendChild(del_text.firstChild.cloneNode(False))
-                    for i in range(del_text.attributes.length):
-                        attr = del_text.attributes.item(i)
-                        t_elem.setAttribute(attr.name, attr.value)
-                    del_text.parentNode.replaceChild(t_elem, del_text)
+                for del_text in self.get_nodes("w:delText", within=new_run):
+                    self.rename_node(del_text, "w:t")
 
                 # Update run attributes: w:rsidDel → w:rsidR
-                if new_run.hasAttribute("w:rsidDel"):
-                    new_run.setAttribute("w:rsidR", new_run.getAttribute("w:rsidDel"))
-                    new_run.removeAttribute("w:rsidDel")
-                elif not new_run.hasAttribute("w:rsidR"):
-                    new_run.setAttribute("w:rsidR", self.rsid)
+                if self.has_attribute(new_run, "w:rsidDel"):
+                    self.set_attribute(
+                        new_run, "w:rsidR", self.get_attribute(new_run, "w:rsidDel")
+                    )
+                    self.remove_attribute(new_run, "w:rsidDel")
+                elif not self.has_attribute(new_run, "w:rsidR"):
+                    self.set_attribute(new_run, "w:rsidR", self.rsid)
 
-                ins_elem.appendChild(new_run)
+                self.move_into(ins_elem, new_run)
 
             # Insert the new insertion after the deletion
-            nodes = self.insert_after(del_elem, ins_elem.toxml())
+            self.move_after(del_elem, ins_elem)
+            self._inject_attributes_to_nodes([ins_elem])
 
             # If processing a single w:del, track the created insertion
-            if is_single_del and nodes:
-                created_insertion = nodes[0]
+            if is_single_del:
+                created_insertion = ins_elem
 
         # Return based on input type
-        if is_single_del and created_insertion:
+        if is_single_del and created_insertion is not None:
             return [elem, created_insertion]
         else:
             return [elem]
@@ -478,14 +463,14 @@ class DocxXMLEditor(XMLEditor):
         return para.toxml()
 
     def suggest_deletion(self, elem):
-        """Mark a w:r or w:p element as deleted with tracked changes (in-place DOM manipulation).
+        """Mark a w:r or w:p element as deleted with tracked changes (in-place tree manipulation).
 
         For w:r: wraps in <w:del>, converts <w:t> to <w:delText>, preserves w:rPr
         For w:p (regular): wraps content in <w:del>, converts <w:t> to <w:delText>
         For w:p (numbered list): adds <w:del/> to w:rPr in w:pPr, wraps content in <w:del>
 
         Args:
-            elem: A w:r or w:p DOM element without existing tracked changes
+            elem: A w:r or w:p element without existing tracked changes
 
         Returns:
             Element: The modified element
@@ -493,92 +478,44 @@ class DocxXMLEditor(XMLEditor):
         Raises:
             ValueError: If element has existing tracked changes or invalid structure
         """
-        if elem.nodeName == "w:r":
+        self.mark_dirty()
+
+        tag = self.get_tag(elem)
+        if tag == "w:r":
             # Check for existing w:delText
-            if elem.getElementsByTagName("w:delText"):
+            if self.get_nodes("w:delText", within=elem):
                 raise ValueError("w:r element already contains w:delText")
 
-            # Convert w:t → w:delText
-            for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                if t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild.cloneNode(False))
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Update run attributes: w:rsidR → w:rsidDel
-            if elem.hasAttribute("w:rsidR"):
-                elem.setAttribute("w:rsidDel", elem.getAttribute("w:rsidR"))
-                elem.removeAttribute("w:rsidR")
-            elif not elem.hasAttribute("w:rsidDel"):
-                elem.setAttribute("w:rsidDel", self.rsid)
-
-            # Wrap in w:del
-            del_wrapper = self.dom.createElement("w:del")
-            parent = elem.parentNode
-            parent.insertBefore(del_wrapper, elem)
-            parent.removeChild(elem)
-            del_wrapper.appendChild(elem)
+            # Convert w:t → w:delText and w:rsidR → w:rsidDel, then wrap in w:del
+            self._mark_runs_deleted([elem])
+            del_wrapper = self._wrap(elem, "w:del")
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
             return del_wrapper
 
-        elif elem.nodeName == "w:p":
+        elif tag == "w:p":
             # Check for existing tracked changes
-            if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
+            if self.get_nodes("w:ins", within=elem) or self.get_nodes(
+                "w:del", within=elem
+            ):
                 raise ValueError("w:p element already contains tracked changes")
 
             # Check if it's a numbered list item
-            pPr_list = elem.getElementsByTagName("w:pPr")
-            is_numbered = pPr_list and pPr_list[0].getElementsByTagName("w:numPr")
+            pPr = self._get_child(elem, "w:pPr")
+            if pPr is not None and self.get_nodes("w:numPr", within=pPr):
+                # Add <w:del/> marker to w:rPr in w:pPr
+                rPr = self._ensure_child(pPr, "w:rPr")
+                self.move_into(rPr, self.create_element("w:del"), first=True)
 
-            if is_numbered:
-                # Add <w:del/> to w:rPr in w:pPr
-                pPr = pPr_list[0]
-                rPr_list = pPr.getElementsByTagName("w:rPr")
-
-                if not rPr_list:
-                    rPr = self.dom.createElement("w:rPr")
-                    pPr.appendChild(rPr)
-                else:
-                    rPr = rPr_list[0]
-
-                # Add <w:del/> marker
-                del_marker = self.dom.createElement("w:del")
-                rPr.insertBefore(
-                    del_marker, rPr.firstChild
-                ) if rPr.firstChild else rPr.appendChild(del_marker)
-
-            # Convert w:t → w:delText in all runs
-            for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                if t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild.cloneNode(False))
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Update run attributes: w:rsidR → w:rsidDel
-            for run in elem.getElementsByTagName("w:r"):
-                if run.hasAttribute("w:rsidR"):
-                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
-                    run.removeAttribute("w:rsidR")
-                elif not run.hasAttribute("w:rsidDel"):
-                    run.setAttribute("w:rsidDel", self.rsid)
+            # Convert w:t → w:delText and w:rsidR → w:rsidDel in all runs
+            self._mark_runs_deleted(self.get_nodes("w:r", within=elem))
 
             # Wrap all non-pPr children in <w:del>
-            del_wrapper = self.dom.createElement("w:del")
-            for child in [c for c in elem.childNodes if c.nodeName != "w:pPr"]:
-                elem.removeChild(child)
-                del_wrapper.appendChild(child)
-            elem.appendChild(del_wrapper)
+            del_wrapper = self.create_element("w:del")
+            self.move_children(elem, del_wrapper, exclude=("w:pPr",))
+            self.move_into(elem, del_wrapper)
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -586,7 +523,297 @@ class DocxXMLEditor(XMLEditor):
             return elem
 
         else:
-            raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
+            raise ValueError(f"Element must be w:r or w:p, got {tag}")
+
+    def accept_changes(self, author=None, within=None):
+        """Accept tracked insertions and deletions in a single pass.
+
+        Accepting an insertion keeps its content and drops the w:ins wrapper.
+        Accepting a deletion removes the w:del together with the deleted content.
+        Paragraph mark changes (w:ins/w:del inside the w:rPr of w:pPr) are
+        resolved too: an accepted deleted mark merges the paragraph into the
+        following one. The result is untracked, like "Accept" in Word.
+
+        Args:
+            author: Only accept changes by this author (default: all authors)
+            within: Element or list of elements to limit the operation to
+                (default: the whole document)
+
+        Returns:
+            dict: Number of accepted "insertions" and "deletions"
+
+        Example:
+            # Accept everything Jane Smith changed
+            doc["word/document.xml"].accept_changes(author="Jane Smith")
+
+            # Accept all changes in one paragraph
+            para = doc["word/document.xml"].get_node(tag="w:p", line_number=42)
+            doc["word/document.xml"].accept_changes(within=para)
+        """
+        self.mark_dirty()
+
+        insertions, deletions = self._collect_tracked_changes(author, within)
+        counts = {"insertions": 0, "deletions": 0}
+
+        for ins_elem in insertions:
+            if not self.is_attached(ins_elem):
+                continue
+            parent = self.get_parent(ins_elem)
+            if self.get_tag(parent) != "w:rPr":
+                # Keep the inserted content in place of the wrapper
+                self.move_children(ins_elem, parent, before=ins_elem)
+            self.remove_node(ins_elem)
+            counts["insertions"] += 1
+
+        for del_elem in deletions:
+            if not self.is_attached(del_elem):
+                continue
+            para = self._get_marked_paragraph(del_elem)
+            self.remove_node(del_elem)
+            if para is not None:
+                # Deleted paragraph mark: join this paragraph with the next one
+                self._merge_with_next_paragraph(para)
+            counts["deletions"] += 1
+
+        return counts
+
+    def reject_changes(self, author=None, within=None):
+        """Reject tracked insertions and deletions using tracked changes, in bulk.
+
+        Bulk counterpart of revert_insertion() and revert_deletion(): every
+        matching w:ins is wrapped in a w:del and every matching w:del gets a
+        w:ins restoring its content, all attributed to this editor's author.
+        Matching elements are collected in one walk and change IDs are allocated
+        from a single scan.
+
+        Paragraph mark changes (w:ins/w:del inside the w:rPr of w:pPr) cannot
+        be tracked again, so they are resolved directly, as accept_changes()
+        does: a rejected deleted mark is kept, and a rejected inserted mark is
+        removed by merging the paragraph into the following one. Deletions and
+        insertions with no runs and no paragraph mark are left untouched and
+        not counted.
+
+        Args:
+            author: Only reject changes by this author (default: all authors)
+            within: Element or list of elements to limit the operation to
+                (default: the whole document)
+
+        Returns:
+            dict: Number of rejected "insertions" and "deletions"
+
+        Example:
+            # Reject all of Jane Smith's changes
+            doc["word/document.xml"].reject_changes(author="Jane Smith")
+
+            # Reject all changes in a range of paragraphs
+            doc["word/document.xml"].reject_changes(within=paragraphs)
+        """
+        self.mark_dirty()
+
+        insertions, deletions = self._collect_tracked_changes(author, within)
+        counts = {"insertions": 0, "deletions": 0}
+
+        with self._batched_change_ids():
+            for del_elem in deletions:
+                if self._get_marked_paragraph(del_elem) is not None:
+                    # Deleted paragraph mark: keep the mark
+                    self.remove_node(del_elem)
+                    counts["deletions"] += 1
+                elif self.get_nodes("w:r", within=del_elem):
+                    self.revert_deletion(del_elem)
+                    counts["deletions"] += 1
+            for ins_elem in insertions:
+                para = self._get_marked_paragraph(ins_elem)
+                if para is not None:
+                    # Inserted paragraph mark: join this paragraph with the next one
+                    self.remove_node(ins_elem)
+                    self._merge_with_next_paragraph(para)
+                    counts["insertions"] += 1
+                elif self.get_nodes("w:r", within=ins_elem):
+                    self.revert_insertion(ins_elem)
+                    counts["insertions"] += 1
+
+        return counts
+
+    def suggest_deletions(self, elems):
+        """Mark many w:r or w:p elements as deleted with tracked changes.
+
+        Bulk counterpart of suggest_deletion() with batched change IDs.
+
+        Args:
+            elems: Iterable of w:r or w:p elements without tracked changes
+
+        Returns:
+            list: The modified elements, as returned by suggest_deletion()
+        """
+        with self._batched_change_ids():
+            return [self.suggest_deletion(elem) for elem in list(elems)]
+
+    def suggest_insertions(self, elems):
+        """Convert untracked w:r or w:p elements into tracked insertions, in place.
+
+        For w:r: wraps the run in <w:ins>
+        For w:p: wraps all non-pPr children in <w:ins> and adds <w:ins/> to the
+        w:rPr in w:pPr (same structure as suggest_paragraph())
+
+        Use this to turn content that was edited directly into tracked changes,
+        e.g. every paragraph of a section from get_section_nodes().
+        Elements that are not w:r/w:p, or that already contain tracked changes,
+        are skipped.
+
+        Args:
+            elems: Iterable of w:r or w:p elements
+
+        Returns:
+            list: The elements that were converted
+        """
+        self.mark_dirty()
+
+        converted = []
+        with self._batched_change_ids():
+            for elem in list(elems):
+                if not self.is_element(elem) or self.get_tag(elem) not in (
+                    "w:r",
+                    "w:p",
+                ):
+                    continue
+                if self.get_nodes("w:ins", within=elem) or self.get_nodes(
+                    "w:del", within=elem
+                ):
+                    continue
+
+                if self.get_tag(elem) == "w:r":
+                    ins_wrapper = self._wrap(elem, "w:ins")
+                else:
+                    pPr = self._ensure_child(elem, "w:pPr", first=True)
+                    rPr = self._ensure_child(pPr, "w:rPr")
+                    ins_marker = self.create_element("w:ins")
+                    self.move_into(rPr, ins_marker, first=True)
+                    self._inject_attributes_to_nodes([ins_marker])
+
+                    ins_wrapper = self.create_element("w:ins")
+                    self.move_children(elem, ins_wrapper, exclude=("w:pPr",))
+                    self.move_into(elem, ins_wrapper)
+
+                self._inject_attributes_to_nodes([ins_wrapper])
+                converted.append(elem)
+
+        return converted
+
+    def get_section_nodes(self, section_index):
+        """Get the body-level elements (w:p, w:tbl, ...) of one document section.
+
+        Sections end at each paragraph whose w:pPr contains a w:sectPr; the
+        body-level w:sectPr closes the last section.
+
+        Args:
+            section_index: 0-based section index
+
+        Returns:
+            list: Body child elements belonging to the section
+
+        Raises:
+            ValueError: If the document has no such section
+        """
+        body = self.get_node(tag="w:body")
+        sections = [[]]
+        for child in self.get_children(body):
+            tag = self.get_tag(child)
+            if tag == "w:sectPr":
+                continue
+            sections[-1].append(child)
+            if tag == "w:p":
+                pPr = self._get_child(child, "w:pPr")
+                if pPr is not None and self.get_nodes("w:sectPr", within=pPr):
+                    sections.append([])
+        if not sections[-1] and len(sections) > 1:
+            sections.pop()
+
+        if not 0 <= section_index < len(sections):
+            raise ValueError(
+                f"Section {section_index} not found (document has {len(sections)} sections)"
+            )
+        return sections[section_index]
+
+    def _collect_tracked_changes(self, author, within):
+        """Collect w:ins and w:del elements in document order with one tree walk."""
+        if within is None:
+            scopes = [self.root]
+        elif isinstance(within, (list, tuple)):
+            scopes = list(within)
+        else:
+            scopes = [within]
+
+        insertions, deletions = [], []
+        for scope in scopes:
+            for elem in self.iter_elements(scope, ("w:ins", "w:del")):
+                if (
+                    author is not None
+                    and self.get_attribute(elem, "w:author") != author
+                ):
+                    continue
+                if self.get_tag(elem) == "w:ins":
+                    insertions.append(elem)
+                else:
+                    deletions.append(elem)
+        return insertions, deletions
+
+    def _get_marked_paragraph(self, elem):
+        """Return the w:p whose paragraph mark a w:ins/w:del marks, or None."""
+        rPr = self.get_parent(elem)
+        if rPr is None or self.get_tag(rPr) != "w:rPr":
+            return None
+        pPr = self.get_parent(rPr)
+        if pPr is None or self.get_tag(pPr) != "w:pPr":
+            return None
+        return self.get_parent(pPr)
+
+    def _merge_with_next_paragraph(self, para):
+        """Move a paragraph's content to the start of the next paragraph and drop it."""
+        next_para = self.get_next_element(para)
+        while next_para is not None and self.get_tag(next_para) != "w:p":
+            next_para = self.get_next_element(next_para)
+        if next_para is None:
+            return
+
+        anchor = None
+        for child in self.get_children(next_para):
+            if self.get_tag(child) != "w:pPr":
+                anchor = child
+                break
+        self.move_children(para, next_para, before=anchor, exclude=("w:pPr",))
+        self.remove_node(para)
+
+
+class DocxXMLEditor(_DocxEditorMixin, XMLEditor):
+    """XMLEditor that automatically applies RSID, author, and date to new elements.
+
+    Automatically adds attributes to elements that support them when inserting new content:
+    - w:rsidR, w:rsidRDefault, w:rsidP (for w:p and w:r elements)
+    - w:author and w:date (for w:ins, w:del, w:comment elements)
+    - w:id (for w:ins and w:del elements)
+
+    Attributes:
+        dom (defusedxml.minidom.Document): The DOM document for direct manipulation
+    """
+
+
+class LxmlDocxXMLEditor(_DocxEditorMixin, LxmlXMLEditor):
+    """lxml-backed DocxXMLEditor: same automatic attributes and tracked-change API.
+
+    Behaves like DocxXMLEditor, but nodes are lxml elements and line numbers
+    come from lxml's sourceline. Selected with Document(..., backend="lxml").
+
+    Attributes:
+        tree (lxml.etree._ElementTree): The parsed tree for direct manipulation
+    """
+
+
+# Editor classes selectable with Document(..., backend=...)
+EDITOR_BACKENDS = {
+    "minidom": DocxXMLEditor,
+    "lxml": LxmlDocxXMLEditor,
+}
 
 
 def _generate_hex_id() -> str:
@@ -615,6 +842,7 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        backend="minidom",
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -626,7 +854,16 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            backend: XML editor backend, "minidom" (DocxXMLEditor, default) or
+                "lxml" (LxmlDocxXMLEditor: lower memory and faster traversal on
+                large documents; nodes are lxml elements)
         """
+        if backend not in EDITOR_BACKENDS:
+            raise ValueError(
+                f"Unknown backend: {backend} (expected one of {', '.join(EDITOR_BACKENDS)})"
+            )
+        self.editor_class = EDITOR_BACKENDS[backend]
+
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
@@ -675,7 +912,7 @@ class Document:
 
     def __getitem__(self, xml_path: str) -> DocxXMLEditor:
         """
-        Get or create a DocxXMLEditor for the specified XML file.
+        Get or create a DocxXMLEditor (or LxmlDocxXMLEditor) for the specified XML file.
 
         Enables lazy-loaded editors with bracket notation:
             node = doc["word/document.xml"].get_node(tag="w:p", line_number=42)
@@ -700,8 +937,8 @@ class Document:
             file_path = self.unpacked_path / xml_path
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
-            # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
+            # Use the backend's editor with RSID, author, and initials for all editors
+            self._editors[xml_path] = self.editor_class(
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
             )
         return self._editors[xml_path]
@@ -733,7 +970,7 @@ class Document:
 
         # If end node is a paragraph, append comment markup inside it
         # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
+        if self._document.get_tag(end) == "w:p":
             self._document.append_to(end, self._comment_range_end_xml(comment_id))
         else:
             self._document.insert_after(end, self._comment_range_end_xml(comment_id))
@@ -796,7 +1033,7 @@ class Document:
         self._document.insert_after(
             parent_start_elem, self._comment_range_start_xml(comment_id)
         )
-        parent_ref_run = parent_ref_elem.parentNode
+        parent_ref_run = self._document.get_parent(parent_ref_elem)
         self._document.insert_after(
             parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
         )
@@ -852,24 +1089,30 @@ class Document:
         if not redlining_validator.validate():
             raise ValueError("Redlining validation failed")
 
-    def save(self, destination=None, validate=True) -> None:
+    def save(self, destination=None, validate=True, only_modified=False) -> None:
         """
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Every loaded part is written by default, so nodes changed directly are
+        saved too.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
+            only_modified: If True, write only parts changed through editor
+                methods; after changing nodes directly, call editor.mark_dirty()
+                or the change is lost (default: False).
         """
         # Only ensure comment relationships and content types if comment files exist
         if self.comments_path.exists():
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
-        # Save all modified XML files in temp directory
+        # Save loaded XML files in temp directory
         for editor in self._editors.values():
-            editor.save()
+            if editor.dirty or not only_modified:
+                editor.save()
 
         # Validate by default
         if validate:
@@ -888,8 +1131,8 @@ class Document:
 
         editor = self["word/comments.xml"]
         max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
+        for comment_elem in editor.get_nodes("w:comment"):
+            comment_id = editor.get_attribute(comment_elem, "w:id")
             if comment_id:
                 try:
                     max_id = max(max_id, int(comment_id))
@@ -905,15 +1148,15 @@ class Document:
         editor = self["word/comments.xml"]
         existing = {}
 
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
+        for comment_elem in editor.get_nodes("w:comment"):
+            comment_id = editor.get_attribute(comment_elem, "w:id")
             if not comment_id:
                 continue
 
             # Find para_id from the w:p element within the comment
             para_id = None
-            for p_elem in comment_elem.getElementsByTagName("w:p"):
-                para_id = p_elem.getAttribute("w14:paraId")
+            for p_elem in editor.get_nodes("w:p", within=comment_elem):
+                para_id = editor.get_attribute(p_elem, "w14:paraId")
                 if para_id:
                     break
 
@@ -961,7 +1204,7 @@ class Document:
             return
 
         # Add Override element
-        root = editor.dom.documentElement
+        root = editor.root
         override_xml = '<Override PartName="/word/people.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.people+xml"/>'
         editor.append_to(root, override_xml)
 
@@ -972,8 +1215,8 @@ class Document:
         if self._has_relationship(editor, "people.xml"):
             return
 
-        root = editor.dom.documentElement
-        root_tag = root.tagName  # type: ignore
+        root = editor.root
+        root_tag = editor.get_tag(root)
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid = editor.get_next_rid()
 
@@ -994,13 +1237,13 @@ class Document:
         """
         editor = self["word/settings.xml"]
         root = editor.get_node(tag="w:settings")
-        prefix = root.tagName.split(":")[0] if ":" in root.tagName else "w"
+        root_tag = editor.get_tag(root)
+        prefix = root_tag.split(":")[0] if ":" in root_tag else "w"
 
         # Conditionally add trackRevisions if requested
         if track_revisions:
-            track_revisions_exists = any(
-                elem.tagName == f"{prefix}:trackRevisions"
-                for elem in editor.dom.getElementsByTagName(f"{prefix}:trackRevisions")
+            track_revisions_exists = bool(
+                editor.get_nodes(f"{prefix}:trackRevisions")
             )
 
             if not track_revisions_exists:
@@ -1008,20 +1251,21 @@ class Document:
                 # Try to insert before documentProtection, defaultTabStop, or at start
                 inserted = False
                 for tag in [f"{prefix}:documentProtection", f"{prefix}:defaultTabStop"]:
-                    elements = editor.dom.getElementsByTagName(tag)
+                    elements = editor.get_nodes(tag)
                     if elements:
                         editor.insert_before(elements[0], track_rev_xml)
                         inserted = True
                         break
                 if not inserted:
                     # Insert as first child of settings
-                    if root.firstChild:
-                        editor.insert_before(root.firstChild, track_rev_xml)
+                    children = editor.get_children(root)
+                    if children:
+                        editor.insert_before(children[0], track_rev_xml)
                     else:
                         editor.append_to(root, track_rev_xml)
 
         # Always check if rsids section exists
-        rsids_elements = editor.dom.getElementsByTagName(f"{prefix}:rsids")
+        rsids_elements = editor.get_nodes(f"{prefix}:rsids")
 
         if not rsids_elements:
             # Add new rsids section
@@ -1032,15 +1276,13 @@ class Document:
 
             # Try to insert after compat, before clrSchemeMapping, or before closing tag
             inserted = False
-            compat_elements = editor.dom.getElementsByTagName(f"{prefix}:compat")
+            compat_elements = editor.get_nodes(f"{prefix}:compat")
             if compat_elements:
                 editor.insert_after(compat_elements[0], rsids_xml)
                 inserted = True
 
             if not inserted:
-                clr_elements = editor.dom.getElementsByTagName(
-                    f"{prefix}:clrSchemeMapping"
-                )
+                clr_elements = editor.get_nodes(f"{prefix}:clrSchemeMapping")
                 if clr_elements:
                     editor.insert_before(clr_elements[0], rsids_xml)
                     inserted = True
@@ -1051,8 +1293,8 @@ class Document:
             # Check if this rsid already exists
             rsids_elem = rsids_elements[0]
             rsid_exists = any(
-                elem.getAttribute(f"{prefix}:val") == self.rsid
-                for elem in rsids_elem.getElementsByTagName(f"{prefix}:rsid")
+                editor.get_attribute(elem, f"{prefix}:val") == self.rsid
+                for elem in editor.get_nodes(f"{prefix}:rsid", within=rsids_elem)
             )
 
             if not rsid_exists:
@@ -1155,22 +1397,22 @@ class Document:
 
     def _has_relationship(self, editor, target):
         """Check if a relationship with given target exists."""
-        for rel_elem in editor.dom.getElementsByTagName("Relationship"):
-            if rel_elem.getAttribute("Target") == target:
+        for rel_elem in editor.get_nodes("Relationship"):
+            if editor.get_attribute(rel_elem, "Target") == target:
                 return True
         return False
 
     def _has_override(self, editor, part_name):
         """Check if an override with given part name exists."""
-        for override_elem in editor.dom.getElementsByTagName("Override"):
-            if override_elem.getAttribute("PartName") == part_name:
+        for override_elem in editor.get_nodes("Override"):
+            if editor.get_attribute(override_elem, "PartName") == part_name:
                 return True
         return False
 
     def _has_author(self, editor, author):
         """Check if an author already exists in people.xml."""
-        for person_elem in editor.dom.getElementsByTagName("w15:person"):
-            if person_elem.getAttribute("w15:author") == author:
+        for person_elem in editor.get_nodes("w15:person"):
+            if editor.get_attribute(person_elem, "w15:author") == author:
                 return True
         return False
 
@@ -1203,8 +1445,8 @@ class Document:
         if self._has_relationship(editor, "comments.xml"):
             return
 
-        root = editor.dom.documentElement
-        root_tag = root.tagName  # type: ignore
+        root = editor.root
+        root_tag = editor.get_tag(root)
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid_num = int(editor.get_next_rid()[3:])
 
@@ -1243,7 +1485,7 @@ class Document:
         if self._has_override(editor, "/word/comments.xml"):
             return
 
-        root = editor.dom.documentElement
+        root = editor.root
 
         # Add Override elements
         overrides = [
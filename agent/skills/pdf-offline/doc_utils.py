@@ -4,21 +4,325 @@ PDF 处理工具脚本
 支持 PDF 文件的读取、写入、合并、分割等操作
 """
 
+import os
+import re
 import sys
 import json
+import time
+import zlib
+import sqlite3
+import hashlib
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
 SKILL_DIR = Path(__file__).resolve().parent
 
+# 并行读取时每个任务包含的最大页数（越小越早输出首批结果）
+READ_CHUNK_PAGES = 8
+
+# 页面文本缓存文件（SQLite）的环境变量；也可用 read --cache 指定
+TEXT_CACHE_ENV = "PDF_TEXT_CACHE"
+
+# 提取结果的内容或格式变化时递增，使旧缓存失效
+TEXT_CACHE_VERSION = 1
+
+# 缓存最多保留的文件数，超出时删除最久未读取的文件
+TEXT_CACHE_MAX_FILES = 500
+
+# 新提取的页面每累积这么多页提交一次，中断时已提取的页面不会丢失
+TEXT_CACHE_COMMIT_PAGES = 64
+
 
 def _install_hint() -> str:
     return f"bash {SKILL_DIR / 'install.sh'}"
 
 
-def read_pdf(file_path):
-    """读取 PDF 文件文本内容"""
+def parse_page_ranges(spec, total_pages, skip_out_of_range=False):
+    """解析页码范围（如 "1-10,15,20-"），返回从 1 开始的页码列表
+
+    "20-" 表示第 20 页到最后一页，"-5" 表示第 1 页到第 5 页。页码按书写顺序返回。
+    页码超出 1-total_pages 时报错；skip_out_of_range 为真时跳过超出的页码。
+    """
+    pages = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            if '-' in part:
+                start, end = part.split('-', 1)
+                start = int(start) if start.strip() else 1
+                end = int(end) if end.strip() else total_pages
+            else:
+                start = end = int(part)
+        except ValueError:
+            raise ValueError(f"无效的页码范围: {part}")
+        if skip_out_of_range:
+            start, end = max(start, 1), min(end, total_pages)
+        elif not 1 <= start <= end <= total_pages:
+            raise ValueError(f"页码范围超出 1-{total_pages}: {part}")
+        pages.extend(range(start, end + 1))
+    if not pages:
+        raise ValueError(f"页码范围为空: {spec}")
+    return pages
+
+
+# 每个工作进程只打开一次 PDF（见 _init_read_worker）
+_worker_reader = None
+
+
+def _init_read_worker(file_path):
+    global _worker_reader
+    from pypdf import PdfReader
+    _worker_reader = PdfReader(file_path)
+
+
+def _extract_page(reader, page_num):
+    """提取单页文本，返回包含页码、内容、页面尺寸（pt）、旋转角度和耗时（秒）的记录"""
+    start = time.perf_counter()
+    try:
+        page = reader.pages[page_num - 1]
+        record = {
+            "page": page_num,
+            "content": page.extract_text(),
+            "width": round(float(page.mediabox.width), 2),
+            "height": round(float(page.mediabox.height), 2),
+            "rotation": page.rotation,
+        }
+    except Exception as e:
+        record = {"page": page_num, "error": str(e)}
+    record["seconds"] = round(time.perf_counter() - start, 4)
+    return record
+
+
+def _extract_page_worker(page_num):
+    return _extract_page(_worker_reader, page_num)
+
+
+class PageTextCache:
+    """按文件内容哈希和页码缓存提取结果（SQLite，记录以 zlib 压缩存储）
+
+    文件内容变化后哈希随之变化，旧页面自动失效；未变化的文件按路径、大小和修改时间
+    直接复用已计算的哈希，无需重新读取文件。缓存只用于加速，出错时不影响读取。
+    """
+
+    def __init__(self, cache_path):
+        self.path = Path(cache_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER,
+                hash TEXT, total_pages INTEGER, used REAL
+            );
+            CREATE TABLE IF NOT EXISTS pages (
+                hash TEXT, page INTEGER, record BLOB, PRIMARY KEY (hash, page)
+            );
+        """)
+        self._pending = 0
+        self._failed = False
+
+    def file_hash(self, file_path):
+        """获取文件的缓存键（内容哈希），文件变化时清理旧页面"""
+        from pypdf import __version__ as pypdf_version
+
+        file_path = Path(file_path).resolve()
+        stat = file_path.stat()
+        row = self.conn.execute(
+            "SELECT size, mtime_ns, hash FROM files WHERE path = ?", (str(file_path),)
+        ).fetchone()
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            file_hash = row[2]
+        else:
+            digest = hashlib.sha1(f"v{TEXT_CACHE_VERSION}-pypdf{pypdf_version}".encode())
+            with open(file_path, "rb") as f:
+                while chunk := f.read(1 << 20):
+                    digest.update(chunk)
+            file_hash = digest.hexdigest()
+            if row and row[2] != file_hash:
+                self._drop_hash(row[2], str(file_path))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, hash) VALUES (?, ?, ?, ?)",
+                (str(file_path), stat.st_size, stat.st_mtime_ns, file_hash),
+            )
+        self.conn.execute(
+            "UPDATE files SET used = ? WHERE path = ?", (time.time(), str(file_path))
+        )
+        self._prune()
+        self.conn.commit()
+        return file_hash
+
+    def get_total_pages(self, file_hash):
+        row = self.conn.execute(
+            "SELECT total_pages FROM files WHERE hash = ? AND total_pages IS NOT NULL",
+            (file_hash,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_total_pages(self, file_hash, total_pages):
+        if self._failed:
+            return
+        try:
+            self.conn.execute(
+                "UPDATE files SET total_pages = ? WHERE hash = ?", (total_pages, file_hash)
+            )
+        except sqlite3.Error as e:
+            self._fail(e)
+        self.commit()
+
+    def cached_pages(self, file_hash):
+        """已缓存的页码集合"""
+        rows = self.conn.execute("SELECT page FROM pages WHERE hash = ?", (file_hash,))
+        return {row[0] for row in rows}
+
+    def get(self, file_hash, page_num):
+        row = self.conn.execute(
+            "SELECT record FROM pages WHERE hash = ? AND page = ?", (file_hash, page_num)
+        ).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+
+    def put(self, file_hash, record):
+        if self._failed:
+            return
+        try:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (hash, page, record) VALUES (?, ?, ?)",
+                (
+                    file_hash,
+                    record["page"],
+                    zlib.compress(json.dumps(record, ensure_ascii=False).encode("utf-8")),
+                ),
+            )
+        except sqlite3.Error as e:
+            self._fail(e)
+            return
+        self._pending += 1
+        if self._pending >= TEXT_CACHE_COMMIT_PAGES:
+            self.commit()
+
+    def commit(self):
+        if self._failed:
+            return
+        try:
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self._fail(e)
+        self._pending = 0
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+    def _fail(self, error):
+        """写入缓存失败时只警告一次，之后不再写入"""
+        print(f"警告: 无法写入文本缓存 {self.path} - {error}", file=sys.stderr)
+        self._failed = True
+
+    def _drop_hash(self, file_hash, path):
+        """删除不再被其他路径引用的哈希对应的页面"""
+        other = self.conn.execute(
+            "SELECT 1 FROM files WHERE hash = ? AND path != ?", (file_hash, path)
+        ).fetchone()
+        if not other:
+            self.conn.execute("DELETE FROM pages WHERE hash = ?", (file_hash,))
+
+    def _prune(self):
+        stale = self.conn.execute(
+            "SELECT path, hash FROM files ORDER BY used DESC LIMIT -1 OFFSET ?",
+            (TEXT_CACHE_MAX_FILES,),
+        ).fetchall()
+        for path, file_hash in stale:
+            self.conn.execute("DELETE FROM files WHERE path = ?", (path,))
+            self._drop_hash(file_hash, path)
+
+
+def open_text_cache(cache_path=None):
+    """按参数或 PDF_TEXT_CACHE 环境变量打开页面文本缓存；未启用或无法打开时返回 None"""
+    cache_path = cache_path or os.environ.get(TEXT_CACHE_ENV)
+    if not cache_path:
+        return None
+    try:
+        return PageTextCache(cache_path)
+    except (OSError, sqlite3.Error) as e:
+        print(f"警告: 无法打开文本缓存 {cache_path} - {e}", file=sys.stderr)
+        return None
+
+
+def _extract_pages(file_path, pages, workers, reader):
+    """按页码顺序提取页面；workers 大于 1 时按页分片到多个进程"""
+    workers = min(workers or os.cpu_count() or 1, len(pages))
+    if workers <= 1:
+        if pages and reader is None:
+            from pypdf import PdfReader
+            reader = PdfReader(str(file_path))
+        for page_num in pages:
+            yield _extract_page(reader, page_num)
+        return
+
+    # 小块分片：既摊薄进程间开销，又能尽早输出前面的页
+    chunksize = max(1, min(READ_CHUNK_PAGES, len(pages) // (workers * 4)))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_read_worker,
+        initargs=(str(file_path),),
+    ) as executor:
+        yield from executor.map(_extract_page_worker, pages, chunksize=chunksize)
+
+
+def iter_pdf_pages(file_path, pages=None, workers=1, reader=None, cache=None, file_hash=None):
+    """逐页提取文本，按页码顺序在每页完成后立即产出记录
+
+    workers 大于 1 时按页分片到多个进程（0 或 None 表示每个 CPU 核一个），
+    每个进程只打开一次 PDF。单页出错时记录中包含 "error"，不影响其他页。
+    reader 为已打开的 PdfReader（可选），串行读取时直接复用。
+    cache 为 PageTextCache（可选）：已缓存的页面直接读出（记录中 "cached" 为 true，
+    "seconds" 为读缓存的耗时），只提取其余页面并写入缓存。
+    """
+    from pypdf import PdfReader
+
+    if pages is None:
+        if reader is None:
+            reader = PdfReader(str(file_path))
+        pages = list(range(1, len(reader.pages) + 1))
+
+    if cache is None:
+        yield from _extract_pages(file_path, pages, workers, reader)
+        return
+
+    if file_hash is None:
+        file_hash = cache.file_hash(file_path)
+    cached = cache.cached_pages(file_hash)
+    extracted = _extract_pages(
+        file_path, [page_num for page_num in pages if page_num not in cached], workers, reader
+    )
+    try:
+        for page_num in pages:
+            if page_num in cached:
+                start = time.perf_counter()
+                record = cache.get(file_hash, page_num)
+                record["seconds"] = round(time.perf_counter() - start, 4)
+                record["cached"] = True
+            else:
+                record = next(extracted)
+                if "error" not in record:
+                    cache.put(file_hash, record)
+            yield record
+    finally:
+        cache.commit()
+
+
+def read_pdf(file_path, pages=None, workers=1, jsonl=False, cache_path=None):
+    """读取 PDF 文件文本内容
+
+    pages 为页码范围（如 "1-10,15,20-"），默认读取全部页面；workers 为并行进程数。
+    jsonl 为 True 时每页完成后立即输出一行 JSON（含页面尺寸和该页耗时），不在内存中
+    累积全部页面，汇总信息输出到 stderr。
+    cache_path 为页面文本缓存文件（默认取 PDF_TEXT_CACHE 环境变量，未设置则不缓存），
+    重复读取时已缓存的页面无需重新提取。
+    """
     try:
         from pypdf import PdfReader
     except ImportError as e:
@@ -31,19 +335,50 @@ def read_pdf(file_path):
         print(f"错误: 文件不存在 - {file_path}")
         return None
 
+    cache = open_text_cache(cache_path)
+    file_hash = total_pages = None
+    if cache:
+        try:
+            file_hash = cache.file_hash(file_path)
+            # 缓存命中时连页数都无需解析 PDF
+            total_pages = cache.get_total_pages(file_hash)
+        except sqlite3.Error as e:
+            print(f"警告: 无法读取文本缓存 {cache.path} - {e}", file=sys.stderr)
+            cache.close()
+            cache = None
+
     try:
-        reader = PdfReader(file_path)
+        reader = None
+        if total_pages is None:
+            reader = PdfReader(file_path)
+            total_pages = len(reader.pages)
+            if cache:
+                cache.set_total_pages(file_hash, total_pages)
+        page_nums = parse_page_ranges(pages, total_pages) if pages else list(range(1, total_pages + 1))
+        records = iter_pdf_pages(file_path, page_nums, workers, reader, cache, file_hash)
+
+        if jsonl:
+            start = time.perf_counter()
+            count = 0
+            for record in records:
+                print(json.dumps(record, ensure_ascii=False), flush=True)
+                count += 1
+            elapsed = time.perf_counter() - start
+            print(f"已读取 {count}/{total_pages} 页，用时 {elapsed:.2f} 秒", file=sys.stderr)
+            return {"file": str(file_path), "total_pages": total_pages, "pages_read": count}
+
         pages = []
-        for i, page in enumerate(reader.pages):
-            text = page.extract_text()
+        for record in records:
+            if "error" in record:
+                raise RuntimeError(f"第 {record['page']} 页: {record['error']}")
             pages.append({
-                "page": i + 1,
-                "content": text
+                "page": record["page"],
+                "content": record["content"]
             })
 
         result = {
             "file": str(file_path),
-            "total_pages": len(pages),
+            "total_pages": total_pages,
             "pages": pages
         }
         print(json.dumps(result, ensure_ascii=False, indent=2))
@@ -51,6 +386,9 @@ def read_pdf(file_path):
     except Exception as e:
         print(f"错误: 读取 PDF 失败 - {e}")
         return None
+    finally:
+        if cache:
+            cache.close()
 
 
 def write_pdf(file_path, text, title="PDF Document"):
@@ -311,10 +649,117 @@ def merge_pdfs(output_path, input_paths):
         return False
 
 
-def split_pdf(input_path, output_prefix, pages=None):
-    """分割 PDF 文件"""
+def _get_bookmark_starts(reader):
+    """顶层书签的 (起始页索引, 标题) 列表，按页码排序，同一页只保留第一个书签"""
+    starts = {}
+    for item in reader.outline:
+        if isinstance(item, list):  # 上一个书签的子书签
+            continue
+        try:
+            page_index = reader.get_destination_page_number(item)
+        except Exception:
+            continue
+        if page_index is not None and page_index >= 0:
+            starts.setdefault(page_index, str(item.title or ""))
+    return sorted(starts.items())
+
+
+def plan_split(reader, output_prefix, pages=None, ranges=None, every=None, bookmarks=False):
+    """规划分割结果，返回 (输出路径, 从 0 开始的页索引列表) 列表
+
+    - pages：所有指定页面合并为一个文件 {prefix}_pages.pdf（页码列表或范围，如 "1-10,15,20-"），
+      超出文档的页码被跳过
+    - ranges：每个范围一个文件，如 {prefix}_1-10.pdf、{prefix}_15.pdf；重复的范围只输出一次
+    - every：每 N 页一个文件
+    - bookmarks：按顶层书签分割，第一个书签之前的页面单独成为 {prefix}_00_front.pdf
+    - 都未指定时每页一个文件 {prefix}_{页码}.pdf
+    """
+    total_pages = len(reader.pages)
+
+    def range_name(first, last):
+        return f"{output_prefix}_{first}.pdf" if first == last else f"{output_prefix}_{first}-{last}.pdf"
+
+    if pages:
+        if isinstance(pages, str):
+            page_nums = parse_page_ranges(pages, total_pages, skip_out_of_range=True)
+        else:
+            page_nums = [page_num for page_num in pages if 1 <= page_num <= total_pages]
+        return [(f"{output_prefix}_pages.pdf", [page_num - 1 for page_num in page_nums])]
+
+    if ranges:
+        # 同一范围（如 "5" 与 "5-5"）对应同一输出文件，只写一次，避免并行写入同一文件
+        plan = {}
+        for part in ranges.split(','):
+            if part.strip():
+                page_nums = parse_page_ranges(part, total_pages)
+                output_path = range_name(page_nums[0], page_nums[-1])
+                plan.setdefault(output_path, [n - 1 for n in page_nums])
+        return list(plan.items())
+
+    if every is not None:
+        if every < 1:
+            raise ValueError(f"每个文件的页数必须大于 0: {every}")
+        return [
+            (range_name(first + 1, min(first + every, total_pages)),
+             list(range(first, min(first + every, total_pages))))
+            for first in range(0, total_pages, every)
+        ]
+
+    if bookmarks:
+        starts = _get_bookmark_starts(reader)
+        if not starts:
+            raise ValueError("PDF 中没有可用的书签")
+        # 书签从 1 开始编号，前置页面编号为 0
+        front = starts[0][0] > 0
+        if front:
+            starts.insert(0, (0, "front"))
+        width = max(2, len(str(len(starts))))
+        plan = []
+        for i, (first, title) in enumerate(starts):
+            last = starts[i + 1][0] if i + 1 < len(starts) else total_pages
+            safe_title = re.sub(r'[^\w\-]+', '_', title).strip('_')[:60] or "part"
+            index = i if front else i + 1
+            plan.append((f"{output_prefix}_{index:0{width}d}_{safe_title}.pdf", list(range(first, last))))
+        return plan
+
+    return [(f"{output_prefix}_{i + 1}.pdf", [i]) for i in range(total_pages)]
+
+
+def _write_pages(reader, output_path, page_indices):
+    """将指定页面写入一个新 PDF；同一文件内多页共用的字体、图片等资源只写入一次"""
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for page_index in page_indices:
+        writer.add_page(reader.pages[page_index])
+    with open(output_path, "wb") as output:
+        writer.write(output)
+    return output_path
+
+
+# 每个写入进程只打开一次源 PDF（见 _init_split_worker）
+_split_reader = None
+
+
+def _init_split_worker(input_path):
+    global _split_reader
+    from pypdf import PdfReader
+    _split_reader = PdfReader(input_path)
+
+
+def _write_pages_worker(task):
+    return _write_pages(_split_reader, *task)
+
+
+def split_pdf(input_path, output_prefix, pages=None, ranges=None, every=None, bookmarks=False, workers=1):
+    """分割 PDF 文件
+
+    源文件只打开一次（并行时每个写入进程一次），解析过的字体、图片等共享资源在进程内
+    复用，每个输出文件写完即释放。分割方式见 plan_split；workers 为并行写入的进程数
+    （0 或 None 表示每个 CPU 核一个）。
+    """
     try:
-        from pypdf import PdfReader, PdfWriter
+        from pypdf import PdfReader
     except ImportError as e:
         print(f"错误: 缺少依赖库 - {e}")
         print(f"请运行: {_install_hint()}")
@@ -327,28 +772,27 @@ def split_pdf(input_path, output_prefix, pages=None):
 
     try:
         reader = PdfReader(str(input_path))
+        plan = plan_split(reader, output_prefix, pages, ranges, every, bookmarks)
 
-        if pages:
-            # 提取指定页面
-            writer = PdfWriter()
-            for page_num in pages:
-                if 1 <= page_num <= len(reader.pages):
-                    writer.add_page(reader.pages[page_num - 1])
-
-            output_path = f"{output_prefix}_pages.pdf"
-            with open(output_path, "wb") as output:
-                writer.write(output)
-            print(f"成功: 已提取页面 {pages} 到 {output_path}")
+        workers = min(workers or os.cpu_count() or 1, len(plan))
+        if workers <= 1:
+            for output_path, page_indices in plan:
+                _write_pages(reader, output_path, page_indices)
         else:
-            # 每页单独保存
-            for i, page in enumerate(reader.pages):
-                writer = PdfWriter()
-                writer.add_page(page)
-                output_path = f"{output_prefix}_{i + 1}.pdf"
-                with open(output_path, "wb") as output:
-                    writer.write(output)
+            # 每个任务写若干个完整文件，摊薄进程间开销
+            chunksize = max(1, len(plan) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_split_worker,
+                initargs=(str(input_path),),
+            ) as executor:
+                for _ in executor.map(_write_pages_worker, plan, chunksize=chunksize):
+                    pass
 
-            print(f"成功: 已分割为 {len(reader.pages)} 个文件")
+        if pages:
+            print(f"成功: 已提取页面 {pages} 到 {plan[0][0]}")
+        else:
+            print(f"成功: 已分割为 {len(plan)} 个文件")
 
         return True
     except Exception as e:
@@ -398,6 +842,10 @@ def main():
     # 读取命令
     read_cmd = subparsers.add_parser("read", help="读取 PDF 文件")
     read_cmd.add_argument("file", help="PDF 文件路径")
+    read_cmd.add_argument("--pages", help="页码范围（如：1-10,15,20-）")
+    read_cmd.add_argument("--workers", type=int, default=1, help="并行进程数（默认 1；0 表示每个 CPU 核一个）")
+    read_cmd.add_argument("--jsonl", action="store_true", help="每页完成后立即输出一行 JSON（含耗时）")
+    read_cmd.add_argument("--cache", help=f"页面文本缓存文件（SQLite；默认取 ${TEXT_CACHE_ENV}，未设置则不缓存）")
 
     # 写入命令（简单文本）
     write_cmd = subparsers.add_parser("write", help="创建简单 PDF 文件")
@@ -419,7 +867,12 @@ def main():
     split_cmd = subparsers.add_parser("split", help="分割 PDF 文件")
     split_cmd.add_argument("input", help="输入 PDF 文件路径")
     split_cmd.add_argument("prefix", help="输出文件前缀")
-    split_cmd.add_argument("--pages", help="指定页面（如：1,3,5）")
+    split_mode = split_cmd.add_mutually_exclusive_group()
+    split_mode.add_argument("--pages", help="指定页面，合并为一个文件（如：1,3,5 或 1-10,15,20-）")
+    split_mode.add_argument("--ranges", help="每个范围一个文件（如：1-10,15,20-）")
+    split_mode.add_argument("--every", type=int, help="每 N 页一个文件")
+    split_mode.add_argument("--bookmarks", action="store_true", help="按顶层书签分割")
+    split_cmd.add_argument("--workers", type=int, default=1, help="并行写入的进程数（默认 1；0 表示每个 CPU 核一个）")
 
     # 填写表单命令
     fill_cmd = subparsers.add_parser("fill_form", help="填写 PDF 表单")
@@ -435,7 +888,7 @@ def main():
 
     # 执行对应命令
     if args.command == "read":
-        read_pdf(args.file)
+        read_pdf(args.file, args.pages, args.workers, args.jsonl, args.cache)
     elif args.command == "write":
         write_pdf(args.file, args.text, args.title)
     elif args.command == "write_json":
@@ -443,10 +896,7 @@ def main():
     elif args.command == "merge":
         merge_pdfs(args.output, args.inputs)
     elif args.command == "split":
-        pages = None
-        if args.pages:
-            pages = [int(p.strip()) for p in args.pages.split(',')]
-        split_pdf(args.input, args.prefix, pages)
+        split_pdf(args.input, args.prefix, args.pages, args.ranges, args.every, args.bookmarks, args.workers)
     elif args.command == "fill_form":
         fill_pdf_form(args.template, args.output, args.fields)
 
@@ -6,10 +6,12 @@ from .base import BaseSchemaValidator
 from .docx import DOCXSchemaValidator
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
+from .stats import DocumentStats
 
 __all__ = [
     "BaseSchemaValidator",
     "DOCXSchemaValidator",
+    "DocumentStats",
     "PPTXSchemaValidator",
     "RedliningValidator",
 ]
@@ -0,0 +1,222 @@
+"""
+Per-document statistics for Word documents.
+
+Statistics are collected in a single walk over an already-parsed tree, so a
+validator can build them from the parse it shares with its other passes.
+Section-level values are stored as parallel lists indexed by section, which
+turns comparing an original and a modified document into a list comparison
+instead of a re-parse.
+"""
+
+import hashlib
+import zipfile
+from collections import Counter
+from pathlib import Path
+
+import lxml.etree
+
+WORD_2006_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+_P = f"{{{WORD_2006_NAMESPACE}}}p"
+_R = f"{{{WORD_2006_NAMESPACE}}}r"
+_T = f"{{{WORD_2006_NAMESPACE}}}t"
+_DEL_TEXT = f"{{{WORD_2006_NAMESPACE}}}delText"
+_INS = f"{{{WORD_2006_NAMESPACE}}}ins"
+_DEL = f"{{{WORD_2006_NAMESPACE}}}del"
+_BODY = f"{{{WORD_2006_NAMESPACE}}}body"
+_SECT_PR = f"{{{WORD_2006_NAMESPACE}}}sectPr"
+_COMMENT = f"{{{WORD_2006_NAMESPACE}}}comment"
+_AUTHOR = f"{{{WORD_2006_NAMESPACE}}}author"
+
+
+class DocumentStats:
+    """Paragraph, run, tracked-change and comment statistics for one document.
+
+    Attributes:
+        paragraphs: Total number of w:p elements in the body
+        runs: Total number of w:r elements in the body
+        insertions: Counter of w:ins elements per author
+        deletions: Counter of w:del elements per author
+        comments: Counter of w:comment elements per author
+        section_paragraphs: Paragraph count per section
+        section_runs: Run count per section
+        section_hashes: SHA-1 of the text (inserted and deleted) per section
+    """
+
+    def __init__(self):
+        self.paragraphs = 0
+        self.runs = 0
+        self.insertions = Counter()
+        self.deletions = Counter()
+        self.comments = Counter()
+        self.section_paragraphs = []
+        self.section_runs = []
+        self.section_hashes = []
+
+    @classmethod
+    def from_roots(cls, document_root, comments_root=None):
+        """Collect statistics from parsed document.xml and comments.xml roots.
+
+        Args:
+            document_root: lxml root element of word/document.xml
+            comments_root: Optional lxml root element of word/comments.xml
+
+        Returns:
+            DocumentStats: Collected statistics
+        """
+        stats = cls()
+        body = document_root.find(_BODY)
+        if body is not None:
+            stats._collect_body(body)
+        if comments_root is not None:
+            for comment in comments_root.iter(_COMMENT):
+                stats.comments[comment.get(_AUTHOR, "")] += 1
+        return stats
+
+    @classmethod
+    def from_unpacked(cls, unpacked_dir, document_root=None):
+        """Collect statistics from an unpacked document directory.
+
+        Args:
+            unpacked_dir: Directory the document was unpacked into
+            document_root: Optional already-parsed root of word/document.xml,
+                so a caller that has parsed it does not parse it again
+
+        Returns:
+            DocumentStats: Collected statistics
+        """
+        word_dir = Path(unpacked_dir) / "word"
+        if document_root is None:
+            document_root = lxml.etree.parse(str(word_dir / "document.xml")).getroot()
+        comments_file = word_dir / "comments.xml"
+        comments_root = (
+            lxml.etree.parse(str(comments_file)).getroot()
+            if comments_file.exists()
+            else None
+        )
+        return cls.from_roots(document_root, comments_root)
+
+    @classmethod
+    def from_docx(cls, docx_path):
+        """Collect statistics from a packed .docx, reading only the needed parts."""
+        with zipfile.ZipFile(docx_path, "r") as zf:
+            names = set(zf.namelist())
+            with zf.open("word/document.xml") as f:
+                document_root = lxml.etree.parse(f).getroot()
+            comments_root = None
+            if "word/comments.xml" in names:
+                with zf.open("word/comments.xml") as f:
+                    comments_root = lxml.etree.parse(f).getroot()
+        return cls.from_roots(document_root, comments_root)
+
+    def _collect_body(self, body):
+        """Walk the body once, splitting sections at each w:sectPr."""
+        paragraphs = runs = 0
+        digest = hashlib.sha1()
+
+        def close_section():
+            nonlocal paragraphs, runs, digest
+            self.section_paragraphs.append(paragraphs)
+            self.section_runs.append(runs)
+            self.section_hashes.append(digest.hexdigest())
+            paragraphs = runs = 0
+            digest = hashlib.sha1()
+
+        for child in body:
+            if child.tag == _SECT_PR:
+                # Body-level sectPr closes the final section
+                close_section()
+                continue
+
+            ends_section = False
+            for elem in child.iter():
+                tag = elem.tag
+                if tag == _P:
+                    paragraphs += 1
+                    digest.update(b"\n")
+                elif tag == _R:
+                    runs += 1
+                elif tag == _T:
+                    digest.update((elem.text or "").encode("utf-8"))
+                elif tag == _DEL_TEXT:
+                    digest.update(b"\x00" + (elem.text or "").encode("utf-8"))
+                elif tag == _INS:
+                    self.insertions[elem.get(_AUTHOR, "")] += 1
+                elif tag == _DEL:
+                    self.deletions[elem.get(_AUTHOR, "")] += 1
+                elif tag == _SECT_PR and child.tag == _P:
+                    # Paragraph-level sectPr ends a section after this paragraph
+                    ends_section = True
+
+            if ends_section:
+                close_section()
+
+        # Content after the last sectPr (or a body without any) forms a section
+        if paragraphs or runs or not self.section_hashes:
+            close_section()
+
+        self.paragraphs = sum(self.section_paragraphs)
+        self.runs = sum(self.section_runs)
+
+    def changed_sections(self, other):
+        """Return indexes of sections whose text differs from another document.
+
+        Sections present in only one of the documents count as changed.
+        """
+        changed = [
+            i
+            for i, (a, b) in enumerate(zip(self.section_hashes, other.section_hashes))
+            if a != b
+        ]
+        shorter = min(len(self.section_hashes), len(other.section_hashes))
+        longer = max(len(self.section_hashes), len(other.section_hashes))
+        changed.extend(range(shorter, longer))
+        return changed
+
+    def summarize_changes(self, modified):
+        """Summarize differences between this (original) and a modified document.
+
+        Args:
+            modified: DocumentStats of the modified document
+
+        Returns:
+            list[str]: Human-readable summary lines
+        """
+        lines = [
+            f"Paragraphs: {self.paragraphs} → {modified.paragraphs} "
+            f"({_format_delta(modified.paragraphs - self.paragraphs)})",
+            f"Runs: {self.runs} → {modified.runs} "
+            f"({_format_delta(modified.runs - self.runs)})",
+        ]
+
+        for label, before, after in (
+            ("Insertions", self.insertions, modified.insertions),
+            ("Deletions", self.deletions, modified.deletions),
+            ("Comments", self.comments, modified.comments),
+        ):
+            for author in sorted(set(before) | set(after)):
+                if before[author] != after[author]:
+                    lines.append(
+                        f"{label} by {author or '(no author)'}: "
+                        f"{before[author]} → {after[author]} "
+                        f"({_format_delta(after[author] - before[author])})"
+                    )
+
+        changed = self.changed_sections(modified)
+        total = max(len(self.section_hashes), len(modified.section_hashes))
+        if changed:
+            lines.append(
+                f"Sections changed: {len(changed)} of {total} "
+                f"(sections {', '.join(str(i + 1) for i in changed)})"
+            )
+        else:
+            lines.append(f"Sections changed: 0 of {total}")
+        return lines
+
+
+def _format_delta(diff):
+    return f"+{diff}" if diff > 0 else str(diff)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
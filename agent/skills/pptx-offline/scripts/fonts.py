@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Font lookup for text measurement.
+
+This module scans the platform font directories once into a FontIndex that
+maps file names and family/style names to font files, so resolving a font
+name is a dictionary lookup instead of a series of filesystem probes.
+Resolved paths and loaded fonts are kept in LRU caches.
+
+Lookup order matches the original file-name probing: for each font directory
+in priority order, an exact file name match (e.g. "Arial.ttf"), then a file
+name containing the font name. Only if no file name matches are the family
+and style names stored in the font files consulted, which also finds fonts in
+subdirectories (e.g. /usr/share/fonts/truetype/dejavu/).
+
+Set the PPTX_FONT_INDEX environment variable to a JSON file path to persist
+the index between runs. A persisted index is rebuilt automatically when any
+scanned font directory changes.
+
+Classes:
+    FontIndex: Font files found in the platform font directories
+
+Main Functions:
+    get_font_index: Return the process-wide FontIndex
+    find_font_path: Resolve a font name and style to a font file (cached)
+    load_font: Load a font at a given size (cached by path and size)
+"""
+
+import json
+import os
+import platform
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PIL import ImageFont
+
+# Environment variable naming the JSON file used to persist the font index
+FONT_INDEX_ENV = "PPTX_FONT_INDEX"
+
+# Bump when the persisted index layout changes
+INDEX_VERSION = 2
+
+# Style name words of an upright, non-bold face (DejaVu's regular is "Book")
+REGULAR_STYLE_WORDS = {"regular", "book", "normal", "roman", "medium"}
+
+
+def get_font_dirs() -> Tuple[List[str], List[str]]:
+    """Get the font directories and font file extensions for this platform.
+
+    Returns:
+        Tuple of (font directories in priority order, file extensions)
+    """
+    if platform.system() == "Darwin":  # macOS
+        font_dirs = [
+            "/System/Library/Fonts/",
+            "/Library/Fonts/",
+            "~/Library/Fonts/",
+        ]
+        extensions = [".ttf", ".otf", ".ttc", ".dfont"]
+    else:  # Linux
+        font_dirs = [
+            "/usr/share/fonts/truetype/",
+            "/usr/local/share/fonts/",
+            "~/.fonts/",
+        ]
+        extensions = [".ttf", ".otf"]
+    return [str(Path(d).expanduser()) for d in font_dirs], extensions
+
+
+class FontIndex:
+    """Font files found in the platform font directories.
+
+    Attributes:
+        dirs: Scanned font directories in lookup priority order
+        extensions: Font file extensions that were indexed
+        top_level: Per directory, file name -> path for fonts directly inside it
+        paths: All font files found, including subdirectories, in scan order
+        dir_mtimes: Modification time of every scanned directory (None if missing)
+        families: Lowercase family name -> {face: path}, read lazily; faces are
+            "regular", "bold", "italic" and "bold italic" (see face_key)
+        index_path: Where the index is persisted, if anywhere
+    """
+
+    def __init__(self, dirs: List[str], extensions: List[str]):
+        self.dirs = dirs
+        self.extensions = extensions
+        self.top_level: Dict[str, Dict[str, str]] = {}
+        self.paths: List[str] = []
+        self.dir_mtimes: Dict[str, Optional[int]] = {}
+        self.families: Optional[Dict[str, Dict[str, str]]] = None
+        self.index_path: Optional[str] = None
+
+    @classmethod
+    def scan(cls, dirs: List[str], extensions: List[str]) -> "FontIndex":
+        """Build an index by walking the font directories once."""
+        index = cls(dirs, extensions)
+        for font_dir in dirs:
+            index.dir_mtimes[font_dir] = _mtime(font_dir)
+            if index.dir_mtimes[font_dir] is None:
+                continue
+
+            top_level = {}
+            for root, subdirs, files in os.walk(font_dir):
+                subdirs.sort()
+                if root != font_dir:
+                    index.dir_mtimes[root] = _mtime(root)
+                for name in sorted(files):
+                    if not any(name.lower().endswith(ext) for ext in extensions):
+                        continue
+                    path = os.path.join(root, name)
+                    index.paths.append(path)
+                    if root == font_dir:
+                        top_level[name] = path
+            index.top_level[font_dir] = top_level
+        return index
+
+    @classmethod
+    def load(
+        cls, index_path: str, dirs: List[str], extensions: List[str]
+    ) -> Optional["FontIndex"]:
+        """Load a persisted index, or return None if it is missing or stale."""
+        try:
+            data = json.loads(Path(index_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != INDEX_VERSION
+            or data.get("dirs") != dirs
+            or data.get("extensions") != extensions
+        ):
+            return None
+
+        # Any added, removed or changed directory invalidates the index
+        dir_mtimes = data.get("dir_mtimes", {})
+        if any(_mtime(d) != mtime for d, mtime in dir_mtimes.items()):
+            return None
+
+        index = cls(dirs, extensions)
+        index.top_level = data.get("top_level", {})
+        index.paths = data.get("paths", [])
+        index.dir_mtimes = dir_mtimes
+        index.families = data.get("families")
+        index.index_path = index_path
+        return index
+
+    def save(self, index_path: str) -> None:
+        """Persist the index as JSON (written atomically)."""
+        data = {
+            "version": INDEX_VERSION,
+            "dirs": self.dirs,
+            "extensions": self.extensions,
+            "dir_mtimes": self.dir_mtimes,
+            "top_level": self.top_level,
+            "paths": self.paths,
+            "families": self.families,
+        }
+        path = Path(index_path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # Persisting is an optimization only; lookups still work
+            print(f"Warning: Could not save font index to {index_path}: {e}")
+        self.index_path = index_path
+
+    def find(
+        self, font_name: str, bold: bool = False, italic: bool = False
+    ) -> Optional[str]:
+        """Find the font file for a font name.
+
+        Args:
+            font_name: Name of the font (e.g., 'Arial', 'Calibri')
+            bold: Prefer a bold face when matching by family name
+            italic: Prefer an italic face when matching by family name
+
+        Returns:
+            Path to the font file, or None if not found
+        """
+        font_variations = [
+            font_name,
+            font_name.lower(),
+            font_name.replace(" ", ""),
+            font_name.replace(" ", "-"),
+        ]
+        font_name_lower = font_name.lower().replace(" ", "")
+
+        for font_dir in self.dirs:
+            top_level = self.top_level.get(font_dir)
+            if not top_level:
+                continue
+
+            # First try exact matches
+            for variant in font_variations:
+                for ext in self.extensions:
+                    if f"{variant}{ext}" in top_level:
+                        return top_level[f"{variant}{ext}"]
+
+            # Then try fuzzy matching - find files containing the font name
+            for name, path in top_level.items():
+                if font_name_lower in name.lower():
+                    return path
+
+        # Finally match the family name stored in the font files. Without the
+        # exact face, use the regular one as the file name matches above do,
+        # never a face of another weight or slant
+        faces = self._get_families().get(font_name.lower())
+        if not faces:
+            return None
+        return faces.get(face_key(bold, italic)) or faces.get(face_key(False, False))
+
+    def _get_families(self) -> Dict[str, Dict[str, str]]:
+        """Read family and style names from every indexed font (once)."""
+        if self.families is not None:
+            return self.families
+
+        families: Dict[str, Dict[str, str]] = {}
+        for path in self.paths:
+            try:
+                family, style = ImageFont.truetype(path, size=12).getname()
+            except Exception:
+                continue
+            if not family:
+                continue
+            flags = style_flags(style)
+            if flags is None:
+                continue
+            faces = families.setdefault(family.lower(), {})
+            faces.setdefault(face_key(*flags), path)
+        self.families = families
+
+        if self.index_path:
+            self.save(self.index_path)
+        return families
+
+
+def style_flags(style: Optional[str]) -> Optional[Tuple[bool, bool]]:
+    """Map a font style name to (bold, italic) flags.
+
+    Returns None for styles that are not plain regular, bold and/or italic
+    (e.g. "Light" or "Condensed Bold"), which are never picked as a face.
+    """
+    bold = italic = False
+    for word in (style or "regular").lower().split():
+        if word == "bold":
+            bold = True
+        elif word in ("italic", "oblique"):
+            italic = True
+        elif word not in REGULAR_STYLE_WORDS:
+            return None
+    return bold, italic
+
+
+def face_key(bold: bool, italic: bool) -> str:
+    """Get the FontIndex.families key of a face ("regular", "bold italic", ...)."""
+    return (
+        " ".join(word for word, on in (("bold", bold), ("italic", italic)) if on)
+        or "regular"
+    )
+
+
+def _mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_font_index() -> FontIndex:
+    """Return the process-wide font index, loading or building it once."""
+    dirs, extensions = get_font_dirs()
+    index_path = os.environ.get(FONT_INDEX_ENV)
+    if index_path:
+        index = FontIndex.load(index_path, dirs, extensions)
+        if index is not None:
+            return index
+
+    index = FontIndex.scan(dirs, extensions)
+    if index_path:
+        index.save(index_path)
+    return index
+
+
+@lru_cache(maxsize=512)
+def find_font_path(
+    font_name: str, bold: bool = False, italic: bool = False
+) -> Optional[str]:
+    """Resolve a font name to a font file path, or None if not found."""
+    return get_font_index().find(font_name, bold=bold, italic=italic)
+
+
+@lru_cache(maxsize=256)
+def load_font(font_path: Optional[str], size: int):
+    """Load a TrueType/OpenType font at a size, falling back to PIL's default font.
+
+    Fonts are cached by (path, size), so each face is parsed once per process.
+    """
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size=size)
+        except Exception:
+            pass
+    return ImageFont.load_default()
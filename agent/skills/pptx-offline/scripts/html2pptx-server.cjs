@@ -0,0 +1,98 @@
+#!/usr/bin/env node
+/**
+ * Long-lived html2pptx worker driven over stdin/stdout.
+ *
+ * Launches one browser at start-up and converts decks from HTML slides for as
+ * long as stdin stays open, so callers converting many decks pay for Node and
+ * browser start-up once. Driven by scripts/html2pptx_batch.py, which runs a
+ * pool of these workers.
+ *
+ * Protocol (one JSON object per line):
+ *   <- {"ready": true}                       once the browser is running
+ *   -> {"id": 1, "slides": ["a.html", "b.html"], "output": "deck.pptx",
+ *       "layout": "LAYOUT_16x9"}              layout is optional
+ *   <- {"id": 1, "status": "ok", "output": "deck.pptx", "slides": 2,
+ *       "placeholders": [[{id, x, y, w, h}, ...], [...]]}
+ *   <- {"id": 1, "status": "error", "error": "a.html: ..."}
+ *
+ * Requests are handled one at a time, in order. Relative paths are resolved
+ * against the worker's working directory; the output's directory is created
+ * once the deck has been converted. Nothing else is written to stdout;
+ * the worker exits when stdin closes or the browser goes away.
+ *
+ * Usage:
+ *   node agent/skills/pptx-offline/scripts/html2pptx-server.cjs
+ */
+
+const fs = require("fs");
+const path = require("path");
+const readline = require("readline");
+
+const PptxGenJS = require("pptxgenjs");
+const html2pptx = require("./html2pptx");
+
+const DEFAULT_LAYOUT = "LAYOUT_16x9";
+
+function send(message) {
+  process.stdout.write(JSON.stringify(message) + "\n");
+}
+
+async function convertDeck(request, browser) {
+  const { slides, output, layout = DEFAULT_LAYOUT } = request;
+  if (!Array.isArray(slides) || slides.length === 0 || !output) {
+    throw new Error('Expected "slides" (a non-empty array) and "output"');
+  }
+
+  const pptx = new PptxGenJS();
+  pptx.layout = layout;
+
+  const placeholders = [];
+  for (const htmlFile of slides) {
+    const result = await html2pptx(htmlFile, pptx, { browser });
+    placeholders.push(result.placeholders);
+  }
+
+  const outPath = path.isAbsolute(output)
+    ? output
+    : path.join(process.cwd(), output);
+  fs.mkdirSync(path.dirname(outPath), { recursive: true });
+  await pptx.writeFile({ fileName: outPath });
+  return { output, slides: slides.length, placeholders };
+}
+
+async function main() {
+  const browser = await html2pptx.launchBrowser();
+  browser.on("disconnected", () => {
+    process.stderr.write("Browser disconnected\n");
+    process.exit(1);
+  });
+  send({ ready: true });
+
+  const lines = readline.createInterface({ input: process.stdin });
+  for await (const line of lines) {
+    if (!line.trim()) continue;
+
+    let request;
+    try {
+      request = JSON.parse(line);
+    } catch (err) {
+      send({ id: null, status: "error", error: `Invalid request: ${err.message}` });
+      continue;
+    }
+
+    try {
+      const result = await convertDeck(request, browser);
+      send({ id: request.id, status: "ok", ...result });
+    } catch (err) {
+      send({ id: request.id, status: "error", error: String(err?.message || err) });
+    }
+  }
+
+  browser.removeAllListeners("disconnected");
+  await browser.close();
+}
+
+main().catch((err) => {
+  process.stderr.write(String(err?.stack || err) + "\n");
+  process.exit(1);
+});
@@ -23,6 +23,15 @@
  *
  * RETURNS:
  *   { slide, placeholders } where placeholders is an array of { id, x, y, w, h }
+ *
+ * REUSING A BROWSER:
+ *   By default every call launches and closes its own browser. To convert many
+ *   slides, launch one and pass it in; it is left open for the caller to close:
+ *
+ *   const browser = await html2pptx.launchBrowser();
+ *   await html2pptx('slide1.html', pptx, { browser });
+ *   await html2pptx('slide2.html', pptx, { browser });
+ *   await browser.close();
  */
 
 let playwright;
@@ -928,24 +937,32 @@ async function extractSlideData(page) {
   });
 }
 
+// Launch the browser html2pptx renders slides in
+async function launchBrowser(tmpDir = process.env.TMPDIR || '/tmp') {
+  // Use Chrome on macOS, default Chromium on Unix. If running on playwright-core,
+  // prefer a system browser channel (no bundled browser download).
+  const launchOptions = { env: { TMPDIR: tmpDir } };
+  if (process.platform === 'darwin') {
+    launchOptions.channel = 'chrome';
+  }
+  if (isPlaywrightCore && !launchOptions.channel) {
+    launchOptions.channel = process.env.PLAYWRIGHT_CHROMIUM_CHANNEL || 'chrome';
+  }
+
+  return chromium.launch(launchOptions);
+}
+
 async function html2pptx(htmlFile, pres, options = {}) {
   const {
     tmpDir = process.env.TMPDIR || '/tmp',
-    slide = null
+    slide = null,
+    browser: sharedBrowser = null
   } = options;
 
   try {
-    // Use Chrome on macOS, default Chromium on Unix. If running on playwright-core,
-    // prefer a system browser channel (no bundled browser download).
-    const launchOptions = { env: { TMPDIR: tmpDir } };
-    if (process.platform === 'darwin') {
-      launchOptions.channel = 'chrome';
-    }
-    if (isPlaywrightCore && !launchOptions.channel) {
-      launchOptions.channel = process.env.PLAYWRIGHT_CHROMIUM_CHANNEL || 'chrome';
-    }
-
-    const browser = await chromium.launch(launchOptions);
+    // A browser passed in (see launchBrowser) is reused and left open;
+    // otherwise one is launched for this slide only
+    const browser = sharedBrowser || await launchBrowser(tmpDir);
 
     let bodyDimensions;
     let slideData;
@@ -956,18 +973,24 @@ async function html2pptx(htmlFile, pres, options = {}) {
     try {
       const page = await browser.newPage();
 
-      await page.goto(`file://${filePath}`);
+      try {
+        await page.goto(`file://${filePath}`);
 
-      bodyDimensions = await getBodyDimensions(page);
+        bodyDimensions = await getBodyDimensions(page);
 
-      await page.setViewportSize({
-        width: Math.round(bodyDimensions.width),
-        height: Math.round(bodyDimensions.height)
-      });
+        await page.setViewportSize({
+          width: Math.round(bodyDimensions.width),
+          height: Math.round(bodyDimensions.height)
+        });
 
-      slideData = await extractSlideData(page);
+        slideData = await extractSlideData(page);
+      } finally {
+        await page.close();
+      }
     } finally {
-      await browser.close();
+      if (!sharedBrowser) {
+        await browser.close();
+      }
     }
 
     // Collect all validation errors
@@ -1012,3 +1035,4 @@ async function html2pptx(htmlFile, pres, options = {}) {
 }
 
 module.exports = html2pptx;
+module.exports.launchBrowser = launchBrowser;
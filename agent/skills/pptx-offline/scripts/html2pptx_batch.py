@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Convert many decks from HTML slides through a pool of persistent html2pptx workers.
+
+Running html2pptx-local.cjs once per deck starts Node and a browser every
+time, which dominates the cost of small decks. This driver instead keeps a
+pool of long-lived html2pptx-server.cjs workers, each with one browser, and
+feeds them decks over their stdin/stdout pipes. Decks are converted
+concurrently, one per worker, and each finished deck is checked with
+inventory.py while the workers carry on with the next ones.
+
+The input is a JSONL file with one deck per line:
+
+    {"output": "deck-1.pptx", "slides": ["title.html", "agenda.html"],
+     "layout": "LAYOUT_16x9"}
+
+Slide paths are resolved relative to the JSONL file, output paths relative to
+the output directory (an output outside it, or one another line or the
+results file already uses, fails the line), and "layout" is optional. A record per line is written to results.jsonl in the output
+directory, in input order, with "status" "ok", the deck's placeholders and its
+inventory counts, or "error" with the error message. A failing line does not
+stop the batch.
+
+Classes:
+    Html2PptxWorker: One persistent html2pptx-server.cjs process
+    Html2PptxPool: Pool of workers converting decks concurrently
+
+Main Functions:
+    convert_batch: Convert every deck of a JSONL file and inventory the results
+
+Usage:
+    python html2pptx_batch.py decks.jsonl outputs/ --workers 4
+"""
+
+import argparse
+import json
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, NoReturn, Optional, Tuple
+
+from inventory import get_inventory_as_dict, save_inventory_dict, shape_dict_has_issues
+from replace import BatchOutputs, read_batch_lines
+
+SERVER_SCRIPT = Path(__file__).with_name("html2pptx-server.cjs")
+
+# Seconds to wait for a worker to launch its browser
+WORKER_START_TIMEOUT = 60
+
+# Seconds to wait for a single deck
+DECK_TIMEOUT = 300
+
+
+class Html2PptxWorker:
+    """One persistent html2pptx-server.cjs process.
+
+    The process is started on first use and restarted after it dies or times
+    out. Not thread-safe: a worker converts one deck at a time (Html2PptxPool
+    hands each worker to one thread at a time).
+
+    Attributes:
+        node: Node.js executable
+    """
+
+    def __init__(self, node: str = "node"):
+        self.node = node
+        self._process: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._stderr = None
+        self._next_id = 0
+
+    def convert(
+        self, slides: List[Path], output: Path, layout: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Convert HTML slides into one deck and return the worker's response.
+
+        Raises:
+            RuntimeError: If the worker fails, dies or times out; errors in
+                the slides themselves are returned as an "error" response
+        """
+        self._ensure_started()
+        self._next_id += 1
+        request: Dict[str, Any] = {
+            "id": self._next_id,
+            "slides": [str(Path(slide).absolute()) for slide in slides],
+            "output": str(Path(output).absolute()),
+        }
+        if layout:
+            request["layout"] = layout
+
+        try:
+            self._process.stdin.write(json.dumps(request) + "\n")  # type: ignore
+            self._process.stdin.flush()  # type: ignore
+        except OSError:
+            self._fail("html2pptx worker exited")
+        response = self._read_message(DECK_TIMEOUT)
+        if response.get("id") != request["id"]:
+            self._fail("html2pptx worker sent an unexpected response")
+        return response
+
+    def close(self) -> None:
+        """Stop the worker process, if running."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()  # type: ignore
+            process.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        if self._stderr is not None:
+            self._stderr.close()
+            self._stderr = None
+
+    def _ensure_started(self) -> None:
+        if self._process is not None and self._process.poll() is None:
+            return
+        self.close()
+
+        self._lines = queue.Queue()
+        self._stderr = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+        self._process = subprocess.Popen(
+            [self.node, str(SERVER_SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        # Read responses on a thread so waiting for one can time out
+        threading.Thread(
+            target=self._read_lines,
+            args=(self._process.stdout, self._lines),
+            daemon=True,
+        ).start()
+        if not self._read_message(WORKER_START_TIMEOUT).get("ready"):
+            self._fail("html2pptx worker did not start")
+
+    @staticmethod
+    def _read_lines(stdout, lines: "queue.Queue[Optional[str]]") -> None:
+        for line in stdout:
+            lines.put(line)
+        lines.put(None)
+
+    def _read_message(self, timeout: float) -> Dict[str, Any]:
+        try:
+            line = self._lines.get(timeout=timeout)
+        except queue.Empty:
+            self._fail(f"html2pptx worker timed out after {timeout}s")
+        if line is None:
+            self._fail("html2pptx worker exited")
+        try:
+            return json.loads(line)
+        except ValueError:
+            self._fail(f"html2pptx worker sent invalid output: {line.strip()}")
+
+    def _fail(self, message: str) -> NoReturn:
+        """Stop the worker and raise, including what it wrote to stderr."""
+        stderr = ""
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._stderr.seek(0)  # type: ignore
+            stderr = self._stderr.read().strip()  # type: ignore
+        self.close()
+        raise RuntimeError(f"{message}: {stderr}" if stderr else message)
+
+
+class Html2PptxPool:
+    """Pool of html2pptx workers converting decks concurrently.
+
+    Each worker converts one deck at a time; submitted decks are queued until
+    a worker is free. Workers start on first use and stay alive until the
+    pool is closed. Use it as a context manager (or call close()).
+    """
+
+    def __init__(self, workers: int = 1, node: str = "node"):
+        self.workers = [Html2PptxWorker(node) for _ in range(max(1, workers))]
+        self._idle: "queue.Queue[Html2PptxWorker]" = queue.Queue()
+        for worker in self.workers:
+            self._idle.put(worker)
+        self._executor = ThreadPoolExecutor(max_workers=len(self.workers))
+
+    def __enter__(self) -> "Html2PptxPool":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        self.close(cancel=exc_type is not None)
+
+    def submit(
+        self, slides: List[Path], output: Path, layout: Optional[str] = None
+    ) -> "Future[Dict[str, Any]]":
+        """Queue a deck for conversion; the future resolves to the worker's response."""
+        return self._executor.submit(self._convert, slides, output, layout)
+
+    def close(self, cancel: bool = False) -> None:
+        """Wait for queued decks (or cancel those not started), then stop all workers."""
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
+        for worker in self.workers:
+            worker.close()
+
+    def _convert(
+        self, slides: List[Path], output: Path, layout: Optional[str]
+    ) -> Dict[str, Any]:
+        worker = self._idle.get()
+        try:
+            return worker.convert(slides, output, layout)
+        finally:
+            self._idle.put(worker)
+
+
+def submit_batch_item(
+    pool: Html2PptxPool,
+    line_number: int,
+    line: str,
+    slides_dir: Path,
+    outputs: BatchOutputs,
+) -> Tuple[Path, "Future[Dict[str, Any]]"]:
+    """Parse one line of a batch file, claim its output file and queue its deck.
+
+    Returns:
+        The output path (the output directory joined with the line's
+        "output") and a future resolving to the worker's response
+
+    Raises:
+        ValueError: If the line is invalid, or its output is outside the
+            output directory or already used by another line or the results
+    """
+    item = json.loads(line)
+    if not isinstance(item, dict) or not isinstance(item.get("slides"), list):
+        raise ValueError('Expected an object with a "slides" array')
+    # The worker creates the output's directory once the deck is converted
+    output_file = outputs.claim(
+        item.get("output", f"deck-{line_number}.pptx"), line_number
+    )
+    slides = [slides_dir / slide for slide in item["slides"]]
+    return output_file, pool.submit(slides, output_file, item.get("layout"))
+
+
+def inventory_deck(pptx_file: Path, inventory_file: Optional[Path]) -> Dict[str, Any]:
+    """Inventory a converted deck and summarize its text shapes and issues.
+
+    Returns:
+        "text_shapes", the number of text shapes, and "issues", the IDs of
+        shapes with overflow, overlap or warnings per slide (if any)
+    """
+    inventory = get_inventory_as_dict(pptx_file)
+    if inventory_file:
+        save_inventory_dict(inventory, inventory_file)
+
+    summary: Dict[str, Any] = {
+        "text_shapes": sum(len(shapes) for shapes in inventory.values())
+    }
+    issues = {
+        slide_key: shape_keys
+        for slide_key, shapes in inventory.items()
+        if (
+            shape_keys := [
+                shape_key
+                for shape_key, shape_dict in shapes.items()
+                if shape_dict_has_issues(shape_dict)
+            ]
+        )
+    }
+    if issues:
+        summary["issues"] = issues
+    return summary
+
+
+def convert_batch(
+    jsonl_file: str,
+    output_dir: str,
+    results_file: Optional[str] = None,
+    workers: Optional[int] = 1,
+    save_inventories: bool = False,
+    node: str = "node",
+) -> Dict[str, int]:
+    """Convert one deck per line of a JSONL file and inventory each result.
+
+    All decks are queued up front and converted concurrently by the worker
+    pool; results are collected in input order, and each deck is inventoried
+    as soon as it is done, while the workers convert the remaining decks.
+
+    Args:
+        jsonl_file: One deck per line (see the module docstring)
+        output_dir: Directory output presentations are written to
+        results_file: JSON Lines file for per-line records
+            (default: results.jsonl in output_dir)
+        workers: Number of html2pptx workers (None or 0: one per CPU core)
+        save_inventories: Also write each deck's inventory next to it
+            (<deck>.inventory.json)
+        node: Node.js executable
+
+    Returns:
+        Counts of "ok" and "error" records
+    """
+    slides_dir = Path(jsonl_file).absolute().parent
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    results_path = Path(results_file) if results_file else output_path / "results.jsonl"
+    workers = workers or os.cpu_count() or 1
+
+    counts = {"ok": 0, "error": 0}
+    with Html2PptxPool(workers, node) as pool, open(
+        results_path, "w", encoding="utf-8"
+    ) as results:
+        outputs = BatchOutputs(output_path, results_path)
+        pending = []
+        for line_number, line in read_batch_lines(Path(jsonl_file)):
+            try:
+                deck, future = submit_batch_item(
+                    pool, line_number, line, slides_dir, outputs
+                )
+                pending.append((line_number, deck, future, None))
+            except Exception as e:
+                pending.append((line_number, None, None, e))
+
+        for line_number, deck, future, error in pending:
+            record: Dict[str, Any] = {"line": line_number}
+            try:
+                if error is not None:
+                    raise error
+                # Record the output as replace.py --batch does, not the
+                # worker's absolute path
+                record["output"] = str(deck)
+                response = future.result()  # type: ignore
+                response.pop("id", None)
+                response.pop("output", None)
+                record.update(response)
+                if record["status"] == "ok":
+                    inventory_file = (
+                        deck.with_suffix(".inventory.json")
+                        if save_inventories
+                        else None
+                    )
+                    record.update(inventory_deck(deck, inventory_file))
+            except Exception as e:
+                record["status"] = "error"
+                record["error"] = str(e)
+            counts[record["status"]] += 1
+            results.write(json.dumps(record, ensure_ascii=False) + "\n")
+            results.flush()
+
+    print(f"Converted {counts['ok']} presentation(s) to: {output_path}")
+    if counts["error"]:
+        print(f"  - Failed: {counts['error']} (see {results_path})")
+    print(f"Results saved to: {results_path}")
+    return counts
+
+
+def main():
+    """Main entry point for command-line usage."""
+    parser = argparse.ArgumentParser(
+        description="Convert decks from HTML slides with a pool of persistent html2pptx workers.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python html2pptx_batch.py decks.jsonl outputs/ --workers 4
+    Converts one deck per JSONL line ({"output": "deck.pptx", "slides":
+    ["a.html", "b.html"]}) with four workers, and writes per-line records
+    with placeholders and inventory issues to outputs/results.jsonl
+
+  python html2pptx_batch.py decks.jsonl outputs/ --inventory
+    Also writes each deck's text inventory next to it
+        """,
+    )
+    parser.add_argument("input", help="JSONL file with one deck per line")
+    parser.add_argument("output", help="Output directory")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Persistent html2pptx workers (default: 1; 0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--results",
+        metavar="PATH",
+        help="Per-line JSONL records (default: <output>/results.jsonl)",
+    )
+    parser.add_argument(
+        "--inventory",
+        action="store_true",
+        help="Write each deck's inventory to <deck>.inventory.json",
+    )
+    parser.add_argument(
+        "--node", default="node", help="Node.js executable (default: node)"
+    )
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"Error: Input file '{input_path}' not found")
+        sys.exit(1)
+
+    try:
+        counts = convert_batch(
+            str(input_path),
+            args.output,
+            args.results,
+            args.workers,
+            save_inventories=args.inventory,
+            node=args.node,
+        )
+        if counts["error"]:
+            sys.exit(1)
+    except Exception as e:
+        print(f"Error converting presentations: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,24 +16,55 @@ Classes:
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
+    extract_inventory_parallel: Same, as JSON-ready dicts, across worker processes
+    extract_inventory_cached: Same, recomputing only slides missing from a cache
+    iter_inventory_slides: Extract slide by slide, yielding each slide when done
     save_inventory: Save extracted data to JSON
+    save_inventory_ndjson: Save a stream of slides as NDJSON records
+    load_inventory_records: Read NDJSON records back into an inventory
 
 Usage:
     python inventory.py input.pptx output.json
+    python inventory.py input.pptx - --format ndjson
 """
 
 import argparse
 import json
-import platform
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
-
-from PIL import Image, ImageDraw, ImageFont
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from fonts import find_font_path
+from inventory_cache import (
+    INVENTORY_CACHE_ENV,
+    InventoryCache,
+    get_cache_path,
+    get_slide_keys,
+)
 from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
 from pptx.enum.text import PP_ALIGN
+from pptx.oxml.ns import qn
 from pptx.shapes.base import BaseShape
+from pptx.text.text import Font
+from pptx_reader import PresentationReader
+from spatial import SpatialIndex
+from textlayout import count_wrapped_lines
 
 # Type aliases for cleaner signatures
 JsonValue = Union[str, int, float, bool, None]
@@ -46,6 +77,12 @@ InventoryData = Dict[
 ]  # Dict of slide_id -> {shape_id -> ShapeData}
 InventoryDict = Dict[str, Dict[str, ShapeDict]]  # JSON-serializable inventory
 
+# Minimum overlap in inches (in each dimension) for shapes to count as overlapping
+OVERLAP_TOLERANCE = 0.05
+
+# NDJSON record granularities: one line per shape or one line per slide
+NDJSON_RECORDS = ("shape", "slide")
+
 
 def main():
     """Main entry point for command-line usage."""
@@ -60,6 +97,15 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py large-deck.pptx inventory.json --workers 0
+    Processes slides in parallel, one worker process per CPU core
+
+  python inventory.py template.pptx inventory.json --cache inventory-cache.json
+    Reuses cached results for slides whose content has not changed
+
+  python inventory.py large-deck.pptx - --format ndjson | edit.py | python replace.py large-deck.pptx - output.pptx
+    Streams one JSON record per shape to stdout as each slide is extracted
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -70,55 +116,119 @@ The output JSON includes:
     )
 
     parser.add_argument("input", help="Input PowerPoint file (.pptx)")
-    parser.add_argument("output", help="Output JSON file for inventory")
+    parser.add_argument(
+        "output", help="Output JSON file for inventory ('-' for stdout)"
+    )
     parser.add_argument(
         "--issues-only",
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for per-slide extraction (default: 1; 0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help=f"Inventory cache file; only slides changed since they were cached are "
+        f"re-extracted (default: ${INVENTORY_CACHE_ENV}, if set)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("json", "ndjson"),
+        default="json",
+        help="Output format: one JSON document, or NDJSON records written as "
+        "each slide is extracted (default: json)",
+    )
+    parser.add_argument(
+        "--records",
+        choices=NDJSON_RECORDS,
+        default="shape",
+        help="NDJSON record granularity: one line per shape or per slide "
+        "(default: shape)",
+    )
 
     args = parser.parse_args()
 
+    # Keep stdout clean for the inventory when writing it there
+    to_stdout = args.output == "-"
+    log = sys.stderr if to_stdout else sys.stdout
+
     input_path = Path(args.input)
     if not input_path.exists():
-        print(f"Error: Input file not found: {args.input}")
+        print(f"Error: Input file not found: {args.input}", file=log)
         sys.exit(1)
 
     if not input_path.suffix.lower() == ".pptx":
-        print("Error: Input must be a PowerPoint file (.pptx)")
+        print("Error: Input must be a PowerPoint file (.pptx)", file=log)
         sys.exit(1)
 
     try:
-        print(f"Extracting text inventory from: {args.input}")
+        print(f"Extracting text inventory from: {args.input}", file=log)
         if args.issues_only:
             print(
-                "Filtering to include only text shapes with issues (overflow/overlap)"
+                "Filtering to include only text shapes with issues (overflow/overlap)",
+                file=log,
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
 
         output_path = Path(args.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_inventory(inventory, output_path)
+        if not to_stdout:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if args.format == "ndjson":
+            slides = iter_inventory_slides(
+                input_path,
+                issues_only=args.issues_only,
+                workers=args.workers or None,
+                cache_path=get_cache_path(args.cache),
+            )
+            if to_stdout:
+                total_slides, total_shapes = save_inventory_ndjson(
+                    slides, sys.stdout, args.records
+                )
+            else:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    total_slides, total_shapes = save_inventory_ndjson(
+                        slides, f, args.records
+                    )
+        else:
+            inventory = get_inventory_as_dict(
+                input_path,
+                issues_only=args.issues_only,
+                workers=args.workers,
+                cache_path=args.cache,
+            )
+            if to_stdout:
+                json.dump(inventory, sys.stdout, indent=2, ensure_ascii=False)
+                sys.stdout.write("\n")
+            else:
+                save_inventory_dict(inventory, output_path)
+            total_slides = len(inventory)
+            total_shapes = sum(len(shapes) for shapes in inventory.values())
 
-        print(f"Output saved to: {args.output}")
+        if not to_stdout:
+            print(f"Output saved to: {args.output}")
 
         # Report statistics
-        total_slides = len(inventory)
-        total_shapes = sum(len(shapes) for shapes in inventory.values())
         if args.issues_only:
             if total_shapes > 0:
                 print(
-                    f"Found {total_shapes} text elements with issues in {total_slides} slides"
+                    f"Found {total_shapes} text elements with issues in {total_slides} slides",
+                    file=log,
                 )
             else:
-                print("No issues discovered")
+                print("No issues discovered", file=log)
         else:
             print(
-                f"Found text in {total_slides} slides with {total_shapes} text elements"
+                f"Found text in {total_slides} slides with {total_shapes} text elements",
+                file=log,
             )
 
     except Exception as e:
-        print(f"Error processing presentation: {e}")
+        print(f"Error processing presentation: {e}", file=log)
         import traceback
 
         traceback.print_exc()
@@ -135,7 +245,30 @@ class ShapeWithPosition:
 
 
 class ParagraphData:
-    """Data structure for paragraph properties extracted from a PowerPoint paragraph."""
+    """Data structure for paragraph properties extracted from a PowerPoint paragraph.
+
+    Reading is side-effect free: run properties are read from the existing
+    XML without python-pptx's get-or-add accessors (run.font adds <a:rPr/>,
+    and font.color adds <a:solidFill/>), so a presentation can be inventoried
+    and then saved without picking up spurious formatting.
+    """
+
+    __slots__ = (
+        "text",
+        "bullet",
+        "level",
+        "alignment",
+        "space_before",
+        "space_after",
+        "font_name",
+        "font_size",
+        "bold",
+        "italic",
+        "underline",
+        "color",
+        "theme_color",
+        "line_spacing",
+    )
 
     def __init__(self, paragraph: Any):
         """Initialize from a PowerPoint paragraph object.
@@ -174,8 +307,12 @@ class ParagraphData:
                 if hasattr(paragraph, "level"):
                     self.level = paragraph.level
 
-        # Add alignment if not LEFT (default)
-        if hasattr(paragraph, "alignment") and paragraph.alignment is not None:
+        # Add alignment if not LEFT (default); paragraph.alignment would add an
+        # empty <a:pPr/> to paragraphs without one
+        has_pPr = (
+            getattr(paragraph, "_p", None) is not None and paragraph._p.pPr is not None
+        )
+        if has_pPr and paragraph.alignment is not None:
             alignment_map = {
                 PP_ALIGN.CENTER: "CENTER",
                 PP_ALIGN.RIGHT: "RIGHT",
@@ -190,11 +327,11 @@ class ParagraphData:
         if hasattr(paragraph, "space_after") and paragraph.space_after:
             self.space_after = paragraph.space_after.pt
 
-        # Extract font properties from first run
+        # Extract font properties from first run (only if it has run properties)
         if paragraph.runs:
-            first_run = paragraph.runs[0]
-            if hasattr(first_run, "font"):
-                font = first_run.font
+            rPr = paragraph.runs[0]._r.rPr
+            if rPr is not None:
+                font = Font(rPr)
                 if font.name:
                     self.font_name = font.name
                 if font.size:
@@ -207,17 +344,7 @@ class ParagraphData:
                     self.underline = font.underline
 
                 # Handle color - both RGB and theme colors
-                try:
-                    # Try RGB color first
-                    if font.color.rgb:
-                        self.color = str(font.color.rgb)
-                except (AttributeError, TypeError):
-                    # Fall back to theme color
-                    try:
-                        if font.color.theme_color:
-                            self.theme_color = font.color.theme_color.name
-                    except (AttributeError, TypeError):
-                        pass
+                self.color, self.theme_color = self._read_color(rPr)
 
         # Add line spacing if set
         if hasattr(paragraph, "line_spacing") and paragraph.line_spacing is not None:
@@ -228,6 +355,33 @@ class ParagraphData:
                 font_size = self.font_size if self.font_size else 12.0
                 self.line_spacing = round(paragraph.line_spacing * font_size, 2)
 
+    @staticmethod
+    def _read_color(rPr: Any) -> Tuple[Optional[str], Optional[str]]:
+        """Read a run's solid fill color as (RGB hex, theme color name).
+
+        Only sRGB and scheme colors are reported, as python-pptx's ColorFormat
+        would; other color types yield (None, None).
+        """
+        solid_fill = rPr.find(qn("a:solidFill"))
+        if solid_fill is None:
+            return None, None
+
+        srgb = solid_fill.find(qn("a:srgbClr"))
+        if srgb is not None:
+            try:
+                return str(RGBColor.from_string(srgb.get("val", ""))), None
+            except ValueError:
+                return None, None
+
+        scheme = solid_fill.find(qn("a:schemeClr"))
+        if scheme is not None:
+            try:
+                return None, MSO_THEME_COLOR.from_xml(scheme.get("val", "")).name
+            except ValueError:
+                return None, None
+
+        return None, None
+
     def to_dict(self) -> ParagraphDict:
         """Convert to dictionary for JSON serialization, excluding None values."""
         result: ParagraphDict = {"text": self.text}
@@ -264,7 +418,33 @@ class ParagraphData:
 
 
 class ShapeData:
-    """Data structure for shape properties extracted from a PowerPoint shape."""
+    """Data structure for shape properties extracted from a PowerPoint shape.
+
+    Instances are compact: attributes live in __slots__, positions and sizes
+    are stored as EMU integers (the rounded inch values are derived from
+    them), and paragraphs are read once when the shape is measured. The
+    python-pptx shape is only kept when asked for (keep_shape), so a large
+    inventory does not pin the presentation's object graph in memory.
+    """
+
+    __slots__ = (
+        "shape",
+        "shape_id",
+        "slide_width_emu",
+        "slide_height_emu",
+        "placeholder_type",
+        "default_font_size",
+        "left_emu",
+        "top_emu",
+        "width_emu",
+        "height_emu",
+        "paragraphs",
+        "frame_overflow_bottom",
+        "slide_overflow_right",
+        "slide_overflow_bottom",
+        "overlapping_shapes",
+        "warnings",
+    )
 
     @staticmethod
     def emu_to_inches(emu: int) -> float:
@@ -277,70 +457,23 @@ class ShapeData:
         return int(inches * dpi)
 
     @staticmethod
-    def get_font_path(font_name: str) -> Optional[str]:
+    def get_font_path(
+        font_name: str, bold: bool = False, italic: bool = False
+    ) -> Optional[str]:
         """Get the font file path for a given font name.
 
+        Lookups go through a font index built once per process (see fonts.py)
+        and are cached, so repeated names cost a dictionary lookup.
+
         Args:
             font_name: Name of the font (e.g., 'Arial', 'Calibri')
+            bold: Prefer a bold face when matching by family name
+            italic: Prefer an italic face when matching by family name
 
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
-        # Common font file variations to try
-        font_variations = [
-            font_name,
-            font_name.lower(),
-            font_name.replace(" ", ""),
-            font_name.replace(" ", "-"),
-        ]
-
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
-
-            # First try exact matches
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
-
-            # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
-
-        return None
+        return find_font_path(font_name, bold=bold, italic=italic)
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -391,6 +524,7 @@ class ShapeData:
         absolute_left: Optional[int] = None,
         absolute_top: Optional[int] = None,
         slide: Optional[Any] = None,
+        keep_shape: bool = False,
     ):
         """Initialize from a PowerPoint shape object.
 
@@ -399,8 +533,9 @@ class ShapeData:
             absolute_left: Absolute left position in EMUs (for shapes in groups)
             absolute_top: Absolute top position in EMUs (for shapes in groups)
             slide: Optional slide object to get dimensions and layout information
+            keep_shape: Keep a reference to the shape (e.g. to edit its text)
         """
-        self.shape = shape  # Store reference to original shape
+        self.shape = shape  # Released after measuring unless keep_shape is set
         self.shape_id: str = ""  # Will be set after sorting
 
         # Get slide dimensions from slide object
@@ -436,23 +571,24 @@ class ShapeData:
             else (shape.top if hasattr(shape, "top") else 0)
         )
 
-        self.left: float = round(self.emu_to_inches(left_emu), 2)  # type: ignore
-        self.top: float = round(self.emu_to_inches(top_emu), 2)  # type: ignore
-        self.width: float = round(
-            self.emu_to_inches(shape.width if hasattr(shape, "width") else 0),
-            2,  # type: ignore
-        )
-        self.height: float = round(
-            self.emu_to_inches(shape.height if hasattr(shape, "height") else 0),
-            2,  # type: ignore
-        )
-
-        # Store EMU positions for overflow calculations
+        # Store EMU positions; inch values are derived from them
         self.left_emu = left_emu
         self.top_emu = top_emu
         self.width_emu = shape.width if hasattr(shape, "width") else 0
         self.height_emu = shape.height if hasattr(shape, "height") else 0
 
+        # Read the non-empty paragraphs once, keeping their index and raw text
+        # for overflow estimation
+        self.paragraphs: List[ParagraphData] = []
+        paragraph_texts: List[Tuple[int, str]] = []
+        if shape and hasattr(shape, "text_frame"):
+            text_frame = shape.text_frame  # type: ignore
+            for para_idx, paragraph in enumerate(text_frame.paragraphs):
+                text = paragraph.text
+                if text.strip():
+                    self.paragraphs.append(ParagraphData(paragraph))
+                    paragraph_texts.append((para_idx, text))
+
         # Calculate overflow status
         self.frame_overflow_bottom: Optional[float] = None
         self.slide_overflow_right: Optional[float] = None
@@ -461,21 +597,32 @@ class ShapeData:
             str, float
         ] = {}  # Dict of shape_id -> overlap area in sq inches
         self.warnings: List[str] = []
-        self._estimate_frame_overflow()
+        self._estimate_frame_overflow(paragraph_texts)
         self._calculate_slide_overflow()
         self._detect_bullet_issues()
 
+        if not keep_shape:
+            self.shape = None
+
     @property
-    def paragraphs(self) -> List[ParagraphData]:
-        """Calculate paragraphs from the shape's text frame."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return []
+    def left(self) -> float:
+        """Left position in inches, rounded to 2 decimals."""
+        return round(self.emu_to_inches(self.left_emu), 2)
 
-        paragraphs = []
-        for paragraph in self.shape.text_frame.paragraphs:  # type: ignore
-            if paragraph.text.strip():
-                paragraphs.append(ParagraphData(paragraph))
-        return paragraphs
+    @property
+    def top(self) -> float:
+        """Top position in inches, rounded to 2 decimals."""
+        return round(self.emu_to_inches(self.top_emu), 2)
+
+    @property
+    def width(self) -> float:
+        """Width in inches, rounded to 2 decimals."""
+        return round(self.emu_to_inches(self.width_emu), 2)
+
+    @property
+    def height(self) -> float:
+        """Height in inches, rounded to 2 decimals."""
+        return round(self.emu_to_inches(self.height_emu), 2)
 
     def _get_default_font_size(self) -> int:
         """Get default font size from theme text styles or use conservative default."""
@@ -531,85 +678,46 @@ class ShapeData:
             self.inches_to_pixels(usable_height),
         )
 
-    def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
-        """Wrap a single line of text to fit within max_width_px."""
-        if not line:
-            return [""]
-
-        # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
-            return [line]
-
-        # Need to wrap - split into words
-        wrapped = []
-        words = line.split(" ")
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
-                current_line = test_line
-            else:
-                if current_line:
-                    wrapped.append(current_line)
-                current_line = word
-
-        if current_line:
-            wrapped.append(current_line)
+    def _estimate_frame_overflow(self, paragraph_texts: List[Tuple[int, str]]) -> None:
+        """Estimate if text overflows the shape bounds using PIL text measurement.
 
-        return wrapped
+        Wrapping and measurement go through the memoized engine in textlayout.py.
 
-    def _estimate_frame_overflow(self) -> None:
-        """Estimate if text overflows the shape bounds using PIL text measurement."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
+        Args:
+            paragraph_texts: (index, raw text) of each paragraph in self.paragraphs
+        """
+        if not paragraph_texts:
             return
 
         text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
-            return
 
         # Get usable dimensions after accounting for margins
         usable_width_px, usable_height_px = self._get_usable_dimensions(text_frame)
         if usable_width_px <= 0 or usable_height_px <= 0:
             return
 
-        # Set up PIL for text measurement
-        dummy_img = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
-
         # Get default font size from placeholder or use conservative estimate
         default_font_size = self._get_default_font_size()
 
         # Calculate total height of all paragraphs
         total_height_px = 0
 
-        for para_idx, paragraph in enumerate(text_frame.paragraphs):
-            if not paragraph.text.strip():
-                continue
-
-            para_data = ParagraphData(paragraph)
-
+        for (para_idx, text), para_data in zip(paragraph_texts, self.paragraphs):
             # Load font for this paragraph
             font_name = para_data.font_name or "Arial"
             font_size = int(para_data.font_size or default_font_size)
 
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
+            font_path = self.get_font_path(
+                font_name, bool(para_data.bold), bool(para_data.italic)
+            )
 
-            # Wrap all lines in this paragraph
-            all_wrapped_lines = []
-            for line in paragraph.text.split("\n"):
-                wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
-                all_wrapped_lines.extend(wrapped)
+            # Count wrapped lines in this paragraph
+            line_count = sum(
+                count_wrapped_lines(font_path, font_size, usable_width_px, line)
+                for line in text.split("\n")
+            )
 
-            if all_wrapped_lines:
+            if line_count:
                 # Calculate line height
                 if para_data.line_spacing:
                     # Custom line spacing explicitly set
@@ -623,7 +731,7 @@ class ShapeData:
                     total_height_px += para_data.space_before * 96 / 72
 
                 # Add paragraph text height
-                total_height_px += len(all_wrapped_lines) * line_height_px
+                total_height_px += line_count * line_height_px
 
                 # Add space_after
                 if para_data.space_after:
@@ -659,18 +767,11 @@ class ShapeData:
 
     def _detect_bullet_issues(self) -> None:
         """Detect bullet point formatting issues in paragraphs."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return
-
-        text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
-            return
-
         # Common bullet symbols that indicate manual bullets
         bullet_symbols = ["•", "●", "○"]
 
-        for paragraph in text_frame.paragraphs:
-            text = paragraph.text.strip()
+        for paragraph in self.paragraphs:
+            text = paragraph.text
             # Check for manual bullet symbols
             if text and any(text.startswith(symbol + " ") for symbol in bullet_symbols):
                 self.warnings.append(
@@ -849,7 +950,7 @@ def sort_shapes_by_position(shapes: List[ShapeData]) -> List[ShapeData]:
 def calculate_overlap(
     rect1: Tuple[float, float, float, float],
     rect2: Tuple[float, float, float, float],
-    tolerance: float = 0.05,
+    tolerance: float = OVERLAP_TOLERANCE,
 ) -> Tuple[bool, float]:
     """Calculate if and how much two rectangles overlap.
 
@@ -885,34 +986,37 @@ def detect_overlaps(shapes: List[ShapeData]) -> None:
     This function requires each ShapeData to have its shape_id already set.
     It modifies the shapes in-place, adding shape IDs with overlap areas in square inches.
 
+    Candidate pairs come from a sweep line over a spatial index, so only shapes
+    that overlap horizontally are compared. Pairs are visited in the same
+    order as an all-pairs comparison, which keeps the overlapping_shapes
+    dictionaries identical.
+
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
     """
-    n = len(shapes)
-
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
+    for i, shape in enumerate(shapes):
+        # Ensure shape IDs are set
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
 
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
+    rects = [(shape.left, shape.top, shape.width, shape.height) for shape in shapes]
+    index = SpatialIndex(rects)
 
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
-
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
+    for i, j in index.candidate_pairs(tolerance=OVERLAP_TOLERANCE):
+        overlaps, overlap_area = calculate_overlap(
+            rects[i], rects[j], OVERLAP_TOLERANCE
+        )
 
-            if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+        if overlaps:
+            # Add shape IDs with overlap area in square inches
+            shapes[i].overlapping_shapes[shapes[j].shape_id] = overlap_area
+            shapes[j].overlapping_shapes[shapes[i].shape_id] = overlap_area
 
 
 def extract_text_inventory(
-    pptx_path: Path, prs: Optional[Any] = None, issues_only: bool = False
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    keep_shapes: bool = False,
 ) -> InventoryData:
     """Extract text content from all slides in a PowerPoint presentation.
 
@@ -920,6 +1024,8 @@ def extract_text_inventory(
         pptx_path: Path to the PowerPoint file
         prs: Optional Presentation object to use. If not provided, will load from pptx_path.
         issues_only: If True, only include shapes that have overflow or overlap issues
+        keep_shapes: If True, ShapeData objects keep their python-pptx shape
+            (needed to modify the shapes afterwards)
 
     Returns a nested dictionary: {slide-N: {shape-N: ShapeData}}
     Shapes are sorted by visual position (top-to-bottom, left-to-right).
@@ -931,38 +1037,7 @@ def extract_text_inventory(
     inventory: InventoryData = {}
 
     for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
-
-        if not shapes_with_positions:
-            continue
-
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
-        ]
-
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
-
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
-
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
-
+        sorted_shapes = extract_slide_shapes(slide, issues_only, keep_shapes)
         if not sorted_shapes:
             continue
 
@@ -974,7 +1049,252 @@ def extract_text_inventory(
     return inventory
 
 
-def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
+def extract_slide_shapes(
+    slide: Any, issues_only: bool = False, keep_shapes: bool = False
+) -> List[ShapeData]:
+    """Extract the text shapes of one slide, sorted, with IDs and overlaps set.
+
+    Args:
+        slide: The slide to process
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        keep_shapes: If True, ShapeData objects keep their python-pptx shape
+
+    Returns:
+        ShapeData objects in visual order, with shape_id set to "shape-N"
+    """
+    # Collect all valid shapes from this slide with absolute positions
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    if not shapes_with_positions:
+        return []
+
+    # Convert to ShapeData with absolute positions and slide reference
+    shape_data_list = [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+            keep_shapes,
+        )
+        for swp in shapes_with_positions
+    ]
+
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
+
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
+
+    # Filter for issues only if requested (after overlap detection)
+    if issues_only:
+        sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+
+    return sorted_shapes
+
+
+def count_slides(pptx_path: Path) -> int:
+    """Count the slides of a presentation without loading it into python-pptx."""
+    with PresentationReader(pptx_path) as reader:
+        return reader.slide_count
+
+
+# Presentation loaded once per worker process by _init_inventory_worker
+_worker_prs: Optional[Any] = None
+
+
+def _init_inventory_worker(pptx_path: str) -> None:
+    """Load the presentation once in each worker process."""
+    global _worker_prs
+    _worker_prs = Presentation(pptx_path)
+
+
+def _inventory_slide_worker(task: Tuple[int, bool]) -> Dict[str, ShapeDict]:
+    """Build the JSON-serializable inventory of one slide in a worker process."""
+    slide_idx, issues_only = task
+    slide = _worker_prs.slides[slide_idx]  # type: ignore
+    return {
+        shape_data.shape_id: shape_data.to_dict()
+        for shape_data in extract_slide_shapes(slide, issues_only)
+    }
+
+
+def extract_slides_as_dicts(
+    pptx_path: Path,
+    slide_indices: List[int],
+    issues_only: bool = False,
+    workers: Optional[int] = 1,
+) -> List[Dict[str, ShapeDict]]:
+    """Extract JSON-serializable inventories of selected slides.
+
+    With more than one worker, slides are sharded across processes. Each
+    worker loads the presentation once and processes whole slides.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        slide_indices: Slide indices to extract, in the order results are returned
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        workers: Number of worker processes (None or 0: one per CPU core)
+
+    Returns:
+        One {shape_id: shape dict} mapping per requested slide (possibly empty)
+    """
+    return list(iter_slides_as_dicts(pptx_path, slide_indices, issues_only, workers))
+
+
+def iter_slides_as_dicts(
+    pptx_path: Path,
+    slide_indices: List[int],
+    issues_only: bool = False,
+    workers: Optional[int] = 1,
+) -> Iterator[Dict[str, ShapeDict]]:
+    """Extract JSON-serializable inventories of selected slides, one at a time.
+
+    Like extract_slides_as_dicts, but each slide's inventory is yielded as
+    soon as it (and every slide before it) has been extracted.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(slide_indices))
+    if workers <= 1:
+        if not slide_indices:
+            return
+        slides = list(Presentation(str(pptx_path)).slides)
+        for slide_idx in slide_indices:
+            yield {
+                shape_data.shape_id: shape_data.to_dict()
+                for shape_data in extract_slide_shapes(slides[slide_idx], issues_only)
+            }
+        return
+
+    tasks = [(slide_idx, issues_only) for slide_idx in slide_indices]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_inventory_worker,
+        initargs=(str(pptx_path),),
+    ) as executor:
+        # Several slides per task to amortize inter-process overhead
+        chunksize = max(1, len(tasks) // (workers * 4))
+        yield from executor.map(_inventory_slide_worker, tasks, chunksize=chunksize)
+
+
+def iter_inventory_slides(
+    pptx_path: Path,
+    issues_only: bool = False,
+    workers: Optional[int] = 1,
+    cache_path: Optional[Path] = None,
+) -> Iterator[Tuple[str, Dict[str, ShapeDict]]]:
+    """Extract a JSON-serializable inventory as a stream of slides.
+
+    Yields (slide key, {shape_id: shape dict}) for every slide with text
+    shapes, in slide order, as soon as the slide is extracted, so consumers
+    can start before the whole deck is done and nothing holds the whole
+    inventory. Collecting the stream into a dict gives get_inventory_as_dict's
+    result.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        workers: Number of worker processes (None or 0: one per CPU core)
+        cache_path: Inventory cache file, or None for no cache (unlike
+            get_inventory_as_dict, $PPTX_INVENTORY_CACHE is not consulted);
+            the cache is saved once the stream is exhausted
+    """
+    if not cache_path:
+        slide_indices = list(range(count_slides(pptx_path)))
+        slide_inventories = iter_slides_as_dicts(
+            pptx_path, slide_indices, issues_only, workers
+        )
+        for slide_idx, shapes in zip(slide_indices, slide_inventories):
+            if shapes:
+                yield f"slide-{slide_idx}", shapes
+        return
+
+    # Full slide inventories are cached, so issues_only filtering is applied
+    # afterwards and shares the same entries
+    cache = InventoryCache.load(cache_path)
+    keys = get_slide_keys(pptx_path)
+    slides = [cache.get(key) for key in keys]
+    missing = [slide_idx for slide_idx, slide in enumerate(slides) if slide is None]
+    extracted = iter_slides_as_dicts(pptx_path, missing, workers=workers)
+
+    for slide_idx, shapes in enumerate(slides):
+        if shapes is None:
+            # Missing slides are extracted in slide order
+            shapes = next(extracted)
+            cache.put(keys[slide_idx], shapes)
+        if issues_only:
+            shapes = {
+                shape_key: shape_dict
+                for shape_key, shape_dict in shapes.items()
+                if shape_dict_has_issues(shape_dict)
+            }
+        if shapes:
+            yield f"slide-{slide_idx}", shapes
+    cache.save()
+
+
+def extract_inventory_parallel(
+    pptx_path: Path, issues_only: bool = False, workers: Optional[int] = None
+) -> InventoryDict:
+    """Extract a JSON-serializable inventory, sharding slides across processes.
+
+    The per-slide results are merged in slide order, so the output is identical
+    to get_inventory_as_dict(). Workers send back each slide as shape
+    dictionaries, the form written to JSON, so this returns dictionaries.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        workers: Number of worker processes (default: one per CPU core)
+
+    Returns:
+        Nested dictionary with all data serialized for JSON
+    """
+    return dict(iter_inventory_slides(pptx_path, issues_only, workers=workers))
+
+
+def extract_inventory_cached(
+    pptx_path: Path,
+    cache_path: Path,
+    issues_only: bool = False,
+    workers: Optional[int] = 1,
+) -> InventoryDict:
+    """Extract a JSON-serializable inventory, reusing cached slide inventories.
+
+    Slides are looked up by a hash of their slide, layout and master parts
+    (see inventory_cache.py); only slides without a cache entry are extracted,
+    and the cache is updated with them. Full slide inventories are cached, so
+    issues_only filtering is applied afterwards and shares the same entries.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        cache_path: Inventory cache file (created if missing)
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        workers: Number of worker processes for slides that must be extracted
+
+    Returns:
+        Nested dictionary with all data serialized for JSON
+    """
+    return dict(
+        iter_inventory_slides(pptx_path, issues_only, workers, Path(cache_path))
+    )
+
+
+def shape_dict_has_issues(shape_dict: ShapeDict) -> bool:
+    """Check a serialized shape for issues, matching ShapeData.has_any_issues."""
+    return any(key in shape_dict for key in ("overflow", "overlap", "warnings"))
+
+
+def get_inventory_as_dict(
+    pptx_path: Path,
+    issues_only: bool = False,
+    workers: int = 1,
+    cache_path: Optional[Path] = None,
+) -> InventoryDict:
     """Extract text inventory and return as JSON-serializable dictionaries.
 
     This is a convenience wrapper around extract_text_inventory that returns
@@ -984,10 +1304,25 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     Args:
         pptx_path: Path to the PowerPoint file
         issues_only: If True, only include shapes that have overflow or overlap issues
+        workers: Number of worker processes; values above 1 use
+            extract_inventory_parallel (0 means one per CPU core)
+        cache_path: Inventory cache file (default: $PPTX_INVENTORY_CACHE, if set);
+            when set, only slides that changed since they were cached are extracted
 
     Returns:
         Nested dictionary with all data serialized for JSON
     """
+    cache_path = get_cache_path(cache_path)
+    if cache_path:
+        return extract_inventory_cached(
+            pptx_path, cache_path, issues_only=issues_only, workers=workers or None
+        )
+
+    if workers != 1:
+        return extract_inventory_parallel(
+            pptx_path, issues_only=issues_only, workers=workers or None
+        )
+
     inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
 
     # Convert ShapeData objects to dictionaries
@@ -1003,18 +1338,130 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
 def save_inventory(inventory: InventoryData, output_path: Path) -> None:
     """Save inventory to JSON file with proper formatting.
 
-    Converts ShapeData objects to dictionaries for JSON serialization.
+    Shapes are serialized one at a time straight to the file (see
+    iter_inventory_json), so the nested dictionary of the whole inventory is
+    never built. The output is identical to save_inventory_dict's.
     """
-    # Convert ShapeData objects to dictionaries
-    json_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
-        json_inventory[slide_key] = {
-            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
-        }
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.writelines(iter_inventory_json(inventory))
+
+
+def iter_inventory_json(
+    inventory: Union[InventoryData, InventoryDict],
+) -> Iterator[str]:
+    """Serialize an inventory as JSON text, one shape at a time.
+
+    Accepts ShapeData objects or shape dicts and yields chunks that together
+    equal json.dumps(dict_inventory, indent=2, ensure_ascii=False).
+    """
+    yield "{"
+    for slide_idx, (slide_key, shapes) in enumerate(inventory.items()):
+        yield f"{',' if slide_idx else ''}\n  {json.dumps(slide_key, ensure_ascii=False)}: {{"
+        for shape_idx, (shape_key, shape) in enumerate(shapes.items()):
+            shape_dict = shape.to_dict() if isinstance(shape, ShapeData) else shape
+            # Nested one level deeper than json.dumps indents it on its own
+            shape_json = json.dumps(shape_dict, indent=2, ensure_ascii=False)
+            yield (
+                f"{',' if shape_idx else ''}\n    "
+                f"{json.dumps(shape_key, ensure_ascii=False)}: "
+                + shape_json.replace("\n", "\n    ")
+            )
+        yield "\n  }" if shapes else "}"
+    yield "\n}" if inventory else "}"
+
 
+def save_inventory_dict(json_inventory: InventoryDict, output_path: Path) -> None:
+    """Save an already JSON-serializable inventory to a JSON file."""
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(json_inventory, f, indent=2, ensure_ascii=False)
 
 
+def iter_inventory_records(
+    slides: Iterable[Tuple[str, Dict[str, ShapeDict]]], records: str = "shape"
+) -> Iterator[Dict[str, Any]]:
+    """Flatten a stream of (slide key, shapes) into NDJSON records.
+
+    Args:
+        slides: (slide key, {shape_id: shape dict}) pairs, e.g. from
+            iter_inventory_slides or inventory.items()
+        records: "shape" for one record per shape ({"slide": ..., "shape": ...,
+            plus the shape's fields}), or "slide" for one record per slide
+            ({"slide": ..., "shapes": {...}})
+    """
+    if records not in NDJSON_RECORDS:
+        raise ValueError(f"Unknown record type: {records}")
+    for slide_key, shapes in slides:
+        if records == "slide":
+            yield {"slide": slide_key, "shapes": shapes}
+            continue
+        for shape_key, shape_dict in shapes.items():
+            yield {"slide": slide_key, "shape": shape_key, **shape_dict}
+
+
+def save_inventory_ndjson(
+    slides: Iterable[Tuple[str, Dict[str, ShapeDict]]],
+    output: TextIO,
+    records: str = "shape",
+) -> Tuple[int, int]:
+    """Write a stream of slides as NDJSON, one JSON record per line.
+
+    The output is flushed after every slide, so a consumer reading a pipe
+    sees each slide as soon as it has been extracted.
+
+    Returns:
+        (slide count, shape count) written
+    """
+    slide_count = shape_count = 0
+    for slide_key, shapes in slides:
+        for record in iter_inventory_records([(slide_key, shapes)], records):
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+        slide_count += 1
+        shape_count += len(shapes)
+    return slide_count, shape_count
+
+
+def load_inventory_records(
+    lines: Iterable[str], object_pairs_hook: Optional[Callable] = None
+) -> InventoryDict:
+    """Build an inventory dictionary from NDJSON lines, reading them one at a time.
+
+    Accepts shape and slide records (see iter_inventory_records), mixed freely;
+    blank lines are skipped. Shapes are kept in record order.
+
+    Args:
+        lines: NDJSON text lines, e.g. an open file or sys.stdin
+        object_pairs_hook: Passed to json.loads for every line
+
+    Raises:
+        ValueError: If a line is not a record or repeats a slide or shape
+    """
+    inventory: InventoryDict = {}
+    for line_num, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        record = json.loads(line, object_pairs_hook=object_pairs_hook)
+        if not isinstance(record, dict) or not isinstance(record.get("slide"), str):
+            raise ValueError(f"Line {line_num}: not an inventory record")
+
+        slide_key = record.pop("slide")
+        if "shape" not in record:
+            if slide_key in inventory or not isinstance(record.get("shapes"), dict):
+                raise ValueError(
+                    f"Line {line_num}: duplicate or invalid record for '{slide_key}'"
+                )
+            inventory[slide_key] = record["shapes"]
+            continue
+
+        shape_key = record.pop("shape")
+        shapes = inventory.setdefault(slide_key, {})
+        if shape_key in shapes:
+            raise ValueError(
+                f"Line {line_num}: duplicate record for '{shape_key}' on '{slide_key}'"
+            )
+        shapes[shape_key] = record
+    return inventory
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of per-slide text inventories.
+
+Each slide's inventory (the JSON-serializable shape dictionaries produced by
+inventory.py) is stored under a key derived from the content of the slide
+part, its slide layout and its slide master, plus the slide size and the
+installed fonts. Keys are computed by hashing the parts straight from the
+.pptx zip, without loading the presentation, so re-inventorying a deck only
+recomputes slides whose content (or inherited layout/master) changed. Since
+keys depend on content rather than position, reordered and duplicated slides
+are cache hits too.
+
+Set the PPTX_INVENTORY_CACHE environment variable to a JSON file path to
+enable the cache for inventory.py, replace.py and thumbnail.py, or pass a
+path explicitly.
+
+Classes:
+    InventoryCache: Persistent mapping of slide keys to slide inventories
+
+Main Functions:
+    get_slide_keys: Compute the cache key of every slide in a presentation
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from fonts import get_font_index
+from pptx_reader import SLIDE_LAYOUT_REL, SLIDE_MASTER_REL, PresentationReader
+
+# Environment variable naming the inventory cache file
+INVENTORY_CACHE_ENV = "PPTX_INVENTORY_CACHE"
+
+# Bump whenever inventory extraction changes what it produces for a slide
+CACHE_VERSION = 1
+
+# Maximum number of slide entries kept; least recently used entries are dropped
+MAX_ENTRIES = 5000
+
+
+class InventoryCache:
+    """Persistent mapping of slide keys to slide inventories.
+
+    Attributes:
+        path: JSON file the cache is loaded from and saved to
+        entries: Slide key -> {shape_id: shape dict}, least recently used first
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._modified = False
+
+    @classmethod
+    def load(cls, path: Path) -> "InventoryCache":
+        """Load a cache file; a missing, corrupt or outdated file yields an empty cache."""
+        cache = cls(path)
+        try:
+            data = json.loads(cache.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cache
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            cache.entries = data.get("slides", {})
+        return cache
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a slide inventory, marking it as recently used."""
+        slide = self.entries.pop(key, None)
+        if slide is not None:
+            self.entries[key] = slide
+        return slide
+
+    def put(self, key: str, slide: Dict[str, Any]) -> None:
+        """Store a slide inventory."""
+        self.entries.pop(key, None)
+        self.entries[key] = slide
+        self._modified = True
+
+    def save(self) -> None:
+        """Write the cache compactly and atomically, if anything was added."""
+        if not self._modified:
+            return
+
+        while len(self.entries) > MAX_ENTRIES:
+            del self.entries[next(iter(self.entries))]
+
+        data = {"version": CACHE_VERSION, "slides": self.entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps(data, separators=(",", ":"), ensure_ascii=False),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # The cache is an optimization only; the inventory is still valid
+            print(
+                f"Warning: Could not save inventory cache to {self.path}: {e}",
+                file=sys.stderr,
+            )
+        self._modified = False
+
+
+def get_cache_path(cache_path: Optional[Path] = None) -> Optional[Path]:
+    """Resolve the cache file from an explicit path or PPTX_INVENTORY_CACHE."""
+    if cache_path:
+        return Path(cache_path)
+    env_path = os.environ.get(INVENTORY_CACHE_ENV)
+    return Path(env_path) if env_path else None
+
+
+def get_slide_keys(pptx_path: Path) -> List[str]:
+    """Compute the cache key of every slide, in presentation order.
+
+    A key covers the slide part, its layout and master parts, the slide size
+    and the font environment used for text measurement.
+    """
+    with PresentationReader(pptx_path) as reader:
+        base = hashlib.sha1(f"v{CACHE_VERSION}".encode())
+        base.update("{}x{}".format(*reader.slide_size).encode())
+        base.update(font_signature().encode())
+
+        part_digests: Dict[str, str] = {}
+
+        def digest(part_name: Optional[str]) -> str:
+            if not part_name or part_name not in reader.names:
+                return ""
+            if part_name not in part_digests:
+                part_digests[part_name] = hashlib.sha1(
+                    reader.read(part_name)
+                ).hexdigest()
+            return part_digests[part_name]
+
+        keys = []
+        for slide_part in reader.slide_parts:
+            layout_part = reader.related_part(slide_part, SLIDE_LAYOUT_REL)
+            master_part = reader.related_part(layout_part, SLIDE_MASTER_REL)
+
+            key = base.copy()
+            for part_name in (slide_part, layout_part, master_part):
+                key.update(digest(part_name).encode())
+            keys.append(key.hexdigest())
+        return keys
+
+
+def font_signature() -> str:
+    """Summarize the installed fonts, so font changes invalidate measurements."""
+    dir_mtimes = get_font_index().dir_mtimes
+    return json.dumps(sorted(dir_mtimes.items(), key=lambda item: item[0]))
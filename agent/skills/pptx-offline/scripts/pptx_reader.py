@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Lightweight read-only access to a .pptx package.
+
+Loading a deck with python-pptx parses every part and builds its whole object
+graph, which costs seconds and a lot of memory on large decks. Many tasks only
+need a few facts: the slide list, the slide size, which slides are hidden, or
+a slide's relationships. PresentationReader reads presentation.xml and any
+other parts straight from the zip, only when asked, and parses each part at
+most once. Slide parts are not parsed at all to check whether they are hidden;
+only their root element is read.
+
+It can also write a copy of the deck containing only some slides (e.g. to
+render a selection) by rewriting presentation.xml and copying the parts the
+remaining slides still use as they are.
+
+Classes:
+    PresentationReader: Lazy, read-only view of a .pptx package
+
+Main Functions:
+    read_part_rels: Read a part's relationships straight from the .pptx zip
+    get_rels_name: Get the name of a part's relationships part
+"""
+
+import copy
+import posixpath
+import re
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lxml import etree
+
+PRESENTATIONML_NS = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+DRAWINGML_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+RELATIONSHIPS_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+OFFICE_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+SLIDE_LAYOUT_REL = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+)
+SLIDE_MASTER_REL = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideMaster"
+)
+
+PRESENTATION_PART = "ppt/presentation.xml"
+CONTENT_TYPES_PART = "[Content_Types].xml"
+MEDIA_PREFIX = "ppt/media/"
+
+# A slide-number field (<a:fld type="slidenum">), whose text depends on the
+# slide's position in the deck, and a slide-number placeholder, which shows the
+# field of its layout or master
+SLIDE_NUMBER_FIELD = re.compile(rb"""type=["']slidenum["']""")
+SLIDE_NUMBER_PLACEHOLDER = re.compile(rb"""<(?:\w+:)?ph\b[^>]*\btype=["']sldNum["']""")
+
+# Bytes read at a time when only a part's root element is needed
+ROOT_CHUNK_SIZE = 1024
+
+# Slide size python-pptx assumes when presentation.xml does not give one
+DEFAULT_SLIDE_WIDTH = 9144000
+DEFAULT_SLIDE_HEIGHT = 5143500
+
+
+class PresentationReader:
+    """Lazy, read-only view of a .pptx package.
+
+    Use it as a context manager (or call close()) to release the zip file.
+
+    Attributes:
+        path: The .pptx file
+        names: Names of all parts (zip entries) in the package
+    """
+
+    def __init__(self, pptx_path: Path):
+        self.path = Path(pptx_path)
+        self._zf = zipfile.ZipFile(self.path)
+        self.names = set(self._zf.namelist())
+        self._rels: Dict[str, Dict[str, Dict[str, str]]] = {}
+        self._presentation: Optional[etree._Element] = None
+        self._slide_parts: Optional[List[Optional[str]]] = None
+        self._slide_number_parts: Dict[str, bool] = {}
+
+    def __enter__(self) -> "PresentationReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._zf.close()
+
+    def read(self, part_name: str) -> bytes:
+        """Read a part's raw bytes."""
+        return self._zf.read(part_name)
+
+    def rels(self, part_name: str) -> Dict[str, Dict[str, str]]:
+        """Get a part's relationships as rId -> {"type", "target"}, read once."""
+        if part_name not in self._rels:
+            self._rels[part_name] = read_part_rels(self._zf, self.names, part_name)
+        return self._rels[part_name]
+
+    def related_part(self, part_name: Optional[str], rel_type: str) -> Optional[str]:
+        """Get the first part related to part_name by a relationship type."""
+        if not part_name:
+            return None
+        for rel in self.rels(part_name).values():
+            if rel["type"] == rel_type:
+                return rel["target"]
+        return None
+
+    @property
+    def presentation(self) -> etree._Element:
+        """The parsed presentation.xml root element."""
+        if self._presentation is None:
+            self._presentation = etree.fromstring(self.read(PRESENTATION_PART))
+        return self._presentation
+
+    @property
+    def slide_parts(self) -> List[Optional[str]]:
+        """Slide part names in presentation order (None for a dangling slide ID)."""
+        if self._slide_parts is None:
+            presentation_rels = self.rels(PRESENTATION_PART)
+            self._slide_parts = [
+                presentation_rels.get(sld_id.get(f"{OFFICE_REL_NS}id"), {}).get(
+                    "target"
+                )
+                for sld_id in self._sld_ids(self.presentation)
+            ]
+        return self._slide_parts
+
+    @property
+    def slide_count(self) -> int:
+        return len(self.slide_parts)
+
+    @property
+    def slide_size(self) -> Tuple[int, int]:
+        """Slide (width, height) in EMU."""
+        slide_size = self.presentation.find(f"{PRESENTATIONML_NS}sldSz")
+        if slide_size is None:
+            return DEFAULT_SLIDE_WIDTH, DEFAULT_SLIDE_HEIGHT
+        return (
+            int(slide_size.get("cx") or DEFAULT_SLIDE_WIDTH),
+            int(slide_size.get("cy") or DEFAULT_SLIDE_HEIGHT),
+        )
+
+    @property
+    def hidden_slides(self) -> set:
+        """0-based indices of hidden slides."""
+        return {
+            slide_idx
+            for slide_idx in range(self.slide_count)
+            if self.is_hidden(slide_idx)
+        }
+
+    @property
+    def first_slide_number(self) -> int:
+        """Number shown on the first slide by slide-number fields."""
+        return int(self.presentation.get("firstSlideNum") or 1)
+
+    def shows_slide_number(self, slide_idx: int) -> bool:
+        """Check whether a slide shows a slide number, which depends on its position.
+
+        That is the case when the slide has a slide-number field, or a
+        slide-number placeholder (showing the field of its layout or master),
+        or when its layout or master has a slide-number field outside a
+        placeholder. As in PowerPoint, slide-number placeholders of layouts and
+        masters only show on slides that have one. Layouts and masters are
+        checked once and remembered.
+        """
+        slide_part = self.slide_parts[slide_idx]
+        if slide_part not in self.names:
+            return False
+        slide_xml = self.read(slide_part)
+        if SLIDE_NUMBER_FIELD.search(slide_xml) or SLIDE_NUMBER_PLACEHOLDER.search(
+            slide_xml
+        ):
+            return True
+
+        layout_part = self.related_part(slide_part, SLIDE_LAYOUT_REL)
+        master_part = self.related_part(layout_part, SLIDE_MASTER_REL)
+        for part_name in (layout_part, master_part):
+            if not part_name or part_name not in self.names:
+                continue
+            if part_name not in self._slide_number_parts:
+                self._slide_number_parts[part_name] = self._has_fixed_slide_number(
+                    part_name
+                )
+            if self._slide_number_parts[part_name]:
+                return True
+        return False
+
+    def _has_fixed_slide_number(self, part_name: str) -> bool:
+        """Check a layout or master for a slide-number field outside placeholders."""
+        data = self.read(part_name)
+        if not SLIDE_NUMBER_FIELD.search(data):
+            return False
+        placeholder_path = (
+            f"{PRESENTATIONML_NS}nvSpPr/{PRESENTATIONML_NS}nvPr/{PRESENTATIONML_NS}ph"
+        )
+        for field in etree.fromstring(data).iter(f"{DRAWINGML_NS}fld"):
+            if field.get("type") != "slidenum":
+                continue
+            shape = next(field.iterancestors(f"{PRESENTATIONML_NS}sp"), None)
+            if shape is None or shape.find(placeholder_path) is None:
+                return True
+        return False
+
+    def is_hidden(self, slide_idx: int) -> bool:
+        """Check whether a slide is hidden, reading only its root element."""
+        part_name = self.slide_parts[slide_idx]
+        if part_name not in self.names:
+            return False
+        parser = etree.XMLPullParser(events=("start",))
+        with self._zf.open(part_name) as f:
+            while chunk := f.read(ROOT_CHUNK_SIZE):
+                parser.feed(chunk)
+                for _, element in parser.read_events():
+                    return element.get("show") == "0"
+        return False
+
+    def write_slide_selection(
+        self, slide_indices: Iterable[int], output_path: Path
+    ) -> None:
+        """Write a copy of the deck that contains only the given slides.
+
+        Other slides are removed from the slide list, and their relationships
+        from presentation.xml unless referenced elsewhere in it, matching
+        rearrange.delete_slides. As when python-pptx saves a deck, only parts
+        still reachable from the package root are written, so the media of
+        dropped slides is not copied. Other parts are copied unchanged.
+        """
+        keep = set(slide_indices)
+        presentation = copy.deepcopy(self.presentation)
+        removed_rids = set()
+        for slide_idx, sld_id in enumerate(self._sld_ids(presentation)):
+            if slide_idx not in keep:
+                removed_rids.add(sld_id.get(f"{OFFICE_REL_NS}id"))
+                sld_id.getparent().remove(sld_id)
+
+        # Keep relationships still referenced, e.g. by custom shows
+        referenced = {
+            value
+            for element in presentation.iter()
+            for name, value in element.attrib.items()
+            if name.startswith(OFFICE_REL_NS)
+        }
+        dropped_rids = removed_rids - referenced
+
+        reachable = self._reachable_parts(dropped_rids)
+        written = reachable | {
+            get_rels_name(part_name) for part_name in reachable | {""}
+        }
+        with zipfile.ZipFile(
+            output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as out:
+            for info in self._zf.infolist():
+                name = info.filename
+                if name == PRESENTATION_PART:
+                    data = etree.tostring(
+                        presentation, xml_declaration=True, encoding="UTF-8"
+                    )
+                elif name == get_rels_name(PRESENTATION_PART):
+                    data = self._filter_xml(
+                        name, lambda rel: rel.get("Id") not in dropped_rids
+                    )
+                elif name == CONTENT_TYPES_PART:
+                    data = self._filter_xml(
+                        name,
+                        lambda entry: entry.get("PartName") is None
+                        or entry.get("PartName").lstrip("/") in reachable,
+                    )
+                elif name in written:
+                    data = self.read(name)
+                else:
+                    continue
+                # Media is already compressed; deflating it again only costs time
+                out.writestr(
+                    name,
+                    data,
+                    zipfile.ZIP_STORED if name.startswith(MEDIA_PREFIX) else None,
+                )
+
+    def _reachable_parts(self, dropped_rids: set) -> set:
+        """Find parts reachable from the package root, skipping dropped slide rels."""
+        reachable: set = set()
+        stack = [""]  # The package itself
+        while stack:
+            part_name = stack.pop()
+            for rId, rel in self.rels(part_name).items():
+                if part_name == PRESENTATION_PART and rId in dropped_rids:
+                    continue
+                target = rel["target"]
+                if target in self.names and target not in reachable:
+                    reachable.add(target)
+                    stack.append(target)
+        return reachable
+
+    def _filter_xml(self, part_name: str, keep_child) -> bytes:
+        """Serialize a part without the root's children rejected by keep_child."""
+        root = etree.fromstring(self.read(part_name))
+        for child in list(root):
+            if not keep_child(child):
+                root.remove(child)
+        return etree.tostring(root, xml_declaration=True, encoding="UTF-8")
+
+    @staticmethod
+    def _sld_ids(presentation: etree._Element) -> List[etree._Element]:
+        return presentation.findall(
+            f"{PRESENTATIONML_NS}sldIdLst/{PRESENTATIONML_NS}sldId"
+        )
+
+
+def read_part_rels(
+    zf: zipfile.ZipFile, names: set, part_name: str
+) -> Dict[str, Dict[str, str]]:
+    """Read a part's relationships as rId -> {"type", "target"} with resolved targets.
+
+    The package's own relationships are read with part_name "".
+    """
+    directory = posixpath.dirname(part_name)
+    rels_name = get_rels_name(part_name)
+    if rels_name not in names:
+        return {}
+
+    rels = {}
+    for rel in etree.fromstring(zf.read(rels_name)).iter(
+        f"{RELATIONSHIPS_NS}Relationship"
+    ):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            resolved = target.lstrip("/")
+        else:
+            resolved = posixpath.normpath(posixpath.join(directory, target))
+        rels[rel.get("Id")] = {"type": rel.get("Type"), "target": resolved}
+    return rels
+
+
+def get_rels_name(part_name: str) -> str:
+    """Get the name of a part's relationships part ("" for the package's own)."""
+    directory, filename = posixpath.split(part_name)
+    return posixpath.join(directory, "_rels", f"{filename}.rels")
@@ -10,13 +10,18 @@ Slides can be repeated (e.g., 34 appears twice).
 """
 
 import argparse
+import re
 import shutil
 import sys
+from collections import Counter, deque
 from copy import deepcopy
 from pathlib import Path
 
-import six
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import XmlPart, _Relationship
+from pptx.opc.packuri import PackURI
 
 
 def main():
@@ -72,78 +77,149 @@ Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
         sys.exit(1)
 
 
-def duplicate_slide(pres, index):
-    """Duplicate a slide in the presentation."""
-    source = pres.slides[index]
-
-    # Use source's layout to preserve formatting
-    new_slide = pres.slides.add_slide(source.slide_layout)
-
-    # Collect all image and media relationships from the source slide
-    image_rels = {}
-    for rel_id, rel in six.iteritems(source.part.rels):
-        if "image" in rel.reltype or "media" in rel.reltype:
-            image_rels[rel_id] = rel
-
-    # CRITICAL: Clear placeholder shapes to avoid duplicates
-    for shape in new_slide.shapes:
-        sp = shape.element
-        sp.getparent().remove(sp)
-
-    # Copy all shapes from source
-    for shape in source.shapes:
-        el = shape.element
-        new_el = deepcopy(el)
-        new_slide.shapes._spTree.insert_element_before(new_el, "p:extLst")
-
-        # Handle picture shapes - need to update the blip reference
-        # Look for all blip elements (they can be in pic or other contexts)
-        # Using the element's own xpath method without namespaces argument
-        blips = new_el.xpath(".//a:blip[@r:embed]")
-        for blip in blips:
-            old_rId = blip.get(
-                "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed"
+# Relationship types whose targets are shared by reference between a slide and
+# its duplicates; every other internal part the slide owns (notes, charts and
+# their workbooks, embedded objects, diagrams, ...) is cloned
+SHARED_RELTYPES = {
+    RT.AUDIO,
+    RT.IMAGE,
+    RT.MEDIA,
+    RT.VIDEO,
+    RT.NOTES_MASTER,
+    RT.SLIDE,
+    RT.SLIDE_LAYOUT,
+    RT.SLIDE_MASTER,
+    RT.THEME,
+}
+
+
+class SlideDuplicator:
+    """Duplicate slides as whole parts, sharing media by reference.
+
+    A duplicate is a deep copy of the source slide part (shapes, background,
+    transitions and all) that keeps the source's relationship IDs, so no rId
+    inside the XML needs rewriting. Media and layout relationships point at
+    the same parts as the source; notes, charts, embedded objects and other
+    slide-owned parts are cloned recursively, with references back to the
+    source slide remapped to the duplicate. The relationship plan of each
+    source part is computed once, and part names, relationship IDs and slide
+    IDs are allocated from counters, so each copy costs O(size of the slide).
+    """
+
+    def __init__(self, pres):
+        self.pres = pres
+        self.package = pres.part.package
+        self._partnames = {str(part.partname) for part in self.package.iter_parts()}
+        self._next_partname_number = {}
+        self._plans = {}
+
+        pres_rIds = [int(rId[3:]) for rId in pres.part.rels if rId[3:].isdigit()]
+        self._next_pres_rId = max(pres_rIds, default=0) + 1
+        slide_ids = [sld_id.id for sld_id in pres.slides._sldIdLst]
+        self._next_slide_id = max(slide_ids, default=255) + 1
+
+    def duplicate(self, index):
+        """Append a duplicate of the slide at index and return the new slide."""
+        source_part = self.pres.slides[index].part
+        new_part = self._clone_part(source_part, {})
+
+        rId = f"rId{self._next_pres_rId}"
+        self._next_pres_rId += 1
+        self._add_rel(self.pres.part, rId, RT.SLIDE, RTM.INTERNAL, new_part)
+        self.pres.slides._sldIdLst._add_sldId(id=self._next_slide_id, rId=rId)
+        self._next_slide_id += 1
+
+        return new_part.slide
+
+    def _clone_part(self, part, clones):
+        """Clone part and the parts it owns; clones maps source to cloned parts."""
+        partname = self._allocate_partname(str(part.partname))
+        if isinstance(part, XmlPart):
+            new_part = type(part)(
+                partname, part.content_type, self.package, deepcopy(part._element)
             )
-            if old_rId in image_rels:
-                # Create a new relationship in the destination slide for this image
-                old_rel = image_rels[old_rId]
-                # get_or_add returns the rId directly, or adds and returns new rId
-                new_rId = new_slide.part.rels.get_or_add(
-                    old_rel.reltype, old_rel._target
-                )
-                # Update the blip's embed reference to use the new relationship ID
-                blip.set(
-                    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed",
-                    new_rId,
+        else:
+            new_part = type(part).load(
+                partname, part.content_type, self.package, part.blob
+            )
+        clones[part] = new_part
+
+        for rId, reltype, target_mode, target, shared in self._plan(part):
+            if not shared:
+                target = clones.get(target) or self._clone_part(target, clones)
+            else:
+                target = clones.get(target, target)
+            self._add_rel(new_part, rId, reltype, target_mode, target)
+        return new_part
+
+    def _plan(self, part):
+        """Get (rId, reltype, target mode, target, shared) for each relationship of a part."""
+        plan = self._plans.get(part)
+        if plan is None:
+            plan = [
+                (
+                    rId,
+                    rel.reltype,
+                    RTM.EXTERNAL if rel.is_external else RTM.INTERNAL,
+                    rel.target_ref if rel.is_external else rel.target_part,
+                    rel.is_external or rel.reltype in SHARED_RELTYPES,
                 )
+                for rId, rel in part.rels.items()
+            ]
+            self._plans[part] = plan
+        return plan
+
+    @staticmethod
+    def _add_rel(part, rId, reltype, target_mode, target):
+        """Add a relationship with a known rId, skipping the matching scan of get_or_add."""
+        rels = part.rels
+        rels._rels[rId] = _Relationship(
+            rels._base_uri, rId, reltype, target_mode, target
+        )
+
+    def _allocate_partname(self, partname):
+        """Allocate an unused part name numbered like partname, e.g. slide7.xml."""
+        match = re.match(r"^(.*?)(\d*)(\.[^./]+)$", partname)
+        if match:
+            prefix, _, ext = match.groups()
+        else:
+            prefix, ext = partname, ""
 
-    # Copy any additional image/media relationships that might be referenced elsewhere
-    for rel_id, rel in image_rels.items():
-        try:
-            new_slide.part.rels.get_or_add(rel.reltype, rel._target)
-        except Exception:
-            pass  # Relationship might already exist
+        number = self._next_partname_number.get((prefix, ext), 1)
+        while f"{prefix}{number}{ext}" in self._partnames:
+            number += 1
+        self._next_partname_number[(prefix, ext)] = number + 1
+        partname = f"{prefix}{number}{ext}"
+        self._partnames.add(partname)
+        return PackURI(partname)
 
-    return new_slide
 
+def duplicate_slide(pres, index):
+    """Duplicate a slide in the presentation."""
+    return SlideDuplicator(pres).duplicate(index)
 
-def delete_slide(pres, index):
-    """Delete a slide from the presentation."""
-    rId = pres.slides._sldIdLst[index].rId
-    pres.part.drop_rel(rId)
-    del pres.slides._sldIdLst[index]
 
+def delete_slides(pres, sld_ids):
+    """Delete slides from the presentation, given their sldId elements."""
+    sld_id_lst = pres.slides._sldIdLst
+    rIds = [sld_id.rId for sld_id in sld_ids]
+    for sld_id in sld_ids:
+        sld_id_lst.remove(sld_id)
 
-def reorder_slides(pres, slide_index, target_index):
-    """Move a slide from one position to another."""
-    slides = pres.slides._sldIdLst
+    # Drop the relationships once nothing references them, counting the
+    # remaining references in a single pass rather than once per slide
+    ref_counts = Counter(pres.part._element.xpath("//@r:id"))
+    for rId in rIds:
+        if ref_counts[rId] == 0:
+            pres.part.rels.pop(rId)
 
-    # Remove slide element from current position
-    slide_element = slides[slide_index]
-    slides.remove(slide_element)
 
-    # Insert at target position
-    slides.insert(target_index, slide_element)
+def set_slide_order(pres, sld_ids):
+    """Rewrite the slide list so it holds exactly sld_ids, in that order."""
+    sld_id_lst = pres.slides._sldIdLst
+    for sld_id in list(sld_id_lst):
+        sld_id_lst.remove(sld_id)
+    sld_id_lst.extend(sld_ids)
 
 
 def rearrange_presentation(template_path, output_path, slide_sequence):
@@ -169,57 +245,47 @@ def rearrange_presentation(template_path, output_path, slide_sequence):
         if idx < 0 or idx >= total_slides:
             raise ValueError(f"Slide index {idx} out of range (0-{total_slides - 1})")
 
-    # Track original slides and their duplicates
-    slide_map = []  # List of actual slide indices for final presentation
-    duplicated = {}  # Track duplicates: original_idx -> [duplicate_indices]
+    # Track slides by their sldId elements, so positions never need fixing up
+    # as slides are added, removed or moved
+    original_ids = list(prs.slides._sldIdLst)
+    occurrences = Counter(slide_sequence)
+    duplicated = {}  # Track duplicates: original_idx -> [duplicate sldIds]
+    final_ids = []  # sldId elements in final presentation order
+    duplicator = SlideDuplicator(prs)
 
     # Step 1: DUPLICATE repeated slides
     print(f"Processing {len(slide_sequence)} slides from template...")
     for i, template_idx in enumerate(slide_sequence):
-        if template_idx in duplicated and duplicated[template_idx]:
-            # Already duplicated this slide, use the duplicate
-            slide_map.append(duplicated[template_idx].pop(0))
+        if duplicated.get(template_idx):
+            # Already duplicated this slide, use the next duplicate
+            final_ids.append(duplicated[template_idx].popleft())
             print(f"  [{i}] Using duplicate of slide {template_idx}")
-        elif slide_sequence.count(template_idx) > 1 and template_idx not in duplicated:
+        elif occurrences[template_idx] > 1 and template_idx not in duplicated:
             # First occurrence of a repeated slide - create duplicates
-            slide_map.append(template_idx)
-            duplicates = []
-            count = slide_sequence.count(template_idx) - 1
+            final_ids.append(original_ids[template_idx])
+            count = occurrences[template_idx] - 1
             print(
                 f"  [{i}] Using original slide {template_idx}, creating {count} duplicate(s)"
             )
+            duplicates = deque()
             for _ in range(count):
-                duplicate_slide(prs, template_idx)
-                duplicates.append(len(prs.slides) - 1)
+                duplicator.duplicate(template_idx)
+                duplicates.append(prs.slides._sldIdLst[-1])
             duplicated[template_idx] = duplicates
         else:
-            # Unique slide or first occurrence already handled, use original
-            slide_map.append(template_idx)
+            # Unique slide, use original
+            final_ids.append(original_ids[template_idx])
             print(f"  [{i}] Using original slide {template_idx}")
 
-    # Step 2: DELETE unwanted slides (work backwards)
-    slides_to_keep = set(slide_map)
-    print(f"\nDeleting {len(prs.slides) - len(slides_to_keep)} unused slides...")
-    for i in range(len(prs.slides) - 1, -1, -1):
-        if i not in slides_to_keep:
-            delete_slide(prs, i)
-            # Update slide_map indices after deletion
-            slide_map = [idx - 1 if idx > i else idx for idx in slide_map]
-
-    # Step 3: REORDER to final sequence
-    print(f"Reordering {len(slide_map)} slides to final sequence...")
-    for target_pos in range(len(slide_map)):
-        # Find which slide should be at target_pos
-        current_pos = slide_map[target_pos]
-        if current_pos != target_pos:
-            reorder_slides(prs, current_pos, target_pos)
-            # Update slide_map: the move shifts other slides
-            for i in range(len(slide_map)):
-                if slide_map[i] > current_pos and slide_map[i] <= target_pos:
-                    slide_map[i] -= 1
-                elif slide_map[i] < current_pos and slide_map[i] >= target_pos:
-                    slide_map[i] += 1
-            slide_map[target_pos] = target_pos
+    # Step 2: DELETE unwanted slides in bulk
+    kept = set(final_ids)
+    unused_ids = [sld_id for sld_id in prs.slides._sldIdLst if sld_id not in kept]
+    print(f"\nDeleting {len(unused_ids)} unused slides...")
+    delete_slides(prs, unused_ids)
+
+    # Step 3: REORDER to final sequence with a single rewrite of sldIdLst
+    print(f"Reordering {len(final_ids)} slides to final sequence...")
+    set_slide_order(prs, final_ids)
 
     # Save the presentation
     prs.save(output_path)
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Render PowerPoint slides to images.
+
+Slides are converted to PDF with LibreOffice and rasterized with pdftoppm
+(Poppler). Compared to converting and rasterizing the whole deck at a fixed
+DPI, this pipeline:
+
+- Renders only the selected slides, by converting a sub-deck that contains
+  just those slides; when a selected slide shows a slide number, which a
+  sub-deck would change, the full deck is converted and only their pages
+  are rasterized
+- Never loads the deck into python-pptx: the slide list, slide size and
+  hidden slides are read straight from the zip (see pptx_reader.py), and the
+  sub-deck is written by rewriting presentation.xml only
+- Reuses a running LibreOffice instance across conversions and runs when the
+  Python UNO bridge (the "uno" module) is available, and otherwise keeps a
+  persistent LibreOffice profile so start-up skips first-run initialization
+- Rasterizes page ranges in parallel, one pdftoppm process per core
+- Renders straight at the requested pixel width instead of rendering at full
+  DPI and downscaling
+- Reuses cached images of unchanged slides (see render_cache.py), rendering
+  only slides whose content changed
+
+Set PPTX_SOFFICE_PROFILE to choose the LibreOffice profile directory.
+
+Classes:
+    SofficeConverter: PPTX to PDF conversion through LibreOffice
+
+Main Functions:
+    parse_slide_range: Parse a slide selection such as "0,3-5"
+    render_slides: Render selected slides to JPEG images
+"""
+
+import getpass
+import os
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from PIL import Image, ImageDraw
+from pptx_reader import PresentationReader
+from render_cache import RenderCache, get_render_cache_path, get_slide_render_keys
+
+# Environment variable naming the persistent LibreOffice profile directory
+SOFFICE_PROFILE_ENV = "PPTX_SOFFICE_PROFILE"
+
+# Seconds to wait for a LibreOffice instance to accept connections
+SOFFICE_START_TIMEOUT = 30
+
+# Seconds to wait for a single conversion
+CONVERSION_TIMEOUT = 300
+
+
+def parse_slide_range(spec: str, total_slides: int) -> List[int]:
+    """Parse a slide selection such as "0,3-5,9" into sorted 0-based indices.
+
+    Raises:
+        ValueError: If the selection is malformed or out of range
+    """
+    indices = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            if "-" in part:
+                start, end = (int(x) for x in part.split("-", 1))
+            else:
+                start = end = int(part)
+        except ValueError:
+            raise ValueError(f"Invalid slide range '{part}' (use e.g. 0,3-5)")
+        if start > end or start < 0 or end >= total_slides:
+            raise ValueError(
+                f"Slide range '{part}' out of range (0-{total_slides - 1})"
+            )
+        indices.update(range(start, end + 1))
+    return sorted(indices)
+
+
+def create_hidden_slide_placeholder(size):
+    """Create placeholder image for hidden slides."""
+    img = Image.new("RGB", size, color="#F0F0F0")
+    draw = ImageDraw.Draw(img)
+    line_width = max(5, min(size) // 100)
+    draw.line([(0, 0), size], fill="#CCCCCC", width=line_width)
+    draw.line([(size[0], 0), (0, size[1])], fill="#CCCCCC", width=line_width)
+    return img
+
+
+class SofficeConverter:
+    """PPTX to PDF conversion through LibreOffice.
+
+    With the UNO bridge available, documents are converted by a LibreOffice
+    instance listening on a named pipe. The instance is started on first use
+    and left running, so later conversions (in this and later runs) skip
+    start-up entirely. Without UNO, each conversion runs
+    `soffice --convert-to pdf` with a persistent profile directory.
+
+    Attributes:
+        profile_dir: LibreOffice user profile directory
+    """
+
+    def __init__(self, profile_dir: Optional[Path] = None):
+        user = getpass.getuser()
+        self.profile_dir = Path(
+            profile_dir
+            or os.environ.get(SOFFICE_PROFILE_ENV)
+            or Path(tempfile.gettempdir()) / f"pptx-offline-soffice-{user}"
+        )
+        self.pipe_name = f"pptx-offline-soffice-{user}"
+        self._desktop = None
+
+    def convert_to_pdf(self, pptx_path: Path, output_dir: Path) -> Path:
+        """Convert a presentation to PDF in output_dir and return the PDF path."""
+        pdf_path = output_dir / f"{pptx_path.stem}.pdf"
+        desktop = self._get_desktop()
+        if desktop is not None:
+            self._convert_uno(desktop, pptx_path, pdf_path)
+        else:
+            self._convert_cli(pptx_path, output_dir)
+        if not pdf_path.exists():
+            raise RuntimeError("PDF conversion failed")
+        return pdf_path
+
+    def _soffice_args(self) -> List[str]:
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        return [
+            "soffice",
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--norestore",
+            f"-env:UserInstallation={self.profile_dir.absolute().as_uri()}",
+        ]
+
+    def _convert_cli(self, pptx_path: Path, output_dir: Path) -> None:
+        result = subprocess.run(
+            self._soffice_args()
+            + ["--convert-to", "pdf", "--outdir", str(output_dir), str(pptx_path)],
+            capture_output=True,
+            text=True,
+            timeout=CONVERSION_TIMEOUT,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"PDF conversion failed: {result.stderr.strip()}")
+
+    def _get_desktop(self):
+        """Connect to (starting if needed) the listening LibreOffice instance.
+
+        Returns None when the UNO bridge is not installed or the instance
+        cannot be reached, so callers fall back to the command line.
+        """
+        if self._desktop is not None:
+            return self._desktop
+        try:
+            import uno  # noqa: F401  (optional: python3-uno / LibreOffice's Python)
+        except ImportError:
+            return None
+
+        desktop = self._connect()
+        if desktop is None:
+            subprocess.Popen(
+                self._soffice_args()
+                + [
+                    f"--accept=pipe,name={self.pipe_name};urp;StarOffice.ComponentContext"
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,  # Keep running for later conversions
+            )
+            deadline = time.monotonic() + SOFFICE_START_TIMEOUT
+            while desktop is None and time.monotonic() < deadline:
+                time.sleep(0.25)
+                desktop = self._connect()
+        self._desktop = desktop
+        return desktop
+
+    def _connect(self):
+        import uno
+
+        try:
+            local_context = uno.getComponentContext()
+            resolver = local_context.ServiceManager.createInstanceWithContext(
+                "com.sun.star.bridge.UnoUrlResolver", local_context
+            )
+            context = resolver.resolve(
+                f"uno:pipe,name={self.pipe_name};urp;StarOffice.ComponentContext"
+            )
+            return context.ServiceManager.createInstanceWithContext(
+                "com.sun.star.frame.Desktop", context
+            )
+        except Exception:
+            return None
+
+    @staticmethod
+    def _convert_uno(desktop, pptx_path: Path, pdf_path: Path) -> None:
+        import uno
+        from com.sun.star.beans import PropertyValue  # type: ignore
+
+        def properties(**values):
+            props = []
+            for name, value in values.items():
+                prop = PropertyValue()
+                prop.Name, prop.Value = name, value
+                props.append(prop)
+            return tuple(props)
+
+        document = desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(str(pptx_path.absolute())),
+            "_blank",
+            0,
+            properties(Hidden=True, ReadOnly=True),
+        )
+        if document is None:
+            raise RuntimeError(f"LibreOffice could not open {pptx_path}")
+        try:
+            document.storeToURL(
+                uno.systemPathToFileUrl(str(pdf_path.absolute())),
+                properties(FilterName="impress_pdf_Export"),
+            )
+        finally:
+            document.close(True)
+
+
+def rasterize_pdf(
+    pdf_path: Path,
+    page_count: int,
+    output_dir: Path,
+    width: int,
+    workers: Optional[int] = None,
+    pages: Optional[List[int]] = None,
+) -> List[Path]:
+    """Rasterize PDF pages to JPEG at a pixel width, splitting pages across processes.
+
+    Args:
+        pages: 1-based pages to rasterize (default: all page_count pages)
+
+    Returns:
+        Image paths in page order
+    """
+    pages = sorted(pages) if pages else list(range(1, page_count + 1))
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pages)))
+    chunk_size = (len(pages) + workers - 1) // workers
+    ranges = []
+    for start in range(0, len(pages), chunk_size):
+        # One pdftoppm run per stretch of consecutive pages in the chunk
+        chunk = pages[start : start + chunk_size]
+        first = previous = chunk[0]
+        for page in chunk[1:]:
+            if page != previous + 1:
+                ranges.append((first, previous))
+                first = page
+            previous = page
+        ranges.append((first, previous))
+
+    def run(page_range):
+        first, last = page_range
+        result = subprocess.run(
+            [
+                "pdftoppm",
+                "-jpeg",
+                "-f",
+                str(first),
+                "-l",
+                str(last),
+                "-scale-to-x",
+                str(width),
+                "-scale-to-y",
+                "-1",
+                str(pdf_path),
+                str(output_dir / "page"),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError("Image conversion failed")
+
+    # pdftoppm does the work, so threads are enough to use every core
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(run, ranges))
+
+    # pdftoppm names pages page-<n>.jpg, zero-padded to the page count width
+    return sorted(
+        output_dir.glob("page-*.jpg"), key=lambda p: int(p.stem.rsplit("-", 1)[1])
+    )
+
+
+def render_slides(
+    pptx_path: Path,
+    output_dir: Path,
+    width: int,
+    slide_indices: Optional[List[int]] = None,
+    converter: Optional[SofficeConverter] = None,
+    workers: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+) -> Dict[int, Path]:
+    """Render slides to JPEG images at a pixel width.
+
+    Hidden slides are not rendered; they get a crossed-out placeholder image.
+    With a render cache, slides with a cached image for their current content
+    are not rendered either, and identical slides are rendered once.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        output_dir: Directory for the images (and intermediate files)
+        width: Image width in pixels; height follows the slide aspect ratio
+        slide_indices: 0-based slides to render (default: all)
+        converter: LibreOffice converter to reuse (default: a new one)
+        workers: Parallel rasterization processes (default: one per CPU core)
+        cache_dir: Render cache directory (default: $PPTX_RENDER_CACHE, if set)
+
+    Returns:
+        Mapping of slide index to image path (possibly inside the cache), in
+        slide order
+    """
+    # Read slide facts straight from the zip instead of loading the deck
+    with PresentationReader(pptx_path) as reader:
+        total_slides = reader.slide_count
+        hidden = reader.hidden_slides
+        slide_width, slide_height = reader.slide_size
+    if slide_indices is None:
+        slide_indices = list(range(total_slides))
+    visible = [i for i in slide_indices if i not in hidden]
+    height = round(width * slide_height / slide_width)
+
+    images: Dict[int, Path] = {}
+    to_render = visible
+    cache_path = get_render_cache_path(cache_dir)
+    if cache_path and visible:
+        cache = RenderCache(cache_path)
+        keys = get_slide_render_keys(pptx_path, width)
+        first_with_key: Dict[str, int] = {}
+        for slide_idx in visible:
+            cached_image = cache.get(keys[slide_idx])
+            if cached_image is not None:
+                images[slide_idx] = cached_image
+            else:
+                first_with_key.setdefault(keys[slide_idx], slide_idx)
+        to_render = sorted(first_with_key.values())
+        print(f"Render cache: {len(visible) - len(to_render)} hit(s)")
+
+    if to_render:
+        # LibreOffice leaves hidden slides out of the PDF, so the full deck can
+        # be converted as-is when every visible slide is wanted
+        all_visible = [i for i in range(total_slides) if i not in hidden]
+        source = pptx_path
+        page_count = len(all_visible)
+        deck_pages = None
+        if to_render != all_visible:
+            with PresentationReader(pptx_path) as reader:
+                if any(reader.shows_slide_number(i) for i in to_render):
+                    # A sub-deck would renumber these slides: convert the full
+                    # deck and rasterize only their pages
+                    page_of = {slide: n for n, slide in enumerate(all_visible, 1)}
+                    deck_pages = [page_of[i] for i in to_render]
+                else:
+                    source = output_dir / f"{pptx_path.stem}-selection.pptx"
+                    reader.write_slide_selection(to_render, source)
+                    page_count = len(to_render)
+
+        converter = converter or SofficeConverter()
+        pdf_path = converter.convert_to_pdf(source, output_dir)
+        pages = rasterize_pdf(
+            pdf_path, page_count, output_dir, width, workers, deck_pages
+        )
+        if len(pages) != len(to_render):
+            raise RuntimeError(
+                f"Expected {len(to_render)} rendered slides, got {len(pages)}"
+            )
+        images.update(zip(to_render, pages))
+
+        if cache_path:
+            for slide_idx, page in zip(to_render, pages):
+                images[slide_idx] = cache.put(keys[slide_idx], page)
+            for slide_idx in visible:
+                if slide_idx not in images:
+                    # Identical to a slide rendered above
+                    images[slide_idx] = images[first_with_key[keys[slide_idx]]]
+            cache.prune()
+
+    if visible:
+        with Image.open(images[visible[0]]) as img:
+            width, height = img.size
+
+    for slide_idx in slide_indices:
+        if slide_idx in hidden:
+            placeholder_path = output_dir / f"hidden-{slide_idx:03d}.jpg"
+            create_hidden_slide_placeholder((width, height)).save(
+                placeholder_path, "JPEG"
+            )
+            images[slide_idx] = placeholder_path
+
+    return {slide_idx: images[slide_idx] for slide_idx in slide_indices}
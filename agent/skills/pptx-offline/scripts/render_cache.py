@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of rendered slide images.
+
+Each rendered slide is stored as a JPEG under a key derived from everything
+that affects how it looks: the slide part, every part it depends on (its
+layout, master and theme, images and other media, charts, embedded objects,
+...), the slide size, the installed fonts and the render width. Keys are
+computed by hashing the parts straight from the .pptx zip, so after an edit
+only slides whose content or dependencies changed are rendered again. Since
+keys depend on content rather than position, reordered and duplicated slides
+are cache hits too, except for slides showing a slide number (see
+PresentationReader.shows_slide_number): their keys include their position.
+
+Set the PPTX_RENDER_CACHE environment variable to a directory to enable the
+cache for thumbnail.py, or pass a directory explicitly.
+
+Classes:
+    RenderCache: Directory of rendered slide images addressed by slide key
+
+Main Functions:
+    get_slide_render_keys: Compute the render key of every slide in a presentation
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from inventory_cache import font_signature
+from pptx_reader import PresentationReader
+
+# Environment variable naming the render cache directory
+RENDER_CACHE_ENV = "PPTX_RENDER_CACHE"
+
+# Bump whenever rendering changes what it produces for a slide
+CACHE_VERSION = 1
+
+# Maximum number of images kept; least recently used images are dropped
+MAX_ENTRIES = 5000
+
+OFFICE_REL_TYPES = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+)
+
+# Relationships that do not affect how a slide looks: speaker notes, links to
+# other slides, comments, and (below) a master's list of all its layouts
+IGNORED_RELS = {
+    OFFICE_REL_TYPES + "notesSlide",
+    OFFICE_REL_TYPES + "slide",
+    OFFICE_REL_TYPES + "comments",
+}
+MASTER_LAYOUT_REL = OFFICE_REL_TYPES + "slideLayout"
+SLIDE_MASTER_PREFIX = "ppt/slideMasters/"
+
+
+class RenderCache:
+    """Directory of rendered slide images addressed by slide key.
+
+    Attributes:
+        path: Cache directory
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def get(self, key: str) -> Optional[Path]:
+        """Get the cached image for a key, marking it as recently used."""
+        image_path = self.path / f"{key}.jpg"
+        try:
+            os.utime(image_path)
+        except OSError:
+            return None
+        return image_path
+
+    def put(self, key: str, image_path: Path) -> Path:
+        """Store a copy of a rendered image (written atomically) and return its path."""
+        cached_path = self.path / f"{key}.jpg"
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path / f"{key}.{os.getpid()}.tmp"
+            shutil.copyfile(image_path, tmp_path)
+            os.replace(tmp_path, cached_path)
+        except OSError as e:
+            # The cache is an optimization only; the rendered image is still valid
+            print(f"Warning: Could not save render cache entry to {self.path}: {e}")
+            return image_path
+        return cached_path
+
+    def prune(self) -> None:
+        """Drop the least recently used images beyond MAX_ENTRIES."""
+        try:
+            entries = sorted(
+                self.path.glob("*.jpg"), key=lambda p: p.stat().st_mtime_ns
+            )
+            for image_path in entries[: max(0, len(entries) - MAX_ENTRIES)]:
+                image_path.unlink()
+        except OSError:
+            pass
+
+
+def get_render_cache_path(cache_path: Optional[Path] = None) -> Optional[Path]:
+    """Resolve the cache directory from an explicit path or PPTX_RENDER_CACHE."""
+    if cache_path:
+        return Path(cache_path)
+    env_path = os.environ.get(RENDER_CACHE_ENV)
+    return Path(env_path) if env_path else None
+
+
+def get_slide_render_keys(pptx_path: Path, width: int) -> List[str]:
+    """Compute the render key of every slide, in presentation order.
+
+    A key covers the slide part and all parts it depends on (followed through
+    relationships, e.g. slide -> layout -> master -> theme, slide -> chart ->
+    embedded workbook), the slide size, the font environment and the width.
+    Keys of slides that show a slide number also cover their position.
+    """
+    with PresentationReader(pptx_path) as reader:
+        hidden = reader.hidden_slides
+        base = hashlib.sha1(f"render-v{CACHE_VERSION}-{width}".encode())
+        base.update("{}x{}".format(*reader.slide_size).encode())
+        base.update(font_signature().encode())
+
+        part_digests: Dict[str, str] = {}
+
+        def digest(part_name: str) -> str:
+            if part_name not in part_digests:
+                part_digests[part_name] = hashlib.sha1(
+                    reader.read(part_name)
+                ).hexdigest()
+            return part_digests[part_name]
+
+        keys = []
+        for slide_idx, slide_part in enumerate(reader.slide_parts):
+            # Walk the slide's dependencies depth first, in rId order, hashing
+            # each part's content and relationship types once. Part names are
+            # left out, so duplicated slides share keys.
+            key = base.copy()
+            visited = set()
+            stack = [slide_part] if slide_part in reader.names else []
+            while stack:
+                part_name = stack.pop()
+                if part_name in visited:
+                    continue
+                visited.add(part_name)
+                key.update(digest(part_name).encode())
+
+                is_master = part_name.startswith(SLIDE_MASTER_PREFIX)
+                for rId, rel in sorted(reader.rels(part_name).items(), reverse=True):
+                    if rel["type"] in IGNORED_RELS or (
+                        is_master and rel["type"] == MASTER_LAYOUT_REL
+                    ):
+                        continue
+                    key.update(f"{rId}>{rel['type']}".encode())
+                    if rel["target"] in reader.names:
+                        stack.append(rel["target"])
+
+            if reader.shows_slide_number(slide_idx):
+                # Hidden slides may or may not be counted, so both positions
+                visible_idx = slide_idx - sum(1 for i in hidden if i < slide_idx)
+                key.update(
+                    f"slidenum:{reader.first_slide_number}"
+                    f"+{slide_idx}/{visible_idx}".encode()
+                )
+            keys.append(key.hexdigest())
+        return keys
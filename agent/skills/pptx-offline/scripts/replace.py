@@ -3,23 +3,39 @@
 
 Usage:
     python replace.py <input.pptx> <replacements.json> <output.pptx>
+    python replace.py --batch <template.pptx> <replacements.jsonl> <output_dir>
 
-The replacements JSON should have the structure output by inventory.py.
-ALL text shapes identified by inventory.py will have their text cleared
+The replacements JSON should have the structure output by inventory.py;
+NDJSON records from inventory.py --format ndjson are accepted too, and "-"
+reads either from stdin. ALL text shapes identified by inventory.py will have their text cleared
 unless "paragraphs" is specified in the replacements for that shape.
+
+In batch mode each line of the JSONL file holds one replacement set; the
+template is loaded and inventoried once and forked in memory per line.
 """
 
+import argparse
+import io
+import itertools
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
-
-from inventory import InventoryData, extract_text_inventory
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from inventory import (
+    InventoryData,
+    ShapeData,
+    extract_text_inventory,
+    load_inventory_records,
+)
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_THEME_COLOR
 from pptx.enum.text import PP_ALIGN
 from pptx.oxml.xmlchemy import OxmlElement
+from pptx.shapes.shapetree import SlideShapeFactory
 from pptx.util import Pt
 
 
@@ -211,31 +227,71 @@ def check_duplicate_keys(pairs):
     return result
 
 
-def apply_replacements(pptx_file: str, json_file: str, output_file: str):
-    """Apply text replacements from JSON to PowerPoint presentation."""
+def load_replacements(json_file: str) -> Dict[str, Any]:
+    """Load replacements from a JSON or NDJSON file, or stdin for "-".
 
-    # Load presentation
-    prs = Presentation(pptx_file)
-
-    # Get inventory of all text shapes (returns ShapeData objects)
-    # Pass prs to use same Presentation instance
-    inventory = extract_text_inventory(Path(pptx_file), prs)
-
-    # Detect text overflow in original presentation
-    original_overflow = detect_frame_overflow(inventory)
+    NDJSON input (inventory.py --format ndjson records) is recognized by its
+    first line being a record, and is parsed line by line as it arrives, so
+    it can be piped in without being buffered as one document.
+    """
+    if json_file == "-":
+        return _read_replacements(sys.stdin)
+    with open(json_file, "r", encoding="utf-8") as f:
+        return _read_replacements(f)
 
-    # Load replacement data with duplicate key detection
-    with open(json_file, "r") as f:
-        replacements = json.load(f, object_pairs_hook=check_duplicate_keys)
 
+def _read_replacements(lines: Iterable[str]) -> Dict[str, Any]:
+    lines = iter(lines)
+    first_line = next((line for line in lines if line.strip()), "")
+    try:
+        record = json.loads(first_line, object_pairs_hook=check_duplicate_keys)
+    except ValueError:
+        record = None
+    if isinstance(record, dict) and isinstance(record.get("slide"), str):
+        return load_inventory_records(
+            itertools.chain([first_line], lines),
+            object_pairs_hook=check_duplicate_keys,
+        )
+    # A regular JSON document, possibly spanning many lines
+    return json.loads(
+        first_line + "".join(lines), object_pairs_hook=check_duplicate_keys
+    )
+
+
+def replace_text(
+    prs: Any,
+    inventory: InventoryData,
+    original_overflow: Dict[str, Dict[str, float]],
+    replacements: Dict,
+    shapes: Optional[Dict[str, Dict[str, Any]]] = None,
+    log: Callable[[str], None] = print,
+) -> Dict[str, int]:
+    """Clear all inventoried shapes and apply replacement paragraphs in place.
+
+    Args:
+        prs: Presentation to modify
+        inventory: Inventory of prs, or of the template prs was forked from
+        original_overflow: Frame overflow of the inventory (detect_frame_overflow)
+        replacements: Replacement data as loaded from the replacements JSON
+        shapes: slide_key -> shape_key -> shape in prs, for forked presentations
+            (default: the shapes referenced by the inventory)
+        log: Function receiving validation and issue messages
+
+    Returns:
+        Counts of shapes processed, cleared and replaced
+
+    Raises:
+        ValueError: If replacements reference unknown shapes, or text overflow
+            got worse or formatting warnings appeared after replacement
+    """
     # Validate replacements
     errors = validate_replacements(inventory, replacements)
     if errors:
-        print("ERROR: Invalid shapes in replacement JSON:")
+        log("ERROR: Invalid shapes in replacement JSON:")
         for error in errors:
-            print(f"  - {error}")
-        print("\nPlease check the inventory and update your replacement JSON.")
-        print(
+            log(f"  - {error}")
+        log("\nPlease check the inventory and update your replacement JSON.")
+        log(
             "You can regenerate the inventory with: python inventory.py <input.pptx> <output.json>"
         )
         raise ValueError(f"Found {len(errors)} validation error(s)")
@@ -245,6 +301,9 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
     shapes_cleared = 0
     shapes_replaced = 0
 
+    # Inventory of the replaced shapes, re-measured after their text changes
+    updated_inventory: InventoryData = {}
+
     # Process each slide from inventory
     for slide_key, shapes_dict in inventory.items():
         if not slide_key.startswith("slide-"):
@@ -253,17 +312,18 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
         slide_index = int(slide_key.split("-")[1])
 
         if slide_index >= len(prs.slides):
-            print(f"Warning: Slide {slide_index} not found")
+            log(f"Warning: Slide {slide_index} not found")
             continue
+        slide = prs.slides[slide_index]
 
         # Process each shape from inventory
         for shape_key, shape_data in shapes_dict.items():
             shapes_processed += 1
 
-            # Get the shape directly from ShapeData
-            shape = shape_data.shape
+            # Get the shape from ShapeData, or its counterpart in a fork
+            shape = shapes[slide_key][shape_key] if shapes else shape_data.shape
             if not shape:
-                print(f"Warning: {shape_key} has no shape reference")
+                log(f"Warning: {shape_key} has no shape reference")
                 continue
 
             # ShapeData already validates text_frame in __init__
@@ -288,20 +348,15 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
                 apply_paragraph_properties(p, para_data)
 
-    # Check for issues after replacements
-    # Save to a temporary file and reload to avoid modifying the presentation during inventory
-    # (extract_text_inventory accesses font.color which adds empty <a:solidFill/> elements)
-    import tempfile
+            # Re-measure the shape in memory, keeping its original position
+            # and ID (inventory reads do not modify the presentation)
+            updated_inventory.setdefault(slide_key, {})[shape_key] = ShapeData(
+                shape, shape_data.left_emu, shape_data.top_emu, slide
+            )
 
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        prs.save(str(tmp_path))
-
-    try:
-        updated_inventory = extract_text_inventory(tmp_path)
-        updated_overflow = detect_frame_overflow(updated_inventory)
-    finally:
-        tmp_path.unlink()  # Clean up temp file
+    # Check for issues after replacements. Cleared shapes have no text, so only
+    # replaced shapes can overflow or carry warnings.
+    updated_overflow = detect_frame_overflow(updated_inventory)
 
     # Check if any text overflow got worse
     overflow_errors = []
@@ -328,51 +383,414 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
     # Fail if there are any issues
     if overflow_errors or warnings:
-        print("\nERROR: Issues detected in replacement output:")
+        log("\nERROR: Issues detected in replacement output:")
         if overflow_errors:
-            print("\nText overflow worsened:")
+            log("\nText overflow worsened:")
             for error in overflow_errors:
-                print(f"  - {error}")
+                log(f"  - {error}")
         if warnings:
-            print("\nFormatting warnings:")
+            log("\nFormatting warnings:")
             for warning in warnings:
-                print(f"  - {warning}")
-        print("\nPlease fix these issues before saving.")
+                log(f"  - {warning}")
+        log("\nPlease fix these issues before saving.")
         raise ValueError(
             f"Found {len(overflow_errors)} overflow error(s) and {len(warnings)} warning(s)"
         )
 
+    return {
+        "shapes_processed": shapes_processed,
+        "shapes_cleared": shapes_cleared,
+        "shapes_replaced": shapes_replaced,
+    }
+
+
+def apply_replacements(pptx_file: str, json_file: str, output_file: str):
+    """Apply text replacements from JSON to PowerPoint presentation."""
+
+    # Load presentation
+    prs = Presentation(pptx_file)
+
+    # Get inventory of all text shapes (returns ShapeData objects)
+    # Pass prs to use same Presentation instance; the shapes are edited below
+    inventory = extract_text_inventory(Path(pptx_file), prs, keep_shapes=True)
+
+    # Detect text overflow in original presentation
+    original_overflow = detect_frame_overflow(inventory)
+
+    # Load replacement data with duplicate key detection
+    replacements = load_replacements(json_file)
+
+    stats = replace_text(prs, inventory, original_overflow, replacements)
+
     # Save the presentation
     prs.save(output_file)
 
     # Report results
     print(f"Saved updated presentation to: {output_file}")
     print(f"Processed {len(prs.slides)} slides")
-    print(f"  - Shapes processed: {shapes_processed}")
-    print(f"  - Shapes cleared: {shapes_cleared}")
-    print(f"  - Shapes replaced: {shapes_replaced}")
+    print(f"  - Shapes processed: {stats['shapes_processed']}")
+    print(f"  - Shapes cleared: {stats['shapes_cleared']}")
+    print(f"  - Shapes replaced: {stats['shapes_replaced']}")
+
+
+def _element_path(element: Any) -> Tuple[int, ...]:
+    """Get the child indexes leading from the document root to an element."""
+    path = []
+    parent = element.getparent()
+    while parent is not None:
+        path.append(parent.index(element))
+        element, parent = parent, parent.getparent()
+    return tuple(reversed(path))
+
+
+def _resolve_element_path(root: Any, path: Tuple[int, ...]) -> Any:
+    """Follow child indexes from _element_path() down from a document root."""
+    element = root
+    for index in path:
+        element = element[index]
+    return element
+
+
+class ReplacementTemplate:
+    """A template presentation loaded and inventoried once for many replacement sets.
+
+    Each replacement set is applied to a fork: a fresh Presentation parsed from
+    the template bytes kept in memory. Shapes in a fork are located through
+    element paths recorded from the template inventory, so forks skip the disk
+    read, the inventory and its text measurement. Validation and the original
+    overflow baseline come from the template inventory.
+
+    Attributes:
+        pptx_file: Path of the template presentation
+        inventory: Inventory of the template (its shapes are never modified)
+        original_overflow: Frame overflow of the template inventory
+    """
+
+    def __init__(self, pptx_file: str):
+        self.pptx_file = str(pptx_file)
+        self._data = Path(pptx_file).read_bytes()
+        prs = Presentation(io.BytesIO(self._data))
+        self.inventory = extract_text_inventory(Path(pptx_file), prs, keep_shapes=True)
+        self.original_overflow = detect_frame_overflow(self.inventory)
+        self._shape_paths = {
+            slide_key: {
+                shape_key: _element_path(shape_data.shape._element)  # type: ignore
+                for shape_key, shape_data in shapes_dict.items()
+            }
+            for slide_key, shapes_dict in self.inventory.items()
+        }
+
+        # Forks locate shapes by path, so the template's own shapes (and with
+        # them its presentation) need not stay in memory
+        for shapes_dict in self.inventory.values():
+            for shape_data in shapes_dict.values():
+                shape_data.shape = None
+
+    def fork(self) -> Tuple[Any, Dict[str, Dict[str, Any]]]:
+        """Create an independent copy of the template.
+
+        Returns:
+            Tuple of (presentation, slide_key -> shape_key -> shape in it)
+        """
+        prs = Presentation(io.BytesIO(self._data))
+        shapes = {}
+        for slide_key, shape_paths in self._shape_paths.items():
+            slide = prs.slides[int(slide_key.split("-")[1])]
+            shapes[slide_key] = {
+                shape_key: SlideShapeFactory(
+                    _resolve_element_path(slide._element, path), slide.shapes
+                )
+                for shape_key, path in shape_paths.items()
+            }
+        return prs, shapes
+
+    def render(
+        self,
+        replacements: Dict,
+        output_file: Path,
+        log: Callable[[str], None] = print,
+    ) -> Dict[str, int]:
+        """Apply a replacement set to a fork and save it to output_file.
+
+        The directory of output_file is created only once the replacements
+        have been applied, so a failed render leaves nothing behind.
+        """
+        prs, shapes = self.fork()
+        stats = replace_text(
+            prs, self.inventory, self.original_overflow, replacements, shapes, log
+        )
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        prs.save(str(output_file))
+        return stats
+
+
+def resolve_batch_output(output_dir: Path, name: Any) -> Path:
+    """Join a batch line's "output" file name onto output_dir.
+
+    Raises:
+        ValueError: If the name is not a relative path inside output_dir
+    """
+    if not isinstance(name, str) or not name:
+        raise ValueError('"output" must be a non-empty file name')
+    output_file = output_dir / name
+    resolved_dir = output_dir.resolve()
+    resolved_file = output_file.resolve()
+    if (
+        Path(name).is_absolute()
+        or resolved_file == resolved_dir
+        or not resolved_file.is_relative_to(resolved_dir)
+    ):
+        raise ValueError(f'"output" must stay inside the output directory: {name}')
+    return output_file
+
+
+class BatchOutputs:
+    """Output files claimed by the lines of a batch.
+
+    Every line must write a file of its own, and none may write the results
+    file, or one write would silently replace the other.
+    """
+
+    def __init__(self, output_dir: Path, results_path: Path):
+        self.output_dir = output_dir
+        self._claimed: Dict[Path, str] = {results_path.resolve(): "the results file"}
+
+    def claim(self, name: Any, line_number: int) -> Path:
+        """Resolve a line's "output" (see resolve_batch_output) and reserve it.
+
+        Raises:
+            ValueError: If the name is outside output_dir or already claimed
+        """
+        output_file = resolve_batch_output(self.output_dir, name)
+        owner = self._claimed.get(output_file.resolve())
+        if owner:
+            raise ValueError(f'"output" is already used by {owner}: {name}')
+        self._claimed[output_file.resolve()] = f"line {line_number}"
+        return output_file
+
+
+# A parsed batch line: (line number, replacements, output file)
+BatchItem = Tuple[int, Dict[str, Any], Path]
+
+
+def parse_batch_item(
+    pptx_file: str, task: Tuple[int, str], outputs: BatchOutputs
+) -> BatchItem:
+    """Parse one line of a batch file and claim its output file.
+
+    Each line is a JSON object with a "replacements" object (the same data as
+    a replacements JSON file) and an optional "output" file name, resolved
+    relative to the output directory (default: <template name>-<line
+    number>.pptx). An output name outside the output directory, or one that
+    another line or the results file already uses, makes the line fail.
+
+    Raises:
+        ValueError: If the line is invalid or its output cannot be used
+    """
+    line_number, line = task
+    item = json.loads(line, object_pairs_hook=check_duplicate_keys)
+    if not isinstance(item, dict) or not isinstance(item.get("replacements"), dict):
+        raise ValueError('Expected an object with a "replacements" object')
+
+    default_name = f"{Path(pptx_file).stem}-{line_number}.pptx"
+    output_file = outputs.claim(item.get("output", default_name), line_number)
+    return line_number, item["replacements"], output_file
+
+
+def parse_batch_items(
+    pptx_file: str, jsonl_file: Path, outputs: BatchOutputs
+) -> Iterator[Any]:
+    """Parse every line of a batch file, in order.
+
+    Yields a BatchItem per valid line and an error record (see
+    render_batch_item) per invalid one.
+    """
+    for task in read_batch_lines(jsonl_file):
+        try:
+            yield parse_batch_item(pptx_file, task, outputs)
+        except Exception as e:
+            yield {"line": task[0], "status": "error", "error": str(e)}
+
+
+def render_batch_item(template: ReplacementTemplate, item: Any) -> Dict[str, Any]:
+    """Render one parsed batch line, returning its success or error record.
+
+    Error records from parse_batch_items are passed through unchanged.
+    """
+    if isinstance(item, dict):
+        return item
+
+    line_number, replacements, output_file = item
+    record: Dict[str, Any] = {"line": line_number, "output": str(output_file)}
+    messages: List[str] = []
+    try:
+        stats = template.render(replacements, output_file, messages.append)
+        record["status"] = "ok"
+        record.update(stats)
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = str(e)
+        if messages:
+            record["messages"] = [m.strip() for m in messages if m.strip()]
+    return record
+
+
+def read_batch_lines(jsonl_file: Path) -> Iterator[Tuple[int, str]]:
+    """Yield (line number, line) for each non-blank line of a JSONL file."""
+    with open(jsonl_file, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if line.strip():
+                yield line_number, line
+
+
+# Template loaded once per worker process by _init_batch_worker
+_worker_template: Optional[ReplacementTemplate] = None
+
+
+def _init_batch_worker(pptx_file: str) -> None:
+    """Load and inventory the template once in each worker process."""
+    global _worker_template
+    _worker_template = ReplacementTemplate(pptx_file)
+
+
+def _batch_item_worker(item: Any) -> Dict[str, Any]:
+    """Render one parsed batch line in a worker process."""
+    return render_batch_item(_worker_template, item)  # type: ignore
+
+
+def apply_replacements_batch(
+    pptx_file: str,
+    jsonl_file: str,
+    output_dir: str,
+    results_file: Optional[str] = None,
+    workers: Optional[int] = 1,
+) -> Dict[str, int]:
+    """Render one output presentation per line of a replacements JSONL file.
+
+    The template is loaded and inventoried once (once per worker process with
+    more than one worker) and forked in memory for every line. A record per
+    line is written to results_file as JSON Lines, in input order, with
+    "status" "ok" and the shape counts, or "error" with the error message and
+    any validation or overflow details. A failing line does not stop the batch.
+
+    Args:
+        pptx_file: Template presentation
+        jsonl_file: One replacement set per line (see parse_batch_item)
+        output_dir: Directory output presentations are written to
+        results_file: JSON Lines file for per-line records
+            (default: results.jsonl in output_dir)
+        workers: Number of worker processes (None or 0: one per CPU core)
+
+    Returns:
+        Counts of "ok" and "error" records
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    results_path = Path(results_file) if results_file else output_path / "results.jsonl"
+    workers = workers or os.cpu_count() or 1
+
+    # Lines are parsed, and their outputs claimed, in this process and in
+    # order, so clashing outputs are caught whatever the number of workers
+    items = parse_batch_items(
+        str(pptx_file), Path(jsonl_file), BatchOutputs(output_path, results_path)
+    )
+
+    counts = {"ok": 0, "error": 0}
+    with open(results_path, "w", encoding="utf-8") as results:
+        if workers <= 1:
+            template = ReplacementTemplate(pptx_file)
+            for record in (render_batch_item(template, item) for item in items):
+                counts[record["status"]] += 1
+                results.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_batch_worker,
+                initargs=(str(pptx_file),),
+            ) as executor:
+                for record in executor.map(_batch_item_worker, items):
+                    counts[record["status"]] += 1
+                    results.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    print(f"Rendered {counts['ok']} presentation(s) to: {output_path}")
+    if counts["error"]:
+        print(f"  - Failed: {counts['error']} (see {results_path})")
+    print(f"Results saved to: {results_path}")
+    return counts
 
 
 def main():
     """Main entry point for command-line usage."""
-    if len(sys.argv) != 4:
-        print(__doc__)
-        sys.exit(1)
-
-    input_pptx = Path(sys.argv[1])
-    replacements_json = Path(sys.argv[2])
-    output_pptx = Path(sys.argv[3])
+    parser = argparse.ArgumentParser(
+        description="Apply text replacements to a PowerPoint presentation.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python replace.py input.pptx replacements.json output.pptx
+    Applies one set of replacements
+
+  python inventory.py input.pptx - --format ndjson | edit.py | python replace.py input.pptx - output.pptx
+    Reads replacements as NDJSON records from stdin
+
+  python replace.py --batch template.pptx replacements.jsonl outputs/ --workers 0
+    Renders one presentation per JSONL line ({"output": "name.pptx",
+    "replacements": {...}}), one worker process per CPU core, and writes
+    per-line records to outputs/results.jsonl
+        """,
+    )
+    parser.add_argument("input", help="Input PowerPoint file (.pptx)")
+    parser.add_argument(
+        "replacements",
+        help="Replacements JSON or NDJSON file, '-' for stdin (JSONL file with --batch)",
+    )
+    parser.add_argument(
+        "output", help="Output PowerPoint file (output directory with --batch)"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Render one output per line of a replacements JSONL file",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for --batch (default: 1; 0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--results",
+        metavar="PATH",
+        help="Per-line JSONL records for --batch (default: <output>/results.jsonl)",
+    )
+    args = parser.parse_args()
+
+    input_pptx = Path(args.input)
+    replacements_json = Path(args.replacements)
+    output_pptx = Path(args.output)
 
     if not input_pptx.exists():
         print(f"Error: Input file '{input_pptx}' not found")
         sys.exit(1)
 
-    if not replacements_json.exists():
+    if (args.batch or args.replacements != "-") and not replacements_json.exists():
         print(f"Error: Replacements JSON file '{replacements_json}' not found")
         sys.exit(1)
 
     try:
-        apply_replacements(str(input_pptx), str(replacements_json), str(output_pptx))
+        if args.batch:
+            counts = apply_replacements_batch(
+                str(input_pptx),
+                str(replacements_json),
+                str(output_pptx),
+                args.results,
+                args.workers,
+            )
+            if counts["error"]:
+                sys.exit(1)
+        else:
+            apply_replacements(
+                str(input_pptx), str(replacements_json), str(output_pptx)
+            )
     except Exception as e:
         print(f"Error applying replacements: {e}")
         import traceback
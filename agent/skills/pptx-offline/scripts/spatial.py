@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Spatial index for axis-aligned rectangles on a slide.
+
+Rectangles are (left, top, width, height) tuples in any consistent unit
+(inventory.py uses inches). The index sorts rectangles by left edge once and
+answers queries with a sweep line, so finding overlapping pairs costs
+O(n log n + k) for k horizontally overlapping pairs instead of comparing all
+n² pairs.
+
+Classes:
+    SpatialIndex: Static index of rectangles for overlap and region queries
+"""
+
+from bisect import bisect_left
+from typing import List, Sequence, Tuple
+
+Rect = Tuple[float, float, float, float]  # (left, top, width, height)
+
+
+class SpatialIndex:
+    """Static index of rectangles for overlap and region queries.
+
+    Attributes:
+        rects: The indexed rectangles, addressed by their position in this list
+    """
+
+    def __init__(self, rects: Sequence[Rect]):
+        self.rects: List[Rect] = [tuple(rect) for rect in rects]  # type: ignore
+        # Indexes ordered by left edge (ties by index) for sweeping
+        self._by_left = sorted(
+            range(len(self.rects)), key=lambda i: (self.rects[i][0], i)
+        )
+        self._lefts = [self.rects[i][0] for i in self._by_left]
+        self._max_width = max((rect[2] for rect in self.rects), default=0)
+
+    def _right(self, i: int) -> float:
+        left, _, width, _ = self.rects[i]
+        return left + width
+
+    def candidate_pairs(self, tolerance: float = 0.0) -> List[Tuple[int, int]]:
+        """Find pairs whose horizontal extents overlap by more than tolerance.
+
+        This is a superset of the pairs that overlap in both dimensions;
+        callers apply their exact overlap test to each candidate. Pairs are
+        pruned only when no overlap test of the form
+        min(right1, right2) - max(left1, left2) > tolerance could pass.
+
+        Args:
+            tolerance: Minimum horizontal overlap to consider
+
+        Returns:
+            Sorted list of (i, j) index pairs with i < j
+        """
+        pairs = []
+        active: List[int] = []
+        for b in self._by_left:
+            left_b = self.rects[b][0]
+            # Rectangles ending before this left edge (+ tolerance) cannot
+            # overlap this or any later rectangle
+            active = [a for a in active if self._right(a) - left_b > tolerance]
+            for a in active:
+                pairs.append((a, b) if a < b else (b, a))
+            active.append(b)
+
+        pairs.sort()
+        return pairs
+
+    def query(self, left: float, top: float, width: float, height: float) -> List[int]:
+        """Find rectangles that intersect a region with positive area.
+
+        Returns:
+            Sorted list of indexes of intersecting rectangles
+        """
+        right = left + width
+        bottom = top + height
+
+        # Only rectangles starting within max_width before the region's left
+        # edge can reach into it
+        start = bisect_left(self._lefts, left - self._max_width)
+        end = bisect_left(self._lefts, right)
+
+        found = []
+        for i in self._by_left[start:end]:
+            rect_left, rect_top, rect_width, rect_height = self.rects[i]
+            if (
+                rect_left + rect_width > left
+                and rect_top < bottom
+                and rect_top + rect_height > top
+            ):
+                found.append(i)
+
+        found.sort()
+        return found
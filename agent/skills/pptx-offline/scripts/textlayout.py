@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Text measurement and line wrapping for overflow estimation.
+
+This module provides a memoized layout engine shared by inventory.py and
+replace.py. Word advances are measured once per font and cached, lines are
+wrapped greedily in a single pass over running (prefix-sum) word widths, and
+line counts are memoized by (font, size, width, text), so re-measuring the
+same text across paragraphs, shapes and inventory runs is a dictionary lookup.
+
+Wrapping follows PowerPoint-style greedy word wrapping on spaces: a word that
+does not fit on the current line starts a new line, and a single word wider
+than the line occupies a line of its own.
+
+Classes:
+    TextLayout: Word-advance cache and greedy wrapper for one font
+
+Main Functions:
+    get_layout: Return the shared TextLayout for a font file and size
+    count_wrapped_lines: Number of lines a text line wraps to (memoized)
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional
+
+from fonts import load_font
+
+
+class TextLayout:
+    """Word-advance cache and greedy line wrapper for one font.
+
+    Attributes:
+        font: PIL font used for measurement
+        space_width: Advance of a single space in pixels
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self._advances: Dict[str, float] = {}
+        self.space_width = self.advance(" ")
+
+    def advance(self, text: str) -> float:
+        """Get the advance width of a word in pixels, measuring it only once."""
+        width = self._advances.get(text)
+        if width is None:
+            width = self.font.getlength(text) if text else 0.0
+            self._advances[text] = width
+        return width
+
+    def count_lines(self, line: str, max_width_px: float) -> int:
+        """Count the lines a single line of text wraps to, without building them."""
+        if not line:
+            return 1
+
+        words = line.split(" ")
+        widths = [self.advance(word) for word in words]
+        space = self.space_width
+        if sum(widths) + (len(words) - 1) * space <= max_width_px:
+            return 1
+
+        count = 0
+        current_empty = True
+        current_width = 0.0
+        for word, width in zip(words, widths):
+            test_width = width if current_empty else current_width + space + width
+            if test_width <= max_width_px:
+                current_width = test_width
+                current_empty = current_empty and not word
+            else:
+                if not current_empty:
+                    count += 1
+                current_width = width
+                current_empty = not word
+
+        if not current_empty:
+            count += 1
+        return count
+
+
+@lru_cache(maxsize=256)
+def get_layout(font_path: Optional[str], size: int) -> TextLayout:
+    """Return the shared TextLayout (and its advance cache) for a font and size."""
+    return TextLayout(load_font(font_path, size))
+
+
+@lru_cache(maxsize=16384)
+def count_wrapped_lines(
+    font_path: Optional[str], size: int, max_width_px: float, text: str
+) -> int:
+    """Count the lines a single line of text wraps to at the given width.
+
+    Args:
+        font_path: Font file path, or None for PIL's default font
+        size: Font size in pixels (as passed to ImageFont.truetype)
+        max_width_px: Usable line width in pixels
+        text: One line of text (no newlines)
+
+    Returns:
+        Number of wrapped lines
+    """
+    return get_layout(font_path, size).count_lines(text, max_width_px)
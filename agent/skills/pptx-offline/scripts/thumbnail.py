@@ -20,6 +20,7 @@ Grid limits by column count:
 
 Usage:
     python thumbnail.py input.pptx [output_prefix] [--cols N] [--outline-placeholders]
+                        [--format jpg|webp|avif] [--tiles DIR] [--tile-format webp|avif|jpg]
 
 Examples:
     python thumbnail.py presentation.pptx
@@ -38,24 +39,42 @@ Examples:
 
     python thumbnail.py template.pptx analysis --outline-placeholders
     # Creates thumbnail grids with red outlines around text placeholders
+
+    python thumbnail.py deck.pptx review/grid --tiles review/tiles
+    # Also writes one WebP tile per slide and review/tiles/manifest.json; run
+    # again after an edit to rebuild only changed tiles and affected grids
 """
 
 import argparse
-import subprocess
+import os
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from inventory import extract_text_inventory
-from PIL import Image, ImageDraw, ImageFont
-from pptx import Presentation
+from inventory import count_slides, get_inventory_as_dict
+from PIL import Image, ImageDraw, ImageFont, features
+from pptx_reader import PresentationReader
+from render import parse_slide_range, render_slides
+from render_cache import RENDER_CACHE_ENV, get_slide_render_keys
+from spatial import SpatialIndex
+from tiles import TileManifest, get_tile_key
 
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
-CONVERSION_DPI = 100  # DPI for PDF to image conversion
+CONVERSION_DPI = 100  # Reference DPI that outline stroke widths are defined at
 MAX_COLS = 6  # Maximum number of columns
 DEFAULT_COLS = 5  # Default number of columns
 JPEG_QUALITY = 95  # JPEG compression quality
+WEBP_QUALITY = 90  # WebP compression quality
+AVIF_QUALITY = 80  # AVIF compression quality
+
+# Output formats by file extension, with their Pillow save options
+IMAGE_FORMATS = {
+    "jpg": {"format": "JPEG", "quality": JPEG_QUALITY},
+    "webp": {"format": "WEBP", "quality": WEBP_QUALITY},
+    "avif": {"format": "AVIF", "quality": AVIF_QUALITY},
+}
 
 # Grid layout constants
 GRID_PADDING = 20  # Padding between thumbnails
@@ -86,6 +105,35 @@ def main():
         action="store_true",
         help="Outline text placeholders with a colored border",
     )
+    parser.add_argument(
+        "--slides",
+        help="Render only these 0-based slides, e.g. 0,3-5 (default: all)",
+    )
+    parser.add_argument(
+        "--render-cache",
+        metavar="DIR",
+        help=f"Cache of rendered slides; only slides changed since they were cached "
+        f"are rendered. Slides showing a slide number are cached per position "
+        f"(default: ${RENDER_CACHE_ENV}, if set)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(IMAGE_FORMATS),
+        default="jpg",
+        help="Image format of the grids (default: jpg)",
+    )
+    parser.add_argument(
+        "--tiles",
+        metavar="DIR",
+        help="Also write one tile per slide and a manifest.json to DIR; on later "
+        "runs only changed tiles and the grids containing them are rebuilt",
+    )
+    parser.add_argument(
+        "--tile-format",
+        choices=sorted(IMAGE_FORMATS),
+        default="webp",
+        help="Image format of the tiles (default: webp)",
+    )
 
     args = parser.parse_args()
 
@@ -100,8 +148,14 @@ def main():
         print(f"Error: Invalid PowerPoint file: {args.input}")
         sys.exit(1)
 
-    # Construct output path (always JPG)
-    output_path = Path(f"{args.output_prefix}.jpg")
+    # Validate image formats
+    for image_format in [args.format] + ([args.tile_format] if args.tiles else []):
+        if not features.check(image_format):
+            print(f"Error: This Pillow build cannot write {image_format} images")
+            sys.exit(1)
+
+    # Construct output path
+    output_path = Path(f"{args.output_prefix}.{args.format}")
 
     print(f"Processing: {args.input}")
 
@@ -118,22 +172,55 @@ def main():
                 if placeholder_regions:
                     print(f"Found placeholders on {len(placeholder_regions)} slides")
 
-            # Convert slides to images
-            slide_images = convert_to_images(input_path, Path(temp_dir), CONVERSION_DPI)
-            if not slide_images:
+            total_slides = count_slides(input_path)
+            slide_indices = (
+                parse_slide_range(args.slides, total_slides)
+                if args.slides
+                else list(range(total_slides))
+            )
+
+            if args.tiles:
+                # Tiles, grids and manifest, rebuilding only what changed
+                grid_files = update_tiles(
+                    input_path,
+                    slide_indices,
+                    cols,
+                    output_path,
+                    Path(args.tiles),
+                    args.tile_format,
+                    placeholder_regions,
+                    slide_dimensions,
+                    cache_dir=args.render_cache,
+                )
+                print(f"Created {len(grid_files)} grid(s):")
+                for grid_file in grid_files:
+                    print(f"  - {grid_file}")
+                return
+
+            # Render the selected slides straight at thumbnail width
+            print(f"Rendering {len(slide_indices)} of {total_slides} slides...")
+            rendered = render_slides(
+                input_path,
+                Path(temp_dir),
+                THUMBNAIL_WIDTH,
+                slide_indices,
+                cache_dir=args.render_cache,
+            )
+            if not rendered:
                 print("Error: No slides found")
                 sys.exit(1)
 
-            print(f"Found {len(slide_images)} slides")
+            print(f"Found {len(rendered)} slides")
 
             # Create grids (max cols×(cols+1) images per grid)
             grid_files = create_grids(
-                slide_images,
+                list(rendered.values()),
                 cols,
                 THUMBNAIL_WIDTH,
                 output_path,
                 placeholder_regions,
                 slide_dimensions,
+                slide_numbers=list(rendered.keys()),
             )
 
             # Print saved files
@@ -146,131 +233,57 @@ def main():
         sys.exit(1)
 
 
-def create_hidden_slide_placeholder(size):
-    """Create placeholder image for hidden slides."""
-    img = Image.new("RGB", size, color="#F0F0F0")
-    draw = ImageDraw.Draw(img)
-    line_width = max(5, min(size) // 100)
-    draw.line([(0, 0), size], fill="#CCCCCC", width=line_width)
-    draw.line([(size[0], 0), (0, size[1])], fill="#CCCCCC", width=line_width)
-    return img
-
-
 def get_placeholder_regions(pptx_path):
     """Extract ALL text regions from the presentation.
 
     Returns a tuple of (placeholder_regions, slide_dimensions).
     text_regions is a dict mapping slide indices to lists of text regions.
     Each region is a dict with 'left', 'top', 'width', 'height' in inches.
+    Regions lying entirely outside the slide are left out, since their
+    outlines would not be visible on the thumbnail.
     slide_dimensions is a tuple of (width_inches, height_inches).
     """
-    prs = Presentation(str(pptx_path))
-    inventory = extract_text_inventory(pptx_path, prs)
+    # Uses the inventory cache when PPTX_INVENTORY_CACHE is set
+    inventory = get_inventory_as_dict(pptx_path)
     placeholder_regions = {}
 
     # Get actual slide dimensions in inches (EMU to inches conversion)
-    slide_width_inches = (prs.slide_width or 9144000) / 914400.0
-    slide_height_inches = (prs.slide_height or 5143500) / 914400.0
+    with PresentationReader(pptx_path) as reader:
+        slide_width, slide_height = reader.slide_size
+    slide_width_inches = slide_width / 914400.0
+    slide_height_inches = slide_height / 914400.0
 
     for slide_key, shapes in inventory.items():
         # Extract slide index from "slide-N" format
         slide_idx = int(slide_key.split("-")[1])
         regions = []
 
-        for shape_key, shape_data in shapes.items():
+        for shape_key, shape_dict in shapes.items():
             # The inventory only contains shapes with text, so all shapes should be highlighted
             regions.append(
                 {
-                    "left": shape_data.left,
-                    "top": shape_data.top,
-                    "width": shape_data.width,
-                    "height": shape_data.height,
+                    "left": shape_dict["left"],
+                    "top": shape_dict["top"],
+                    "width": shape_dict["width"],
+                    "height": shape_dict["height"],
                 }
             )
 
+        # Keep only regions that intersect the visible slide area
+        index = SpatialIndex(
+            [(r["left"], r["top"], r["width"], r["height"]) for r in regions]
+        )
+        regions = [
+            regions[i]
+            for i in index.query(0, 0, slide_width_inches, slide_height_inches)
+        ]
+
         if regions:
             placeholder_regions[slide_idx] = regions
 
     return placeholder_regions, (slide_width_inches, slide_height_inches)
 
 
-def convert_to_images(pptx_path, temp_dir, dpi):
-    """Convert PowerPoint to images via PDF, handling hidden slides."""
-    # Detect hidden slides
-    print("Analyzing presentation...")
-    prs = Presentation(str(pptx_path))
-    total_slides = len(prs.slides)
-
-    # Find hidden slides (1-based indexing for display)
-    hidden_slides = {
-        idx + 1
-        for idx, slide in enumerate(prs.slides)
-        if slide.element.get("show") == "0"
-    }
-
-    print(f"Total slides: {total_slides}")
-    if hidden_slides:
-        print(f"Hidden slides: {sorted(hidden_slides)}")
-
-    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
-
-    # Convert to PDF
-    print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
-        raise RuntimeError("PDF conversion failed")
-
-    # Convert PDF to images
-    print(f"Converting to images at {dpi} DPI...")
-    result = subprocess.run(
-        ["pdftoppm", "-jpeg", "-r", str(dpi), str(pdf_path), str(temp_dir / "slide")],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError("Image conversion failed")
-
-    visible_images = sorted(temp_dir.glob("slide-*.jpg"))
-
-    # Create full list with placeholders for hidden slides
-    all_images = []
-    visible_idx = 0
-
-    # Get placeholder dimensions from first visible slide
-    if visible_images:
-        with Image.open(visible_images[0]) as img:
-            placeholder_size = img.size
-    else:
-        placeholder_size = (1920, 1080)
-
-    for slide_num in range(1, total_slides + 1):
-        if slide_num in hidden_slides:
-            # Create placeholder image for hidden slide
-            placeholder_path = temp_dir / f"hidden-{slide_num:03d}.jpg"
-            placeholder_img = create_hidden_slide_placeholder(placeholder_size)
-            placeholder_img.save(placeholder_path, "JPEG")
-            all_images.append(placeholder_path)
-        else:
-            # Use the actual visible slide image
-            if visible_idx < len(visible_images):
-                all_images.append(visible_images[visible_idx])
-                visible_idx += 1
-
-    return all_images
-
-
 def create_grids(
     image_paths,
     cols,
@@ -278,8 +291,14 @@ def create_grids(
     output_path,
     placeholder_regions=None,
     slide_dimensions=None,
+    slide_numbers=None,
 ):
-    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid."""
+    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid.
+
+    slide_numbers gives the slide index of each image (default: 0, 1, 2, ...).
+    """
+    if slide_numbers is None:
+        slide_numbers = list(range(len(image_paths)))
     # Maximum images per grid is cols × (cols + 1) for better proportions
     max_images_per_grid = cols * (cols + 1)
     grid_files = []
@@ -288,36 +307,250 @@ def create_grids(
         f"Creating grids with {cols} columns (max {max_images_per_grid} images per grid)"
     )
 
-    # Split images into chunks
-    for chunk_idx, start_idx in enumerate(
-        range(0, len(image_paths), max_images_per_grid)
-    ):
-        end_idx = min(start_idx + max_images_per_grid, len(image_paths))
-        chunk_images = image_paths[start_idx:end_idx]
+    # One thread pool produces the tiles of every grid
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        # Split images into chunks
+        for chunk_idx, start_idx in enumerate(
+            range(0, len(image_paths), max_images_per_grid)
+        ):
+            end_idx = min(start_idx + max_images_per_grid, len(image_paths))
+            chunk_images = image_paths[start_idx:end_idx]
+
+            # Create grid for this chunk
+            grid = create_grid(
+                chunk_images,
+                cols,
+                width,
+                start_idx,
+                placeholder_regions,
+                slide_dimensions,
+                slide_numbers[start_idx:end_idx],
+                executor,
+            )
+
+            # Save grid
+            grid_filename = get_grid_filename(
+                output_path, chunk_idx, len(image_paths) > max_images_per_grid
+            )
+            save_image(grid, grid_filename)
+            grid_files.append(str(grid_filename))
+
+    return grid_files
 
-        # Create grid for this chunk
-        grid = create_grid(
-            chunk_images, cols, width, start_idx, placeholder_regions, slide_dimensions
-        )
 
-        # Generate output filename
-        if len(image_paths) <= max_images_per_grid:
-            # Single grid - use base filename without suffix
-            grid_filename = output_path
-        else:
-            # Multiple grids - insert index before extension with dash
-            stem = output_path.stem
-            suffix = output_path.suffix
-            grid_filename = output_path.parent / f"{stem}-{chunk_idx + 1}{suffix}"
-
-        # Save grid
-        grid_filename.parent.mkdir(parents=True, exist_ok=True)
-        grid.save(str(grid_filename), quality=JPEG_QUALITY)
-        grid_files.append(str(grid_filename))
+def update_tiles(
+    pptx_path,
+    slide_indices,
+    cols,
+    output_path,
+    tiles_dir,
+    tile_format,
+    placeholder_regions=None,
+    slide_dimensions=None,
+    cache_dir=None,
+):
+    """Write per-slide tiles, grids composited from them, and a tile manifest.
+
+    Tiles already in tiles_dir under the same key are reused, so only slides
+    that changed since the last run are rendered, and only grids containing a
+    changed tile are composited again. Tiles no longer used are deleted.
+
+    Returns the list of grid files.
+    """
+    if not slide_indices:
+        raise ValueError("No slides found")
+
+    width = THUMBNAIL_WIDTH
+    previous = TileManifest.load(tiles_dir)
+    manifest = TileManifest(tiles_dir)
+
+    # Name each slide's tile after its content
+    render_keys = get_slide_render_keys(pptx_path, width)
+    tile_names = {}
+    for slide_num in slide_indices:
+        regions = (placeholder_regions or {}).get(slide_num)
+        tile_key = get_tile_key(render_keys[slide_num], regions, tile_format)
+        tile_names[slide_num] = f"{tile_key}.{tile_format}"
+
+    # Render only slides whose tile does not exist yet, once per distinct tile
+    to_render = {}  # tile name -> slide number
+    for slide_num in slide_indices:
+        tile_name = tile_names[slide_num]
+        if tile_name not in to_render and not (tiles_dir / tile_name).exists():
+            to_render[tile_name] = slide_num
+    reused = len(set(tile_names.values())) - len(to_render)
+    print(f"Tiles: {len(to_render)} to render, {reused} unchanged")
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        if to_render:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                rendered = render_slides(
+                    pptx_path,
+                    Path(temp_dir),
+                    width,
+                    sorted(to_render.values()),
+                    cache_dir=cache_dir,
+                )
+                with Image.open(next(iter(rendered.values()))) as img:
+                    height = int(width * (img.height / img.width))
+
+                def write_tile(item):
+                    tile_name, slide_num = item
+                    tile = create_tile(
+                        rendered[slide_num],
+                        width,
+                        height,
+                        (placeholder_regions or {}).get(slide_num),
+                        slide_dimensions,
+                    )
+                    save_image(tile, tiles_dir / tile_name)
+
+                list(executor.map(write_tile, to_render.items()))
+
+        # Composite grids from the tiles, skipping grids that did not change
+        max_images_per_grid = cols * (cols + 1)
+        chunks = [
+            slide_indices[start_idx : start_idx + max_images_per_grid]
+            for start_idx in range(0, len(slide_indices), max_images_per_grid)
+        ]
+        previous_grids = {grid["file"]: grid for grid in previous.grids}
+        grid_files, grids, slides = [], [], []
+        recomposed = 0
+        for chunk_idx, chunk in enumerate(chunks):
+            grid_filename = get_grid_filename(output_path, chunk_idx, len(chunks) > 1)
+            tile_paths = [tiles_dir / tile_names[slide_num] for slide_num in chunk]
+            grid_entry = {
+                "file": manifest.relative_path(grid_filename),
+                "cols": cols,
+                "slides": chunk,
+                "tiles": [tile_names[slide_num] for slide_num in chunk],
+            }
+
+            previous_grid = previous_grids.get(grid_entry["file"], {})
+            if not grid_filename.exists() or any(
+                previous_grid.get(key) != value for key, value in grid_entry.items()
+            ):
+                grid = create_grid(
+                    tile_paths, cols, width, slide_numbers=chunk, executor=executor
+                )
+                save_image(grid, grid_filename)
+                recomposed += 1
+
+            with Image.open(grid_filename) as img:
+                grid_entry["width"], grid_entry["height"] = img.size
+            grids.append(grid_entry)
+            grid_files.append(str(grid_filename))
+
+            # Record where each tile sits in the grid, laid out as create_grid does
+            tile_sizes = []
+            for tile_path in tile_paths:
+                with Image.open(tile_path) as img:
+                    tile_sizes.append(img.size)
+            height = int(width * (tile_sizes[0][1] / tile_sizes[0][0]))
+            for i, (slide_num, tile_size) in enumerate(zip(chunk, tile_sizes)):
+                x, y, w, h = get_tile_box(i, cols, width, height, tile_size)
+                slides.append(
+                    {
+                        "slide": slide_num,
+                        "tile": tile_names[slide_num],
+                        "width": w,
+                        "height": h,
+                        "grid": grid_entry["file"],
+                        "x": x,
+                        "y": y,
+                    }
+                )
+
+    print(f"Grids: {recomposed} composited, {len(chunks) - recomposed} unchanged")
+
+    manifest.data.update(
+        source=Path(pptx_path).name,
+        tile_format=tile_format,
+        tile_width=width,
+        grids=grids,
+        slides=slides,
+    )
+    manifest.save()
+    manifest.prune(previous)
+    print(f"Tile manifest: {manifest.path}")
 
     return grid_files
 
 
+def get_grid_filename(output_path, chunk_idx, multiple):
+    """Get the file name of a grid: output_path itself, or numbered if there are several."""
+    if not multiple:
+        # Single grid - use base filename without suffix
+        return output_path
+    # Multiple grids - insert index before extension with dash
+    stem = output_path.stem
+    suffix = output_path.suffix
+    return output_path.parent / f"{stem}-{chunk_idx + 1}{suffix}"
+
+
+def save_image(img, path):
+    """Save an image in the IMAGE_FORMATS format matching its extension, atomically."""
+    path = Path(path)
+    options = IMAGE_FORMATS.get(path.suffix.lower().lstrip("."), IMAGE_FORMATS["jpg"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    img.save(str(tmp_path), **options)
+    os.replace(tmp_path, path)
+
+
+def create_tile(img_path, width, height, regions=None, slide_dimensions=None):
+    """Create one thumbnail tile, with placeholder regions outlined.
+
+    JPEGs are decoded in draft mode at the smallest scale that still covers
+    the tile size, and outlines are drawn directly at tile scale, so no
+    full-resolution image or overlay is ever held in memory. Regions are in
+    inches, so slide_dimensions (width, height in inches) is required with them.
+    """
+    if regions and not slide_dimensions:
+        raise ValueError("slide_dimensions is required to outline regions")
+
+    with Image.open(img_path) as img:
+        img.draft("RGB", (width, height))
+        img = img.convert("RGB")
+    img.thumbnail((width, height), Image.Resampling.LANCZOS)
+
+    # Apply placeholder outlines if enabled
+    if regions:
+        # Calculate scale factors using actual slide dimensions
+        slide_width_inches, slide_height_inches = slide_dimensions
+        x_scale = img.width / slide_width_inches
+        y_scale = img.height / slide_height_inches
+
+        # Stroke is sized for a CONVERSION_DPI render and scaled to the tile
+        reference_w = slide_width_inches * CONVERSION_DPI
+        reference_h = slide_height_inches * CONVERSION_DPI
+        stroke_width = max(
+            1,
+            round(
+                max(5, int(min(reference_w, reference_h)) // 150)
+                * img.width
+                / reference_w
+            ),
+        )
+
+        draw = ImageDraw.Draw(img)
+        for region in regions:
+            # Convert from inches to pixels in the tile
+            px_left = int(region["left"] * x_scale)
+            px_top = int(region["top"] * y_scale)
+            px_width = int(region["width"] * x_scale)
+            px_height = int(region["height"] * y_scale)
+
+            # Draw highlight outline with a bright red stroke instead of fill
+            draw.rectangle(
+                [(px_left, px_top), (px_left + px_width, px_top + px_height)],
+                outline=(255, 0, 0),
+                width=stroke_width,
+            )
+
+    return img
+
+
 def create_grid(
     image_paths,
     cols,
@@ -325,8 +558,17 @@ def create_grid(
     start_slide_num=0,
     placeholder_regions=None,
     slide_dimensions=None,
+    slide_numbers=None,
+    executor=None,
 ):
-    """Create thumbnail grid from slide images with optional placeholder outlining."""
+    """Create thumbnail grid from slide images with optional placeholder outlining.
+
+    Images are labeled with slide_numbers, or start_slide_num, start_slide_num + 1, ...
+    Tiles are produced in a thread pool (executor, or a new one) and pasted as
+    they complete, in order.
+    """
+    if slide_numbers is None:
+        slide_numbers = range(start_slide_num, start_slide_num + len(image_paths))
     font_size = int(width * FONT_SIZE_RATIO)
     label_padding = int(font_size * LABEL_PADDING_RATIO)
 
@@ -352,85 +594,35 @@ def create_grid(
         # Fall back to basic default font if size parameter not supported
         font = ImageFont.load_default()
 
-    # Place thumbnails
-    for i, img_path in enumerate(image_paths):
-        row, col = i // cols, i % cols
-        x = col * width + (col + 1) * GRID_PADDING
-        y_base = (
-            row * (height + font_size + label_padding * 2) + (row + 1) * GRID_PADDING
-        )
+    def make_tile(task):
+        img_path, slide_num = task
+        regions = (placeholder_regions or {}).get(slide_num)
+        return create_tile(img_path, width, height, regions, slide_dimensions)
 
-        # Add label with actual slide number
-        label = f"{start_slide_num + i}"
-        bbox = draw.textbbox((0, 0), label, font=font)
-        text_w = bbox[2] - bbox[0]
-        draw.text(
-            (x + (width - text_w) // 2, y_base + label_padding),
-            label,
-            fill="black",
-            font=font,
-        )
-
-        # Add thumbnail below label with proportional spacing
-        y_thumbnail = y_base + label_padding + font_size + label_padding
-
-        with Image.open(img_path) as img:
-            # Get original dimensions before thumbnail
-            orig_w, orig_h = img.size
-
-            # Apply placeholder outlines if enabled
-            if placeholder_regions and (start_slide_num + i) in placeholder_regions:
-                # Convert to RGBA for transparency support
-                if img.mode != "RGBA":
-                    img = img.convert("RGBA")
-
-                # Get the regions for this slide
-                regions = placeholder_regions[start_slide_num + i]
-
-                # Calculate scale factors using actual slide dimensions
-                if slide_dimensions:
-                    slide_width_inches, slide_height_inches = slide_dimensions
-                else:
-                    # Fallback: estimate from image size at CONVERSION_DPI
-                    slide_width_inches = orig_w / CONVERSION_DPI
-                    slide_height_inches = orig_h / CONVERSION_DPI
-
-                x_scale = orig_w / slide_width_inches
-                y_scale = orig_h / slide_height_inches
-
-                # Create a highlight overlay
-                overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
-                overlay_draw = ImageDraw.Draw(overlay)
-
-                # Highlight each placeholder region
-                for region in regions:
-                    # Convert from inches to pixels in the original image
-                    px_left = int(region["left"] * x_scale)
-                    px_top = int(region["top"] * y_scale)
-                    px_width = int(region["width"] * x_scale)
-                    px_height = int(region["height"] * y_scale)
-
-                    # Draw highlight outline with red color and thick stroke
-                    # Using a bright red outline instead of fill
-                    stroke_width = max(
-                        5, min(orig_w, orig_h) // 150
-                    )  # Thicker proportional stroke width
-                    overlay_draw.rectangle(
-                        [(px_left, px_top), (px_left + px_width, px_top + px_height)],
-                        outline=(255, 0, 0, 255),  # Bright red, fully opaque
-                        width=stroke_width,
-                    )
-
-                # Composite the overlay onto the image using alpha blending
-                img = Image.alpha_composite(img, overlay)
-                # Convert back to RGB for JPEG saving
-                img = img.convert("RGB")
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    try:
+        tiles = executor.map(make_tile, zip(image_paths, slide_numbers))
+
+        # Place thumbnails
+        for i, (slide_num, tile) in enumerate(zip(slide_numbers, tiles)):
+            x, y_base = get_cell_origin(i, cols, width, height)
+
+            # Add label with actual slide number
+            label = f"{slide_num}"
+            bbox = draw.textbbox((0, 0), label, font=font)
+            text_w = bbox[2] - bbox[0]
+            draw.text(
+                (x + (width - text_w) // 2, y_base + label_padding),
+                label,
+                fill="black",
+                font=font,
+            )
 
-            img.thumbnail((width, height), Image.Resampling.LANCZOS)
-            w, h = img.size
-            tx = x + (width - w) // 2
-            ty = y_thumbnail + (height - h) // 2
-            grid.paste(img, (tx, ty))
+            # Add thumbnail below label with proportional spacing
+            tx, ty, w, h = get_tile_box(i, cols, width, height, tile.size)
+            grid.paste(tile, (tx, ty))
 
             # Add border
             if BORDER_WIDTH > 0:
@@ -442,9 +634,35 @@ def create_grid(
                     outline="gray",
                     width=BORDER_WIDTH,
                 )
+    finally:
+        if own_executor:
+            executor.shutdown()
 
     return grid
 
 
+def get_cell_origin(index, cols, width, height):
+    """Get the top-left corner of a thumbnail's cell (label and tile) in a grid."""
+    font_size = int(width * FONT_SIZE_RATIO)
+    label_padding = int(font_size * LABEL_PADDING_RATIO)
+    row, col = index // cols, index % cols
+    x = col * width + (col + 1) * GRID_PADDING
+    y = row * (height + font_size + label_padding * 2) + (row + 1) * GRID_PADDING
+    return x, y
+
+
+def get_tile_box(index, cols, width, height, tile_size):
+    """Get the (x, y, width, height) box a tile is pasted at in a grid.
+
+    Tiles are centered in a width×height area below their label.
+    """
+    font_size = int(width * FONT_SIZE_RATIO)
+    label_padding = int(font_size * LABEL_PADDING_RATIO)
+    x, y_base = get_cell_origin(index, cols, width, height)
+    y_thumbnail = y_base + label_padding + font_size + label_padding
+    w, h = tile_size
+    return x + (width - w) // 2, y_thumbnail + (height - h) // 2, w, h
+
+
 if __name__ == "__main__":
     main()
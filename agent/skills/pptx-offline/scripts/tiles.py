@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Per-slide thumbnail tiles and their JSON manifest.
+
+With --tiles DIR, thumbnail.py writes one image per slide into DIR alongside
+the grids, plus a manifest.json recording each slide's tile file, its size,
+and where it is placed within its grid, so a viewer can lazy-load individual
+tiles or crop them out of a grid.
+
+Tiles are named after a key covering the slide's render key (see
+render_cache.py), its outlined placeholder regions and the tile format. After
+an edit, only tiles of changed slides are rendered again, and only grids that
+contain a changed tile are composited again; everything else is reused.
+
+Manifest format:
+{
+  "version": 1,
+  "source": "deck.pptx",
+  "tile_format": "webp",
+  "tile_width": 300,
+  "grids": [
+    {"file": "../thumbnails-1.jpg", "cols": 5, "width": 1620, "height": 1530,
+     "slides": [0, 1, ...], "tiles": ["<key>.webp", ...]}
+  ],
+  "slides": [
+    {"slide": 0, "tile": "<key>.webp", "width": 300, "height": 168,
+     "grid": "../thumbnails-1.jpg", "x": 20, "y": 82}
+  ]
+}
+
+Paths are relative to the manifest's directory.
+
+Classes:
+    TileManifest: Manifest of the tiles and grids written to a tile directory
+
+Main Functions:
+    get_tile_key: Compute the key a slide's tile is named after
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Manifest file written into the tile directory
+MANIFEST_NAME = "manifest.json"
+
+# Bump whenever tiles change for the same slide content
+MANIFEST_VERSION = 1
+
+
+class TileManifest:
+    """Manifest of the tiles and grids written to a tile directory.
+
+    Attributes:
+        tiles_dir: Directory holding the tiles and the manifest
+        data: The manifest, as described in the module docstring
+    """
+
+    def __init__(self, tiles_dir: Path, data: Optional[Dict[str, Any]] = None):
+        self.tiles_dir = Path(tiles_dir)
+        self.data: Dict[str, Any] = data or {
+            "version": MANIFEST_VERSION,
+            "grids": [],
+            "slides": [],
+        }
+
+    @property
+    def path(self) -> Path:
+        return self.tiles_dir / MANIFEST_NAME
+
+    @property
+    def grids(self) -> List[Dict[str, Any]]:
+        return self.data.get("grids", [])
+
+    @property
+    def tile_names(self) -> set:
+        return {slide["tile"] for slide in self.data.get("slides", [])}
+
+    @classmethod
+    def load(cls, tiles_dir: Path) -> "TileManifest":
+        """Load a manifest; a missing, corrupt or outdated one yields an empty manifest."""
+        manifest = cls(tiles_dir)
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return manifest
+        if isinstance(data, dict) and data.get("version") == MANIFEST_VERSION:
+            manifest.data = data
+        return manifest
+
+    def relative_path(self, path: Path) -> str:
+        """Express a path relative to the manifest's directory, as stored in it."""
+        return Path(os.path.relpath(path, self.tiles_dir)).as_posix()
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.tiles_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{MANIFEST_NAME}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.data, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def prune(self, previous: "TileManifest") -> None:
+        """Delete tiles listed in a previous manifest that this one no longer uses."""
+        for tile_name in previous.tile_names - self.tile_names:
+            # Only ever delete plain file names inside the tile directory
+            if Path(tile_name).name != tile_name:
+                continue
+            try:
+                (self.tiles_dir / tile_name).unlink()
+            except OSError:
+                pass
+
+
+def get_tile_key(
+    render_key: str, regions: Optional[List[Dict[str, float]]], tile_format: str
+) -> str:
+    """Compute the key a slide's tile is named after.
+
+    Args:
+        render_key: The slide's key from render_cache.get_slide_render_keys
+        regions: Placeholder regions outlined on the tile, if any
+        tile_format: Tile file format (file extension)
+    """
+    key = hashlib.sha1(f"tile-v{MANIFEST_VERSION}-{tile_format}".encode())
+    key.update(render_key.encode())
+    key.update(json.dumps(regions or [], sort_keys=True).encode())
+    return key.hexdigest()[:20]